@@ -0,0 +1,86 @@
+"""
+Run the benchmark suite, store results as JSON and compare against a baseline.
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --compare baseline.json --threshold 0.15
+    python -m benchmarks compare baseline.json current.json
+
+Baselines are machine specific: record and compare them on the same box.
+Exits with status 1 when a compared case regressed beyond the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks import harness
+from benchmarks.cases import build_cases
+
+
+def _report(
+    baseline_path: str,
+    current: dict[str, harness.BenchmarkResult],
+    threshold: float,
+    memory_threshold: Optional[float],
+) -> int:
+    regressions = harness.compare(
+        harness.load(baseline_path), current, threshold, memory_threshold
+    )
+    if not regressions:
+        print(f"No regressions beyond {threshold:.0%} against {baseline_path}.")
+        return 0
+
+    print(f"{len(regressions)} regression(s) against {baseline_path}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--rows", type=int, default=1_000_000)
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--filter", default="", help="substring of case names to run")
+    run.add_argument("--output", help="write results to this JSON file")
+    run.add_argument("--compare", help="baseline JSON to compare against")
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+
+    for command in (run, compare):
+        command.add_argument("--threshold", type=float, default=0.2)
+        command.add_argument("--memory-threshold", type=float, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _report(
+            args.baseline,
+            harness.load(args.current),
+            args.threshold,
+            args.memory_threshold,
+        )
+
+    results = [
+        harness.measure(case, repeats=args.repeats)
+        for case in build_cases(args.rows)
+        if args.filter in case.name
+    ]
+    print(harness.format_table(results))
+
+    if args.output:
+        harness.save(results, args.output)
+    if args.compare:
+        current = {result.name: result for result in results}
+        return _report(args.compare, current, args.threshold, args.memory_threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
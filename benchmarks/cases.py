@@ -0,0 +1,184 @@
+"""
+Benchmark cases for the hot paths: ingestion, stats, resolution, transform.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from benchmarks import generators
+from benchmarks.harness import BenchmarkCase
+from pills_core._computer_registry import build_computer_registry
+from pills_core._enums import TransformPhase
+from pills_core._infer_types import TypeInferencer
+from pills_core.analyzers import AnalyzerBuilder, AnalyzerConfig, DomainConfig
+from pills_core.config import ComputeConfig
+from pills_core.ingestion.csv import CSVDataSource, CSVOptions
+from pills_core.pipeline.builder import PipelineBuilder
+from pills_core.pipeline.pipeline import Pipeline
+from pills_core.pipeline.profiler import ColumnProfiler
+from pills_core.pipeline.step import Step
+from pills_core.stats_computer import CategoricalStatsComputer, NumericalStatsComputer
+from pills_core.strategies.config import NumericStrategiesConfig
+from pills_core.strategies.numeric._registry import (
+    build_imputation_registry,
+    build_outliers_registry,
+    build_scaling_registry,
+)
+from pills_core.strategies.registry import StrategyRegistry
+from pills_core.types.stats import CategoricalThresholds, NumericalThresholds
+
+
+def default_registries() -> Dict[TransformPhase, StrategyRegistry]:
+    strategies = NumericStrategiesConfig()
+    return {
+        TransformPhase.IMPUTATION: build_imputation_registry(strategies.imputation),
+        TransformPhase.OUTLIER: build_outliers_registry(strategies.outlier),
+        TransformPhase.SCALING: build_scaling_registry(strategies.scaling),
+    }
+
+
+def default_pipeline() -> Pipeline:
+    return Pipeline(
+        profiler=ColumnProfiler(),
+        builder=PipelineBuilder(default_registries()),
+        type_inferencer=TypeInferencer(
+            cardinality_abs=50,
+            cardinality_ratio=0.05,
+            coercion_thresholds=0.9,
+            max_sample_size=1_000,
+        ),
+        computer_registry=build_computer_registry(ComputeConfig()),
+        analyzer_registry=AnalyzerBuilder(
+            AnalyzerConfig(
+                numerical=NumericalThresholds(),
+                categorical=CategoricalThresholds(),
+                domain=DomainConfig(),
+            )
+        ).build_registry(),
+    )
+
+
+def _csv_case(name: str, frame: pd.DataFrame) -> BenchmarkCase:
+    def setup() -> Any:
+        directory = tempfile.TemporaryDirectory()
+        path = os.path.join(directory.name, f"{name}.csv")
+        frame.to_csv(path, index=False)
+        return directory, CSVDataSource(CSVOptions(path=path))
+
+    return BenchmarkCase(
+        name=f"ingestion/{name}",
+        subsystem="ingestion",
+        setup=setup,
+        run=lambda state: state[1].load(),
+        rows=len(frame),
+    )
+
+
+def _stats_case(name: str, series: pd.Series, computer: Any) -> BenchmarkCase:
+    return BenchmarkCase(
+        name=f"stats/{name}",
+        subsystem="stats",
+        setup=lambda: series,
+        run=computer.compute,
+        rows=len(series),
+    )
+
+
+def _block_stats_case(name: str, frame: pd.DataFrame) -> BenchmarkCase:
+    return BenchmarkCase(
+        name=f"stats/{name}",
+        subsystem="stats",
+        setup=lambda: frame,
+        run=NumericalStatsComputer().compute_frame,
+        rows=frame.size,  # values reduced per call
+    )
+
+
+def _resolution_case(frame: pd.DataFrame) -> BenchmarkCase:
+    registries = default_registries()
+
+    def setup() -> Any:
+        pipeline = default_pipeline()
+        return [pipeline.fit(frame[column], False).context for column in frame]
+
+    def run(contexts: Any) -> None:
+        for context in contexts:
+            for registry in registries.values():
+                registry.resolve(context.meta, context.embedding, context.stats)
+
+    return BenchmarkCase(
+        name="resolution/resolve_all_phases",
+        subsystem="resolution",
+        setup=setup,
+        run=run,
+        rows=frame.shape[1],  # columns resolved per call
+    )
+
+
+def _transform_case(name: str, fit_on: pd.Series, apply_to: pd.Series) -> BenchmarkCase:
+    def setup() -> Any:
+        return default_pipeline().fit(fit_on, False).sequence
+
+    return BenchmarkCase(
+        name=f"transform/{name}",
+        subsystem="transform",
+        setup=setup,
+        run=lambda sequence: sequence.apply(apply_to),
+        rows=len(apply_to),
+    )
+
+
+def _winsorize_case(name: str, fit_on: pd.Series, apply_to: pd.Series) -> BenchmarkCase:
+    def setup() -> Any:
+        registry = default_registries()[TransformPhase.OUTLIER]
+        (strategy,) = [s for s in registry.strategies if s.name == "winsorize"]
+        stats = NumericalStatsComputer().compute(fit_on)
+        params = strategy.fit(fit_on, stats)
+        return Step(TransformPhase.OUTLIER, strategy, stats, params)
+
+    return BenchmarkCase(
+        name=f"transform/{name}",
+        subsystem="transform",
+        setup=setup,
+        run=lambda step: step.apply(apply_to),
+        rows=len(apply_to),
+    )
+
+
+def build_cases(rows: int = 1_000_000) -> List[BenchmarkCase]:
+    skewed = generators.skewed(rows)
+    high_missing = generators.high_missing(rows)
+    tall = generators.tall(rows)
+    wide = generators.wide(rows)
+
+    return [
+        _csv_case("csv_tall", tall),
+        _csv_case("csv_wide", wide),
+        _stats_case("numeric_skewed", skewed, NumericalStatsComputer()),
+        _stats_case(
+            "numeric_heavy_tailed",
+            generators.heavy_tailed(rows),
+            NumericalStatsComputer(),
+        ),
+        _stats_case(
+            "numeric_high_missing",
+            high_missing,
+            NumericalStatsComputer(),
+        ),
+        _stats_case(
+            "categorical_high_cardinality",
+            generators.high_cardinality(rows),
+            CategoricalStatsComputer(rare_thresholds=0.01),
+        ),
+        _block_stats_case("numeric_wide_block", wide),
+        _resolution_case(wide),
+        _transform_case("apply_tall", skewed, skewed),
+        _transform_case("apply_single_row", high_missing, high_missing.iloc[:1]),
+        _winsorize_case("winsorize_tall", skewed, skewed),
+        _winsorize_case("winsorize_single_row", skewed, skewed.iloc[:1]),
+    ]
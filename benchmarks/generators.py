@@ -0,0 +1,61 @@
+"""
+Seeded synthetic data for the benchmark suite.
+
+Every generator is deterministic for a given (rows, seed), so timings on the
+same machine are comparable across runs.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 2024
+
+
+def skewed(rows: int, seed: int = DEFAULT_SEED) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.lognormal(mean=0.0, sigma=1.5, size=rows), name="skewed")
+
+
+def heavy_tailed(rows: int, seed: int = DEFAULT_SEED) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.standard_t(df=1.5, size=rows), name="heavy_tailed")
+
+
+def high_missing(
+    rows: int, missing_ratio: float = 0.7, seed: int = DEFAULT_SEED
+) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    values = rng.normal(50.0, 10.0, size=rows)
+    values[rng.random(rows) < missing_ratio] = np.nan
+    return pd.Series(values, name="high_missing")
+
+
+def high_cardinality(
+    rows: int, n_categories: int = 50_000, seed: int = DEFAULT_SEED
+) -> pd.Series:
+    """Zipf-distributed labels: a few frequent categories and a long rare tail."""
+    rng = np.random.default_rng(seed)
+    codes = np.minimum(rng.zipf(1.3, size=rows), n_categories) - 1
+    labels = np.array([f"cat_{i:06d}" for i in range(n_categories)], dtype=object)
+    return pd.Series(labels[codes], name="high_cardinality")
+
+
+def frame(rows: int, columns: int, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    """Numeric frame cycling through the skewed/heavy/missing shapes."""
+    makers = (skewed, heavy_tailed, high_missing)
+    return pd.DataFrame(
+        {
+            f"c{index:03d}": makers[index % len(makers)](rows, seed + index).to_numpy()
+            for index in range(columns)
+        }
+    )
+
+
+def wide(rows: int, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    return frame(max(rows // 100, 1), 200, seed)
+
+
+def tall(rows: int, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    return frame(rows, 2, seed)
@@ -0,0 +1,175 @@
+"""
+Timing, memory measurement and baseline comparison for benchmark cases.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+    name: str
+    subsystem: str  # ingestion | stats | resolution | transform
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    rows: int  # rows processed per call, for throughput
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    subsystem: str
+    rows: int
+    repeats: int
+    median_s: float
+    min_s: float
+    p95_s: float
+    rows_per_s: float
+    peak_bytes: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(**data)
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} {self.baseline:.6g} -> {self.current:.6g} "
+            f"({(self.ratio - 1) * 100:+.1f}%)"
+        )
+
+
+def measure(case: BenchmarkCase, repeats: int = 5, warmup: int = 1) -> BenchmarkResult:
+    """
+    Time `repeats` calls after `warmup` untimed ones, then measure the peak
+    traced allocation of one extra call. Tracing slows allocation down, so it
+    never overlaps with timed calls.
+    """
+    if repeats < 1:
+        raise ValueError(f"repeats must be >= 1, got {repeats}")
+
+    state = case.setup()
+    for _ in range(warmup):
+        case.run(state)
+
+    timings: List[float] = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        case.run(state)
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return BenchmarkResult(
+        name=case.name,
+        subsystem=case.subsystem,
+        rows=case.rows,
+        repeats=repeats,
+        median_s=median,
+        min_s=min(timings),
+        p95_s=float(np.percentile(timings, 95)),
+        rows_per_s=case.rows / median if median > 0 else float("inf"),
+        peak_bytes=peak,
+    )
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+
+def save(results: List[BenchmarkResult], path: str) -> None:
+    payload = {
+        "environment": environment(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict[str, BenchmarkResult]:
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    return {
+        name: BenchmarkResult.from_dict(data)
+        for name, data in payload["results"].items()
+    }
+
+
+def compare(
+    baseline: Dict[str, BenchmarkResult],
+    current: Dict[str, BenchmarkResult],
+    threshold: float = 0.2,
+    memory_threshold: Optional[float] = None,
+) -> List[Regression]:
+    """
+    Cases whose median time (or peak memory) grew by more than `threshold`
+    (`memory_threshold`, defaulting to `threshold`) relative to the baseline.
+    Cases missing from either side are ignored.
+    """
+    memory_threshold = threshold if memory_threshold is None else memory_threshold
+    regressions: List[Regression] = []
+
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name], current[name]
+        if after.median_s > before.median_s * (1 + threshold):
+            regressions.append(
+                Regression(name, "median_s", before.median_s, after.median_s)
+            )
+        if after.peak_bytes > before.peak_bytes * (1 + memory_threshold):
+            regressions.append(
+                Regression(name, "peak_bytes", before.peak_bytes, after.peak_bytes)
+            )
+
+    return regressions
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    header = (
+        f"{'case':<40} {'median ms':>10} {'p95 ms':>10} {'rows/s':>14} {'peak MB':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<40} {result.median_s * 1e3:>10.2f} "
+            f"{result.p95_s * 1e3:>10.2f} {result.rows_per_s:>14,.0f} "
+            f"{result.peak_bytes / 2**20:>9.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,63 @@
+"""
+Categorical columns as integer codes over a category dictionary.
+
+A column is dictionary-encoded once, as a pandas `category` Series, and
+categorical strategies then work on its codes: fills, remaps and encoders
+are NumPy integer operations, and the strings live once in the dictionary.
+`materialize` turns the codes back into values when they are needed.
+"""
+
+from typing import Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def as_categorical(series: pd.Series) -> pd.Series:
+    """`series` dictionary-encoded; a no-op for `category` input."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    codes, uniques = pd.factorize(series)  # order of appearance, no sorting
+    return from_codes(codes, pd.Index(uniques), series)
+
+
+def from_codes(codes: np.ndarray, categories: pd.Index, like: pd.Series) -> pd.Series:
+    """A `category` Series of `codes` (-1 missing) with `like`'s index and name."""
+    values = pd.Categorical.from_codes(
+        codes, dtype=pd.CategoricalDtype(categories), validate=False
+    )
+    return pd.Series(values, index=like.index, name=like.name, copy=False)
+
+
+def codes_and_categories(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 missing) and the categories they index."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, uniques = pd.factorize(series)
+    return codes, pd.Index(uniques)
+
+
+def take(table: np.ndarray, codes: np.ndarray, fill: Any) -> np.ndarray:
+    """`table[codes]`, `fill` where the code is -1 (missing)."""
+    return np.append(table, np.asarray(fill, dtype=table.dtype))[codes]
+
+
+def fill_codes(series: pd.Series, value: Any) -> pd.Series:
+    """
+    Missing values of `series` set to `value`, which is added to the
+    categories when new. Only the codes are touched.
+    """
+    codes, categories = codes_and_categories(as_categorical(series))
+    position = int(categories.get_indexer([value])[0])
+    if position == -1:
+        position = len(categories)
+        categories = categories.append(pd.Index([value]))
+    filled = np.where(codes == -1, position, codes)
+    return from_codes(filled, categories, series)
+
+
+def materialize(series: pd.Series) -> pd.Series:
+    """The values behind a dictionary-encoded column, in the categories' dtype."""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.astype(series.cat.categories.dtype)
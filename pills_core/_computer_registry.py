@@ -1,6 +1,7 @@
 from pills_core.config import ComputeConfig
 from pills_core.stats_computer import (
     CategoricalStatsComputer,
+    DatetimeStatsComputer,
     NumericalStatsComputer,
     StatsComputerRegistry,
 )
@@ -19,8 +20,15 @@ def build_computer_registry(config: ComputeConfig):
     registry.register(
         "categorical",
         lambda: CategoricalStatsComputer(
-            rare_thresholds=config.rare_threshold, sample_size=config.sample_size
+            rare_thresholds=config.rare_threshold,
+            sample_size=config.sample_size,
+            detect_typos=config.detect_typos,
         ),
     )
 
+    registry.register(
+        "datetime",
+        lambda: DatetimeStatsComputer(sample_size=config.sample_size),
+    )
+
     return registry
@@ -0,0 +1,121 @@
+"""
+Datetime columns as int64 nanosecond buffers and calendar arithmetic on them.
+
+Components are derived with integer operations over the whole buffer (days
+since the epoch to a civil date after H. Hinnant's `civil_from_days`), so
+no per-element Timestamp objects or `.dt` accessors are involved.
+"""
+
+from typing import Callable, Dict, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+NAT = np.iinfo(np.int64).min  # NaT in an int64 nanosecond buffer
+NS_PER_SECOND = 1_000_000_000
+NS_PER_HOUR = 3_600 * NS_PER_SECOND
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+
+def as_datetime(series: pd.Series) -> pd.Series:
+    """`series` as datetime64, parsing strings; unparseable values become NaT."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    try:
+        return pd.to_datetime(series, errors="coerce")
+    except ValueError:  # mixed UTC offsets
+        return pd.to_datetime(series, errors="coerce", utc=True)
+
+
+def datetime_ns(series: pd.Series, local: bool = False) -> np.ndarray:
+    """
+    Nanoseconds since the epoch, NaT as `NAT`. Timezone-aware values are
+    read as UTC instants, or as local wall-clock time with `local`.
+    """
+    values = as_datetime(series)
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_localize(None) if local else values.dt.tz_convert(None)
+    return values.dt.as_unit("ns").to_numpy().view(np.int64)
+
+
+def _civil(days: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Proleptic Gregorian (year, month, day) of days since 1970-01-01."""
+    z = days + 719_468
+    era = z // 146_097
+    doe = z - era * 146_097
+    yoe = (doe - doe // 1_460 + doe // 36_524 - doe // 146_096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _day_of_week(ns: np.ndarray) -> np.ndarray:
+    return (ns // NS_PER_DAY + 3) % 7  # 1970-01-01 was a Thursday
+
+
+def _hour(ns: np.ndarray) -> np.ndarray:
+    return ns % NS_PER_DAY // NS_PER_HOUR
+
+
+def _epoch(ns: np.ndarray) -> np.ndarray:
+    return ns // NS_PER_SECOND
+
+
+_CIVIL = ("year", "month", "day")
+_CLOCK: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "day_of_week": _day_of_week,  # Monday = 0, as in pandas
+    "hour": _hour,
+    "epoch": _epoch,  # seconds since 1970-01-01
+}
+COMPONENTS = (*_CIVIL, *_CLOCK)
+_DTYPES = {
+    "year": np.int32,
+    "month": np.int8,
+    "day": np.int8,
+    "day_of_week": np.int8,
+    "hour": np.int8,
+    "epoch": np.int64,
+}
+_CHUNK = 1 << 16
+
+
+def date_components(
+    ns: np.ndarray, names: Sequence[str]
+) -> Dict[str, Union[np.ndarray, pd.api.extensions.ExtensionArray]]:
+    """
+    Components `names` of the `datetime_ns` buffer `ns`. Components of a
+    buffer with NaT come back as nullable integer arrays with those rows
+    masked.
+
+    Rows are converted in fixed-size chunks, so temporaries stay
+    cache-sized and memory is only the outputs, whatever the length.
+    """
+    unknown = set(names) - set(COMPONENTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown date components {sorted(unknown)}; known: {COMPONENTS}"
+        )
+
+    missing = ns == NAT
+    has_missing = bool(missing.any())
+    outputs = {name: np.empty(len(ns), dtype=_DTYPES[name]) for name in names}
+    needs_civil = not set(_CIVIL).isdisjoint(names)
+    for start in range(0, len(ns), _CHUNK):
+        rows = slice(start, start + _CHUNK)
+        chunk = np.where(missing[rows], 0, ns[rows]) if has_missing else ns[rows]
+        civil = _civil(chunk // NS_PER_DAY) if needs_civil else ()
+        for name, out in outputs.items():
+            if name in _CIVIL:
+                out[rows] = civil[_CIVIL.index(name)]
+            else:
+                out[rows] = _CLOCK[name](chunk)
+
+    if not has_missing:
+        return dict(outputs)
+    return {
+        name: pd.arrays.IntegerArray(out, missing.copy())
+        for name, out in outputs.items()
+    }
@@ -24,12 +24,17 @@ class SemanticRole(Enum):
     NUMERIC_NOMINAL = auto()
     BINARY = auto()
     ID_LIKE = auto()
+    TIME_INDEX = auto()  # regular, increasing timestamps
+    EVENT_TIME = auto()
 
 
 class TransformPhase(StrEnum):
     IMPUTATION = auto()
     OUTLIER = auto()
+    RARE_GROUPING = auto()
     SCALING = auto()
+    DATE_FEATURES = auto()
+    ENCODING = auto()
 
 
 class FamilyRole(StrEnum):
@@ -41,6 +46,12 @@ class FamilyRole(StrEnum):
     PERCENTILE = auto()
     LINEAR_SCALING = auto()
     SKEW_TRANSFORM = auto()
+    DECOMPOSITION = auto()
+    INDICATOR = auto()
+    HASHING = auto()
+    GROUPING = auto()
+    NEIGHBOR = auto()
+    SEQUENTIAL = auto()
 
 
 class DriftSeverity(StrEnum):
@@ -60,4 +71,5 @@ class DriftSeverity(StrEnum):
 class ValidationStrategy(StrEnum):
     HOLDOUT = auto()
     CV = auto()
+    GROUP_CV = auto()
     TIME_SERIES = auto()
@@ -32,14 +32,16 @@ class TypeInferencer:
         if series.empty:
             return "unknown"
 
-        if pd.api.types.is_bool_dtype(series):
+        if pd.api.types.is_bool_dtype(series) or isinstance(
+            series.dtype, pd.CategoricalDtype
+        ):
             return "categorical"
         elif pd.api.types.is_numeric_dtype(series):
             return "numeric"
         elif pd.api.types.is_datetime64_any_dtype(series):
             return "datetime"
 
-        if series.dtype == "object" or str(series.dtype).startswith("string"):
+        if pd.api.types.is_string_dtype(series.dtype):  # object, string and str
             return self._inspect_object_column(series)
 
         return "unknown"
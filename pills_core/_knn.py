@@ -0,0 +1,97 @@
+"""
+Nearest-neighbour imputation over fixed-size blocks of query rows.
+
+Queries are compared only with a bounded sample of complete reference
+rows, so memory is `block_size x n_reference` per worker whatever the
+row count. Within a block, distances come from matrix products (BLAS)
+instead of a pairwise loop, with the nan-Euclidean convention for
+missing query features: only observed features are compared.
+
+Neighbours are ranked per query row, so terms that are constant along
+a row (the query's own norm, the `n_features / n_observed` scaling) are
+never computed: `|r|^2 - 2 q.r` over observed features ranks the same,
+and is one product of `[q, 1]` with `[-2r, |r|^2]` (complete rows) or
+of `[q, observed]` with `[-2r, r^2]` (rows with missing features).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+import numpy as np
+
+
+def sample_reference(complete: np.ndarray, max_rows: int, seed: int) -> np.ndarray:
+    """Positions of at most `max_rows` complete rows, uniformly drawn, in order."""
+    positions = np.flatnonzero(complete)
+    if len(positions) <= max_rows:
+        return positions
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(positions, max_rows, replace=False))
+
+
+def worker_bytes(block_size: int, n_reference: int) -> int:
+    """Peak temporaries of one worker: a block's rankings and neighbour order."""
+    return 2 * 8 * block_size * n_reference  # float64 rankings, int64 argpartition
+
+
+def _impute_block(
+    queries: np.ndarray,
+    complete_basis: np.ndarray,
+    masked_basis: np.ndarray,
+    values: np.ndarray,
+    k: int,
+    fallback: float,
+) -> np.ndarray:
+    observed = ~np.isnan(queries)
+    if observed.all():
+        ranking = np.hstack([queries, np.ones((len(queries), 1))]) @ complete_basis
+    else:
+        q = np.where(observed, queries, 0.0)
+        ranking = np.hstack([q, observed]) @ masked_basis
+
+    nearest = np.argpartition(ranking, k - 1, axis=1)[:, :k]
+    filled = values[nearest].mean(axis=1)
+    filled[~observed.any(axis=1)] = fallback
+    return filled
+
+
+def knn_impute(
+    queries: np.ndarray,
+    reference: np.ndarray,
+    values: np.ndarray,
+    *,
+    k: int,
+    block_size: int,
+    n_jobs: int,
+) -> np.ndarray:
+    """
+    The mean of `values` over each query row's `k` nearest `reference`
+    rows. `queries` may hold NaN features; `reference` may not. Blocks
+    run on `n_jobs` threads, BLAS and NumPy releasing the GIL.
+    """
+    k = min(k, len(reference))
+    fallback = float(np.median(values))
+    reference_sq = reference * reference
+    complete_basis = np.hstack(
+        [-2.0 * reference, reference_sq.sum(axis=1)[:, None]]
+    ).T.copy()
+    masked_basis = np.hstack([-2.0 * reference, reference_sq]).T.copy()
+    out = np.empty(len(queries), dtype=np.float64)
+
+    def run(bounds: Tuple[int, int]) -> None:
+        start, stop = bounds
+        out[start:stop] = _impute_block(
+            queries[start:stop], complete_basis, masked_basis, values, k, fallback
+        )
+
+    blocks = [
+        (start, min(start + block_size, len(queries)))
+        for start in range(0, len(queries), block_size)
+    ]
+    if n_jobs == 1 or len(blocks) <= 1:
+        for bounds in blocks:
+            run(bounds)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(run, blocks))
+    return out
@@ -0,0 +1,128 @@
+"""
+Fills within groups of a panel (entity x time), with one sort.
+
+Rows are ordered by (group, time) once. In that order every group is a
+contiguous segment, and a fill only needs, for each row, the position of
+the previous and next valid row of its segment: running maximum/minimum
+of valid positions, masked where they fall outside the row's segment.
+That keeps every fill O(n) after the O(n log n) sort, with no per-group
+Python work.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pills_core._datetime import NAT
+
+_MAX_KEY = 2**63
+
+
+def sort_panel(
+    codes: np.ndarray, times: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The stable order of rows by (group code, time) and, in that order, a
+    flag on the first row of every group. `times=None` keeps row order;
+    missing times (NaN, NaT) come last in their group.
+    """
+    n = len(codes)
+    codes = codes.astype(np.int64, copy=False)
+    keys = (times, codes)
+    missing = times == NAT if times is not None and times.dtype.kind == "i" else None
+    if times is None:
+        key = codes
+    elif missing is not None and missing.any():
+        # NaT is int64 min: it would overflow the offsets below, and sort first
+        key, keys = None, (times, missing, codes)
+    elif times.dtype.kind in "iu" and n:
+        low, high = int(times.min()), int(times.max())
+        offsets, step = times - low, 1
+        n_groups = int(codes.max()) + 1
+        if n_groups * (high - low + 1) >= _MAX_KEY:
+            step = max(int(np.gcd.reduce(offsets)), 1)  # e.g. one day in ns
+            offsets //= step
+        span = (high - low) // step + 1
+        # One integer key sorts as fast as one column; two keys when it overflows
+        key = codes * span + offsets if n_groups * span < _MAX_KEY else None
+    else:
+        key = None
+
+    if key is None:
+        order = np.lexsort(keys)
+    elif n and (key[1:] >= key[:-1]).all():
+        order = np.arange(n)  # already sorted, as panels often are
+    else:
+        order = np.argsort(key, kind="stable")
+
+    sorted_codes = codes[order]
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    return order, starts
+
+
+def previous_valid(valid: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Position of the last valid row at or before each row in its group, or -1."""
+    positions = np.arange(len(valid))
+    previous = np.maximum.accumulate(np.where(valid, positions, -1))
+    first = np.maximum.accumulate(np.where(starts, positions, 0))
+    return np.where(previous >= first, previous, -1)
+
+
+def next_valid(valid: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Position of the first valid row at or after each row in its group, or -1."""
+    n = len(valid)
+    positions = np.arange(n)
+    ends = np.ones(n, dtype=bool)
+    ends[:-1] = starts[1:]
+    following = np.minimum.accumulate(np.where(valid, positions, n)[::-1])[::-1]
+    last = np.minimum.accumulate(np.where(ends, positions, n)[::-1])[::-1]
+    return np.where(following <= last, following, -1)
+
+
+def _take(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    return np.where(positions >= 0, values[np.maximum(positions, 0)], np.nan)
+
+
+def forward_fill(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    return _take(values, previous_valid(~np.isnan(values), starts))
+
+
+def backward_fill(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    return _take(values, next_valid(~np.isnan(values), starts))
+
+
+def interpolate(
+    values: np.ndarray, times: Optional[np.ndarray], starts: np.ndarray
+) -> np.ndarray:
+    """
+    Linear in time between the valid rows around each gap of a group, by
+    position where `times` is None or missing; gaps at either end of a
+    group take the nearest valid value.
+    """
+    valid = ~np.isnan(values)
+    before = previous_valid(valid, starts)
+    after = next_valid(valid, starts)
+    low, high = _take(values, before), _take(values, after)
+
+    positions = np.arange(len(values), dtype=np.float64)
+    weight = _weight(positions if times is None else times, before, after)
+    untimed = np.isnan(weight)
+    if untimed.any():
+        weight[untimed] = _weight(positions, before, after)[untimed]
+
+    inside = (before >= 0) & (after >= 0)
+    return np.where(
+        inside,
+        low + weight * (high - low),
+        np.where(before >= 0, low, high),
+    )
+
+
+def _weight(t: np.ndarray, before: np.ndarray, after: np.ndarray) -> np.ndarray:
+    start = t[np.maximum(before, 0)]
+    span = t[np.maximum(after, 0)] - start
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(
+            span == 0, 0.0, (t - start) / span
+        )  # NaN where a time is missing
@@ -0,0 +1,139 @@
+"""
+Near-duplicate category detection with MinHash and locality-sensitive hashing.
+
+Every category is shingled into character trigrams and summarized by a
+MinHash signature. Signatures are cut into bands; categories sharing a
+band are candidates, and each is paired with the most frequent category
+of its bucket only, so candidates stay linear in the number of
+categories. A candidate is a typo when it is much rarer than its partner
+and within a small edit distance of it.
+"""
+
+import re
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+_SHINGLE = 3
+_NON_DIGITS = re.compile(r"\D+")
+
+
+def _normalize(label: object) -> str:
+    return " ".join(str(label).casefold().split())
+
+
+def _signatures(texts: Sequence[str], n_hashes: int, seed: int) -> np.ndarray:
+    """MinHash signatures, one row per text, over padded character trigrams."""
+    grams: List[str] = []
+    sizes = np.empty(len(texts), dtype=np.int64)
+    for i, text in enumerate(texts):
+        padded = f" {text} "  # so first and last characters get their own shingles
+        shingles = {padded[j : j + _SHINGLE] for j in range(len(padded) - _SHINGLE + 1)}
+        grams.extend(shingles)
+        sizes[i] = len(shingles)
+
+    hashes = pd.util.hash_array(np.asarray(grams, dtype=object))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, 2**63, n_hashes, dtype=np.uint64) | np.uint64(1)
+    salts = rng.integers(0, 2**63, n_hashes, dtype=np.uint64)
+
+    signatures = np.empty((len(texts), n_hashes), dtype=np.uint64)
+    for j in range(n_hashes):
+        permuted = (hashes ^ salts[j]) * multipliers[j]  # wraps, as hashing should
+        signatures[:, j] = np.minimum.reduceat(permuted, starts)
+    return signatures
+
+
+def _candidates(
+    signatures: np.ndarray, counts: np.ndarray, bands: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """(variant, partner) pairs: bucket members and their bucket's most frequent."""
+    rows = signatures.shape[1] // bands
+    variants, partners = [], []
+    positions = np.arange(len(counts))
+    for band in range(bands):
+        block = signatures[:, band * rows : (band + 1) * rows]
+        key = block[:, 0].copy()
+        for column in range(1, rows):
+            key = key * np.uint64(0x9E3779B97F4A7C15) ^ block[:, column]
+        order = np.lexsort((-counts, key))  # by bucket, most frequent first
+        head = np.r_[True, key[order][1:] != key[order][:-1]]
+        leaders = order[np.maximum.accumulate(np.where(head, positions, 0))]
+        variants.append(order[~head])
+        partners.append(leaders[~head])
+
+    pairs = np.unique(
+        np.stack([np.concatenate(variants), np.concatenate(partners)], axis=1), axis=0
+    )
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _within_distance(a: str, b: str, bound: int) -> bool:
+    """
+    Edit distance of `a` and `b` is at most `bound`, counting a swap of two
+    adjacent characters as one edit (optimal string alignment, banded DP).
+    """
+    if abs(len(a) - len(b)) > bound:
+        return False
+    far = bound + 1
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        low, high = max(1, i - bound), min(len(b), i + bound)
+        current = [far] * (len(b) + 1)
+        current[0] = i
+        for j in range(low, high + 1):
+            cost = a[i - 1] != b[j - 1]
+            best = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                best = min(best, before[j - 2] + 1)
+            current[j] = best
+        if min(current[low - 1 : high + 1]) > bound:
+            return False
+        before, previous = previous, current
+    return previous[len(b)] <= bound
+
+
+def find_typos(
+    labels: Sequence[object],
+    counts: Sequence[int],
+    *,
+    max_distance: int = 2,
+    max_variant_ratio: float = 0.1,
+    min_length: int = 4,
+    bands: int = 16,
+    rows: int = 2,
+    seed: int = 0,
+) -> Dict[object, object]:
+    """
+    Map each likely misspelled label to the label it misspells.
+
+    A variant is at most `max_variant_ratio` as frequent as its partner and
+    within `max_distance` edits of it after case folding, one edit below 8
+    characters. Labels shorter than `min_length`, or whose digits differ,
+    are distinct codes rather than typos (`A100` vs `A101`).
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    texts = [_normalize(label) for label in labels]
+    eligible = np.flatnonzero([len(text) >= min_length for text in texts])
+    if eligible.size < 2:
+        return {}
+
+    signatures = _signatures([texts[i] for i in eligible], bands * rows, seed)
+    variants, partners = _candidates(signatures, counts[eligible], bands)
+    variants, partners = eligible[variants], eligible[partners]
+    rarer = counts[variants] <= max_variant_ratio * counts[partners]
+    variants, partners = variants[rarer], partners[rarer]
+    order = np.argsort(-counts[partners], kind="stable")  # likeliest partner first
+
+    typos: Dict[object, object] = {}
+    for v, p in zip(variants[order], partners[order], strict=True):
+        a, b = texts[v], texts[p]
+        if _NON_DIGITS.sub("", a) != _NON_DIGITS.sub("", b):
+            continue
+        bound = min(max_distance, 1 if min(len(a), len(b)) < 8 else max_distance)
+        if labels[v] not in typos and _within_distance(a, b, bound):
+            typos[labels[v]] = labels[p]
+    return typos
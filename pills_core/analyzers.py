@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Generic
+from typing import Any, Callable, Generic, TypeVar
 
 import numpy as np
 import pandas as pd
@@ -12,6 +12,7 @@ from pills_core._infer_types import INFER_TYPES
 from pills_core.exceptions import NoAnalyzerFoundError
 from pills_core.rules import (
     Decision,
+    DecisionCache,
     DomainPolicy,
     DomainRule,
     DomainTags,
@@ -24,21 +25,28 @@ from pills_core.strategies.categorical.base import (
     CategoricalEmbedding,
 )
 from pills_core.strategies.numeric.base import NumericalColumnMeta, NumericalEmbedding
+from pills_core.strategies.temporal.base import DatetimeColumnMeta, DatetimeEmbedding
 from pills_core.types.profiles import (
     Cardinality,
     CategoricalDomainProfile,
     CategoricalProfile,
     ColumnTypeProfile,
+    DatetimeProfile,
     NumericalDomainProfile,
     StatisticalProfile,
 )
 from pills_core.types.stats import (
     CategoricalColumnStats,
     CategoricalThresholds,
+    DatetimeColumnStats,
+    DatetimeThresholds,
     NumericalColumnStats,
     NumericalThresholds,
     StatsT,
 )
+from pills_core.types.stats_table import StatsTable
+
+ValueT = TypeVar("ValueT")
 
 
 @dataclass(frozen=True, slots=True)
@@ -58,6 +66,7 @@ class AnalyzerConfig:
     numerical: NumericalThresholds
     categorical: CategoricalThresholds
     domain: DomainConfig
+    datetime: DatetimeThresholds = field(default_factory=DatetimeThresholds)
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,6 +79,11 @@ class CategoricalRuleContext:
     stats: CategoricalColumnStats
 
 
+@dataclass(frozen=True, slots=True)
+class DatetimeRuleContext:
+    stats: DatetimeColumnStats
+
+
 def build_domain_policy(config: DomainConfig) -> DomainPolicy:
     return DomainPolicy(
         rules=tuple(
@@ -79,17 +93,35 @@ def build_domain_policy(config: DomainConfig) -> DomainPolicy:
     )
 
 
+def _stats_rule(
+    name: str,
+    value: ValueT,
+    when: Callable[[Any], Any],
+    reason_builder: Callable[[Any], tuple[str, ...]],
+) -> MatchRule[Any, ValueT]:
+    """
+    Rule testing stats fields only. `when` combines comparisons with `&` and
+    np.abs, so it runs on one stats object and, column-wise, on a
+    StatsTable of many.
+    """
+    return MatchRule(
+        name=name,
+        value=value,
+        predicate=lambda ctx: bool(when(ctx.stats)),
+        reason_builder=reason_builder,
+        columnar=when,
+    )
+
+
 def build_numerical_semantic_policy(
     thresholds: NumericalThresholds,
 ) -> MatchPolicy[NumericalRuleContext, SemanticRole]:
     return MatchPolicy(
         rules=(
-            MatchRule(
+            _stats_rule(
                 name="binary",
                 value=SemanticRole.BINARY,
-                predicate=lambda ctx: (
-                    ctx.stats.n_unique <= thresholds.binary_max_unique
-                ),
+                when=lambda s: s.n_unique <= thresholds.binary_max_unique,
                 reason_builder=lambda ctx: (
                     (
                         f"n_unique={ctx.stats.n_unique} <= "
@@ -97,12 +129,12 @@ def build_numerical_semantic_policy(
                     ),
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="id_like",
                 value=SemanticRole.ID_LIKE,
-                predicate=lambda ctx: (
-                    ctx.stats.unique_ratio >= thresholds.id_unique_ratio
-                    and ctx.stats.monotonic_ratio >= thresholds.id_monotonic_ratio
+                when=lambda s: (
+                    (s.unique_ratio >= thresholds.id_unique_ratio)
+                    & (s.monotonic_ratio >= thresholds.id_monotonic_ratio)
                 ),
                 reason_builder=lambda ctx: (
                     "High uniqueness and near-monotonic ordering indicate identifier-like values.",
@@ -112,14 +144,14 @@ def build_numerical_semantic_policy(
                     ),
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="count_positive_skew",
                 value=SemanticRole.COUNT,
-                predicate=lambda ctx: (
-                    ctx.stats.is_integer_valued
-                    and ctx.stats.min >= 0
-                    and ctx.stats.skewness >= thresholds.count_skewness
-                    and ctx.stats.zero_ratio < 0.95
+                when=lambda s: (
+                    s.is_integer_valued
+                    & (s.min >= 0)
+                    & (s.skewness >= thresholds.count_skewness)
+                    & (s.zero_ratio < 0.95)
                 ),
                 reason_builder=lambda ctx: (
                     "Integer non-negative values with positive skew are count-like.",
@@ -129,28 +161,28 @@ def build_numerical_semantic_policy(
                     ),
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="count_sparse_zero",
                 value=SemanticRole.COUNT,
-                predicate=lambda ctx: (
-                    ctx.stats.is_integer_valued
-                    and ctx.stats.min >= 0
-                    and ctx.stats.zero_ratio >= 0.95
-                    and ctx.stats.n_unique <= 10
+                when=lambda s: (
+                    s.is_integer_valued
+                    & (s.min >= 0)
+                    & (s.zero_ratio >= 0.95)
+                    & (s.n_unique <= 10)
                 ),
                 reason_builder=lambda ctx: (
                     "Mostly-zero sparse integer values are treated as counts.",
                     f"zero_ratio={ctx.stats.zero_ratio:.3f}, n_unique={ctx.stats.n_unique}.",
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="ordinal",
                 value=SemanticRole.ORDINAL,
-                predicate=lambda ctx: (
-                    ctx.stats.is_integer_valued
-                    and ctx.stats.unique_ratio <= thresholds.low_unique_ratio
-                    and ctx.stats.n_unique <= thresholds.low_unique_abs
-                    and abs(ctx.stats.skewness) <= thresholds.ordinal_max_skewness
+                when=lambda s: (
+                    s.is_integer_valued
+                    & (s.unique_ratio <= thresholds.low_unique_ratio)
+                    & (s.n_unique <= thresholds.low_unique_abs)
+                    & (np.abs(s.skewness) <= thresholds.ordinal_max_skewness)
                 ),
                 reason_builder=lambda ctx: (
                     "Low-cardinality integer values with moderate skew are treated as ordinal.",
@@ -160,13 +192,13 @@ def build_numerical_semantic_policy(
                     ),
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="numeric_nominal",
                 value=SemanticRole.NUMERIC_NOMINAL,
-                predicate=lambda ctx: (
-                    ctx.stats.is_integer_valued
-                    and ctx.stats.unique_ratio <= thresholds.low_unique_ratio
-                    and ctx.stats.n_unique <= thresholds.low_unique_abs
+                when=lambda s: (
+                    s.is_integer_valued
+                    & (s.unique_ratio <= thresholds.low_unique_ratio)
+                    & (s.n_unique <= thresholds.low_unique_abs)
                 ),
                 reason_builder=lambda ctx: (
                     "Low-cardinality integers with stronger skew are treated as nominal codes.",
@@ -187,23 +219,21 @@ def build_numerical_task_policy(
 ) -> MatchPolicy[NumericalRuleContext, TaskType]:
     return MatchPolicy(
         rules=(
-            MatchRule(
+            _stats_rule(
                 name="binary_target",
                 value=TaskType.BINARY,
-                predicate=lambda ctx: (
-                    ctx.stats.n_unique == 2 and ctx.stats.is_integer_valued
-                ),
+                when=lambda s: (s.n_unique == 2) & s.is_integer_valued,
                 reason_builder=lambda _: (
                     "Target has exactly two integer-coded classes.",
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="multiclass_target",
                 value=TaskType.MULTICLASS,
-                predicate=lambda ctx: (
-                    ctx.stats.unique_ratio <= thresholds.low_unique_ratio
-                    and ctx.stats.is_integer_valued
-                    and ctx.stats.n_unique <= thresholds.low_unique_abs
+                when=lambda s: (
+                    (s.unique_ratio <= thresholds.low_unique_ratio)
+                    & s.is_integer_valued
+                    & (s.n_unique <= thresholds.low_unique_abs)
                 ),
                 reason_builder=lambda ctx: (
                     "Low-cardinality integer target is treated as multiclass.",
@@ -224,12 +254,10 @@ def build_categorical_semantic_policy(
 ) -> MatchPolicy[CategoricalRuleContext, SemanticRole]:
     return MatchPolicy(
         rules=(
-            MatchRule(
+            _stats_rule(
                 name="binary",
                 value=SemanticRole.BINARY,
-                predicate=lambda ctx: (
-                    ctx.stats.n_unique <= thresholds.binary_max_unique
-                ),
+                when=lambda s: s.n_unique <= thresholds.binary_max_unique,
                 reason_builder=lambda ctx: (
                     (
                         f"n_unique={ctx.stats.n_unique} <= "
@@ -237,14 +265,13 @@ def build_categorical_semantic_policy(
                     ),
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="ordinal_like",
                 value=SemanticRole.ORDINAL,
-                predicate=lambda ctx: (
-                    ctx.stats.n_unique <= thresholds.low_cardinality_max
-                    and ctx.stats.rare_ratio <= thresholds.rare_ratio_threshold
-                    and ctx.stats.most_frequent_ratio
-                    < thresholds.dominant_ratio_threshold
+                when=lambda s: (
+                    (s.n_unique <= thresholds.low_cardinality_max)
+                    & (s.rare_ratio <= thresholds.rare_ratio_threshold)
+                    & (s.most_frequent_ratio < thresholds.dominant_ratio_threshold)
                 ),
                 reason_builder=lambda ctx: (
                     "Low-cardinality categories with balanced frequency look ordinal-like.",
@@ -254,12 +281,10 @@ def build_categorical_semantic_policy(
                     ),
                 ),
             ),
-            MatchRule(
+            _stats_rule(
                 name="nominal_low_cardinality",
                 value=SemanticRole.NUMERIC_NOMINAL,
-                predicate=lambda ctx: (
-                    ctx.stats.n_unique <= thresholds.low_cardinality_max
-                ),
+                when=lambda s: s.n_unique <= thresholds.low_cardinality_max,
                 reason_builder=lambda ctx: (
                     "Low-cardinality categories are treated as nominal by default.",
                     (
@@ -279,12 +304,10 @@ def build_categorical_task_policy(
 ) -> MatchPolicy[CategoricalRuleContext, TaskType]:
     return MatchPolicy(
         rules=(
-            MatchRule(
+            _stats_rule(
                 name="binary_target",
                 value=TaskType.BINARY,
-                predicate=lambda ctx: (
-                    ctx.stats.n_unique <= thresholds.binary_max_unique
-                ),
+                when=lambda s: s.n_unique <= thresholds.binary_max_unique,
                 reason_builder=lambda _: ("Target has two categories.",),
             ),
         ),
@@ -295,6 +318,43 @@ def build_categorical_task_policy(
     )
 
 
+def build_datetime_semantic_policy(
+    thresholds: DatetimeThresholds,
+) -> MatchPolicy[DatetimeRuleContext, SemanticRole]:
+    return MatchPolicy(
+        rules=(
+            _stats_rule(
+                name="time_index",
+                value=SemanticRole.TIME_INDEX,
+                when=lambda s: (
+                    (s.unique_ratio >= thresholds.index_unique_ratio)
+                    & (s.monotonic_ratio >= thresholds.monotonic_min_ratio)
+                    & (s.regularity >= thresholds.regular_min_ratio)
+                ),
+                reason_builder=lambda ctx: (
+                    "Distinct, increasing, evenly spaced timestamps index a series.",
+                    (
+                        f"monotonic_ratio={ctx.stats.monotonic_ratio:.3f}, "
+                        f"regularity={ctx.stats.regularity:.3f}."
+                    ),
+                ),
+            ),
+        ),
+        fallback_value=SemanticRole.EVENT_TIME,
+        fallback_reasons=("Timestamps without a regular order record events.",),
+    )
+
+
+def build_datetime_task_policy(
+    thresholds: DatetimeThresholds,
+) -> MatchPolicy[DatetimeRuleContext, TaskType]:
+    return MatchPolicy(
+        rules=(),
+        fallback_value=TaskType.TIME_SERIES,
+        fallback_reasons=("Datetime columns drive time-series tasks.",),
+    )
+
+
 class DomainProfiler:
     def __init__(self, categorical_thresholds: CategoricalThresholds) -> None:
         self._categorical_thresholds = categorical_thresholds
@@ -347,6 +407,9 @@ class DomainProfiler:
 
 
 class ColumnAnalyzer(ABC, Generic[StatsT, MetaT, EmbeddingT]):
+    semantic_policy: MatchPolicy[Any, SemanticRole]
+    task_policy: MatchPolicy[Any, TaskType]
+
     def __init__(
         self,
         config: AnalyzerConfig,
@@ -356,6 +419,9 @@ class ColumnAnalyzer(ABC, Generic[StatsT, MetaT, EmbeddingT]):
         self.config = config
         self.domain_policy = domain_policy
         self.domain_profiler = domain_profiler
+        # Decisions per stats object, so repeated lookups within a fit are free
+        self._semantic_decisions: DecisionCache[SemanticRole] = DecisionCache()
+        self._task_decisions: DecisionCache[TaskType] = DecisionCache()
 
     @property
     @abstractmethod
@@ -366,7 +432,7 @@ class ColumnAnalyzer(ABC, Generic[StatsT, MetaT, EmbeddingT]):
     def handles_type(self) -> INFER_TYPES: ...
 
     @abstractmethod
-    def resolve_semantic_role(self, stats: StatsT) -> Decision[SemanticRole]: ...
+    def _rule_context(self, stats: StatsT) -> Any: ...
 
     @abstractmethod
     def explain(self, stats: StatsT) -> list[str]: ...
@@ -391,8 +457,35 @@ class ColumnAnalyzer(ABC, Generic[StatsT, MetaT, EmbeddingT]):
         task_type: TaskType = TaskType.AUTO,
     ) -> MetaT: ...
 
-    @abstractmethod
-    def _infer_task_type(self, stats: StatsT) -> Decision[TaskType]: ...
+    def resolve_semantic_role(self, stats: StatsT) -> Decision[SemanticRole]:
+        decision = self._semantic_decisions.get(stats)
+        if decision is None:
+            decision = self.semantic_policy.resolve(self._rule_context(stats))
+            self._semantic_decisions.put(stats, decision)
+        return decision
+
+    def _infer_task_type(self, stats: StatsT) -> Decision[TaskType]:
+        decision = self._task_decisions.get(stats)
+        if decision is None:
+            decision = self.task_policy.resolve(self._rule_context(stats))
+            self._task_decisions.put(stats, decision)
+        return decision
+
+    def prime_decisions(self, table: StatsTable[StatsT]) -> None:
+        """
+        Resolve the semantic role and task type of every row of `table` with
+        one columnar pass per policy, so later lookups of its rows hit the
+        cache.
+        """
+        rows = list(table)
+        contexts = [self._rule_context(row) for row in rows]
+        for cache, policy in (
+            (self._semantic_decisions, self.semantic_policy),
+            (self._task_decisions, self.task_policy),
+        ):
+            decisions = policy.resolve_many(contexts, table)
+            for row, decision in zip(rows, decisions, strict=True):
+                cache.put(row, decision)
 
     def detect_semantic_role(self, stats: StatsT) -> SemanticRole:
         return self.resolve_semantic_role(stats).value
@@ -436,11 +529,8 @@ class NumericalColumnAnalyzer(
     def handles_type(self) -> INFER_TYPES:
         return "numeric"
 
-    def resolve_semantic_role(
-        self,
-        stats: NumericalColumnStats,
-    ) -> Decision[SemanticRole]:
-        return self.semantic_policy.resolve(NumericalRuleContext(stats=stats))
+    def _rule_context(self, stats: NumericalColumnStats) -> NumericalRuleContext:
+        return NumericalRuleContext(stats=stats)
 
     def explain(self, stats: NumericalColumnStats) -> list[str]:
         decision = self.resolve_semantic_role(stats)
@@ -501,9 +591,6 @@ class NumericalColumnAnalyzer(
             task_type=self.resolve_task_type(stats, task_type),
         )
 
-    def _infer_task_type(self, stats: NumericalColumnStats) -> Decision[TaskType]:
-        return self.task_policy.resolve(NumericalRuleContext(stats=stats))
-
 
 class CategoricalColumnAnalyzer(
     ColumnAnalyzer[CategoricalColumnStats, CategoricalColumnMeta, CategoricalEmbedding]
@@ -532,11 +619,8 @@ class CategoricalColumnAnalyzer(
     def handles_type(self) -> INFER_TYPES:
         return "categorical"
 
-    def resolve_semantic_role(
-        self,
-        stats: CategoricalColumnStats,
-    ) -> Decision[SemanticRole]:
-        return self.semantic_policy.resolve(CategoricalRuleContext(stats=stats))
+    def _rule_context(self, stats: CategoricalColumnStats) -> CategoricalRuleContext:
+        return CategoricalRuleContext(stats=stats)
 
     def explain(self, stats: CategoricalColumnStats) -> list[str]:
         decision = self.resolve_semantic_role(stats)
@@ -575,7 +659,9 @@ class CategoricalColumnAnalyzer(
             cardinality=cardinality,
             n_unique=int(stats.n_unique),
             rare_categories=list(stats.rare_categories),
-            has_typos=False,
+            has_typos=(
+                stats.typo_ratio > 0 and stats.typo_ratio >= thresholds.typo_min_ratio
+            ),
             has_order=self.detect_semantic_role(stats) is SemanticRole.ORDINAL,
             is_domain_specific=domain_tags.any_set(),
         )
@@ -623,9 +709,6 @@ class CategoricalColumnAnalyzer(
             profile=self.build_categorical_profile(stats, domain_tags),
         )
 
-    def _infer_task_type(self, stats: CategoricalColumnStats) -> Decision[TaskType]:
-        return self.task_policy.resolve(CategoricalRuleContext(stats=stats))
-
     def _calc_imbalance_sensitivity(self, stats: CategoricalColumnStats) -> float:
         thresholds = self.config.categorical
 
@@ -664,6 +747,97 @@ class CategoricalColumnAnalyzer(
         return typo_tolerance
 
 
+class DatetimeColumnAnalyzer(
+    ColumnAnalyzer[DatetimeColumnStats, DatetimeColumnMeta, DatetimeEmbedding]
+):
+    def __init__(
+        self,
+        config: AnalyzerConfig,
+        domain_policy: DomainPolicy,
+        domain_profiler: DomainProfiler,
+        semantic_policy: MatchPolicy[DatetimeRuleContext, SemanticRole],
+        task_policy: MatchPolicy[DatetimeRuleContext, TaskType],
+    ) -> None:
+        super().__init__(
+            config=config,
+            domain_policy=domain_policy,
+            domain_profiler=domain_profiler,
+        )
+        self.semantic_policy = semantic_policy
+        self.task_policy = task_policy
+
+    @property
+    def column_role(self) -> ColumnRole:
+        return ColumnRole.TIME_SERIES
+
+    @property
+    def handles_type(self) -> INFER_TYPES:
+        return "datetime"
+
+    def _rule_context(self, stats: DatetimeColumnStats) -> DatetimeRuleContext:
+        return DatetimeRuleContext(stats=stats)
+
+    def explain(self, stats: DatetimeColumnStats) -> list[str]:
+        decision = self.resolve_semantic_role(stats)
+        return [f"Resolved semantic role: {decision.value.name}.", *decision.reasons]
+
+    def build_statistical_profile(
+        self,
+        stats: DatetimeColumnStats,
+    ) -> StatisticalProfile:
+        thresholds = self.config.datetime
+        return StatisticalProfile(
+            is_skewed=False,
+            is_heavy_tailed=False,
+            has_outliers=(
+                stats.max_gap_seconds
+                > thresholds.gap_outlier_factor * stats.median_gap_seconds
+            ),
+            is_sparse=stats.missing_ratio >= thresholds.sparse_missing_ratio,
+            is_low_variance=stats.span_days == 0,
+        )
+
+    def build_datetime_profile(self, stats: DatetimeColumnStats) -> DatetimeProfile:
+        thresholds = self.config.datetime
+        return DatetimeProfile(
+            is_regular=stats.regularity >= thresholds.regular_min_ratio,
+            is_monotonic=stats.monotonic_ratio >= thresholds.monotonic_min_ratio,
+            has_time=stats.has_time,
+            frequency_seconds=stats.median_gap_seconds,
+        )
+
+    def build_column_embedding(
+        self,
+        stats: DatetimeColumnStats,
+        meta: DatetimeColumnMeta,
+    ) -> DatetimeEmbedding:
+        return DatetimeEmbedding(
+            missing_ratio_fit=1.0 if stats.missing_ratio > 0 else 0.0,
+            distribution_preservation=1.0,
+            target_safety=1.0 if meta.is_target else 0.0,
+            cardinality_fit=1.0 - min(stats.unique_ratio, 1.0),
+            regularity_fit=stats.regularity,
+            time_of_day_fit=1.0 if stats.has_time else 0.0,
+        )
+
+    def build_meta(
+        self,
+        series: pd.Series,
+        stats: DatetimeColumnStats,
+        is_target: bool,
+        column_role: ColumnRole,
+        task_type: TaskType = TaskType.AUTO,
+    ) -> DatetimeColumnMeta:
+        return DatetimeColumnMeta(
+            role=column_role,
+            semantic_role=self.detect_semantic_role(stats),
+            is_target=is_target,
+            task_type=self.resolve_task_type(stats, task_type),
+            profile=self.build_statistical_profile(stats),
+            datetime_profile=self.build_datetime_profile(stats),
+        )
+
+
 class AnalyzerRegistry:
     def __init__(self, analyzers: tuple[ColumnAnalyzer, ...]) -> None:
         self._analyzers: dict[str, ColumnAnalyzer] = {
@@ -704,6 +878,14 @@ class AnalyzerBuilder:
             task_policy=build_categorical_task_policy(self._config.categorical),
         )
 
+        datetime_analyzer = DatetimeColumnAnalyzer(
+            config=self._config,
+            domain_policy=domain_policy,
+            domain_profiler=domain_profiler,
+            semantic_policy=build_datetime_semantic_policy(self._config.datetime),
+            task_policy=build_datetime_task_policy(self._config.datetime),
+        )
+
         return AnalyzerRegistry(
-            analyzers=(numerical_analyzer, categorical_analyzer),
+            analyzers=(numerical_analyzer, categorical_analyzer, datetime_analyzer),
         )
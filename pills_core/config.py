@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -49,6 +50,7 @@ class ComputeConfig(BaseSettings):
     sample_size: int | None = Field(default=None, ge=1)
     chunk_size: int | None = Field(default=None, ge=1)
     rare_threshold: float = Field(default=0.01, ge=0.0, le=1.0)
+    detect_typos: bool = True
 
 
 class PillConfig(BaseSettings):
@@ -80,4 +82,17 @@ class PillConfig(BaseSettings):
     )
 
 
-config = PillConfig()  # type: ignore[call-arg]
+@lru_cache(maxsize=1)
+def get_config() -> PillConfig:
+    """
+    Settings read from `.env` and the environment on first call, then cached.
+    Call `get_config.cache_clear()` to pick up changed settings.
+    """
+    return PillConfig()  # type: ignore[call-arg]
+
+
+def __getattr__(name: str) -> PillConfig:
+    # `from pills_core.config import config` keeps working, built on first use.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,23 @@
+from __future__ import annotations
+
 import csv
 import os
 from dataclasses import dataclass
 from io import StringIO
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
 from pills_core.ingestion.base import DataSource
+from pills_core.memory import estimate_frame_bytes
+
+if TYPE_CHECKING:
+    from pills_core.memory import MemoryGovernor
+
+# pandas' parser holds the raw tokens and the converted columns at once.
+_PARSE_FACTOR = 3
+_MIN_CHUNK_ROWS = 1_000
 
 
 @dataclass
@@ -21,6 +32,20 @@ class CSVOptions:
 
 
 class CSVDataSource(DataSource[CSVOptions]):
+    """
+    Loads a CSV file into memory. With a governor, files whose parse would not
+    fit the memory budget are streamed from disk in row chunks instead of
+    being read into one string first. Chunks are parsed with the column
+    types of the first one, and loading fails with MemoryError once the
+    parsed rows alone exceed the budget.
+    """
+
+    def __init__(
+        self, options: CSVOptions, governor: MemoryGovernor | None = None
+    ) -> None:
+        super().__init__(options)
+        self.governor = governor
+
     def _validate(self) -> None:
         file_path = self.options.path
 
@@ -71,19 +96,90 @@ class CSVDataSource(DataSource[CSVOptions]):
 
         return df
 
-    def load(self) -> pd.DataFrame:
-        self._validate()
+    def _read_head(self, n_chars: int = 4096) -> str:
+        with open(self.options.path, encoding=self.options.encoding) as f:
+            head = f.read(n_chars)
+        return head.removeprefix("\ufeff")
 
+    def _exceeds_budget(self, governor: MemoryGovernor) -> bool:
+        footprint = os.stat(self.options.path).st_size * _PARSE_FACTOR
+        return governor.warn_if_over(footprint, f"Loading {self.options.path}")
+
+    def _read_whole(self) -> pd.DataFrame:
         content = self._read_raw()
-        sep = self._detect_separator(content)
-        df = pd.read_csv(
+        return pd.read_csv(
             StringIO(content),
-            sep=sep,
+            sep=self._detect_separator(content),
             decimal=self.options.decimal,
             thousands=self.options.thousands,
             na_values=self.options.na_values,
             skiprows=self.options.skip_rows,
         )
+
+    def _read_chunked(self, governor: MemoryGovernor) -> pd.DataFrame:
+        head = self._read_head()
+        line_bytes = len(head.encode(self.options.encoding)) / max(head.count("\n"), 1)
+        rows = max(
+            int(governor.available_bytes() / (line_bytes * _PARSE_FACTOR)),
+            _MIN_CHUNK_ROWS,
+        )
+
+        encoding = self.options.encoding
+        if encoding.lower().replace("_", "-") == "utf-8":
+            encoding = "utf-8-sig"
+        options = {
+            "sep": self._detect_separator(head),
+            "encoding": encoding,
+            "decimal": self.options.decimal,
+            "thousands": self.options.thousands,
+            "na_values": self.options.na_values,
+            "skiprows": self.options.skip_rows,
+        }
+
+        # Types come from the first chunk and are imposed on all of them, so
+        # no chunk infers its own; integers are read as floats until the end
+        # in case a later chunk holds missing values.
+        first = pd.read_csv(self.options.path, nrows=rows, **options)
+        dtypes = {
+            column: np.float64 if dtype.kind in "iuf" else "str"
+            for column, dtype in first.dtypes.items()
+        }
+        integers = [
+            column for column, dtype in first.dtypes.items() if dtype.kind in "iu"
+        ]
+        available = governor.available_bytes()
+
+        chunks, loaded = [], 0
+        reader = pd.read_csv(self.options.path, dtype=dtypes, chunksize=rows, **options)
+        try:
+            for chunk in reader:
+                loaded += estimate_frame_bytes(chunk)
+                if loaded > available:
+                    raise MemoryError(
+                        f"{self.options.path} does not fit the memory budget: "
+                        f"{available / 2**20:.0f} MB left, more than "
+                        f"{loaded / 2**20:.0f} MB loaded."
+                    )
+                chunks.append(chunk)
+        except ValueError as e:
+            raise ValueError(
+                f"{self.options.path}: a column changes type after its first "
+                f"{rows} rows ({e})."
+            ) from e
+
+        df = pd.concat(chunks, ignore_index=True)
+        for column in integers:
+            if not df[column].hasnans:
+                df[column] = df[column].astype(first.dtypes[column])
+        return df
+
+    def load(self) -> pd.DataFrame:
+        self._validate()
+
+        if self.governor is not None and self._exceeds_budget(self.governor):
+            df = self._read_chunked(self.governor)
+        else:
+            df = self._read_whole()
         df = self._header_handling(df)
 
         for col in df.columns:
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+import pandas as pd
+
+_span_ids = itertools.count(1)
+_NULL_STAGE: ContextManager[None] = nullcontext()
+
+
+@dataclass(frozen=True, slots=True)
+class StageStart:
+    stage: str
+    column: str
+    rows: int
+    detail: str  # strategy or phase the stage runs, "" when not applicable
+    span_id: int
+    parent_id: Optional[int]
+    thread_id: int
+    start_ns: int  # perf_counter_ns, for durations and trace offsets
+    start_unix_ns: int
+
+
+@dataclass(frozen=True, slots=True)
+class StageRecord:
+    start: StageStart
+    wall_ns: int
+    cpu_ns: int  # CPU time of the calling thread
+    bytes_allocated: int  # net traced allocations, 0 unless tracemalloc is tracing
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        if self.start.detail:
+            return f"{self.start.stage}:{self.start.detail}"
+        return self.start.stage
+
+
+class StageHook(Protocol):
+    def on_stage_start(self, start: StageStart) -> None: ...
+
+    def on_stage_end(self, record: StageRecord) -> None: ...
+
+
+class _Stage:
+    __slots__ = (
+        "_instrumentation",
+        "_stage",
+        "_column",
+        "_rows",
+        "_detail",
+        "_start",
+        "_cpu_start",
+        "_bytes_start",
+    )
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        stage: str,
+        column: str,
+        rows: int,
+        detail: str,
+    ) -> None:
+        self._instrumentation = instrumentation
+        self._stage = stage
+        self._column = column
+        self._rows = rows
+        self._detail = detail
+
+    def __enter__(self) -> None:
+        stack = self._instrumentation._stack()
+        self._start = StageStart(
+            stage=self._stage,
+            column=self._column,
+            rows=self._rows,
+            detail=self._detail,
+            span_id=next(_span_ids),
+            parent_id=stack[-1] if stack else None,
+            thread_id=threading.get_ident(),
+            start_ns=time.perf_counter_ns(),
+            start_unix_ns=time.time_ns(),
+        )
+        stack.append(self._start.span_id)
+        for hook in self._instrumentation.hooks:
+            hook.on_stage_start(self._start)
+
+        self._bytes_start = (
+            tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        )
+        self._cpu_start = time.thread_time_ns()
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        cpu_ns = time.thread_time_ns() - self._cpu_start
+        wall_ns = time.perf_counter_ns() - self._start.start_ns
+        allocated = (
+            tracemalloc.get_traced_memory()[0] - self._bytes_start
+            if tracemalloc.is_tracing()
+            else 0
+        )
+        self._instrumentation._stack().pop()
+
+        record = StageRecord(
+            start=self._start,
+            wall_ns=wall_ns,
+            cpu_ns=cpu_ns,
+            bytes_allocated=allocated,
+            error=None if exc_type is None else exc_type.__name__,
+        )
+        for hook in self._instrumentation.hooks:
+            hook.on_stage_end(record)
+
+
+class Instrumentation:
+    """
+    Dispatches stage start/end events to hooks.
+
+    Components take an Instrumentation and wrap their work in
+    `stage(...)`. Without hooks, `stage` returns a shared no-op context
+    manager, so disabled instrumentation costs one attribute check per stage.
+    """
+
+    def __init__(self, hooks: Sequence[StageHook] = ()) -> None:
+        self.hooks: Tuple[StageHook, ...] = tuple(hooks)
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.hooks)
+
+    def stage(
+        self, stage: str, column: object, rows: int, detail: str = ""
+    ) -> ContextManager[None]:
+        if not self.hooks:
+            return _NULL_STAGE
+        return _Stage(self, stage, str(column), rows, detail)
+
+    def _stack(self) -> List[int]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+NO_INSTRUMENTATION = Instrumentation()
+
+
+class RecordingHook:
+    """Keeps every finished stage record; base for the collectors below."""
+
+    def __init__(self) -> None:
+        self.records: List[StageRecord] = []
+        self._lock = threading.Lock()
+
+    def on_stage_start(self, start: StageStart) -> None:
+        pass
+
+    def on_stage_end(self, record: StageRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+
+class SummaryCollector(RecordingHook):
+    """Aggregates stage records into a table, slowest stages first."""
+
+    def table(self, by: Sequence[str] = ("stage",)) -> pd.DataFrame:
+        keys = tuple(by)
+        totals: Dict[Tuple[str, ...], List[int]] = defaultdict(lambda: [0, 0, 0, 0, 0])
+
+        for record in self.records:
+            values = {
+                "stage": record.start.stage,
+                "column": record.start.column,
+                "detail": record.start.detail,
+            }
+            row = totals[tuple(values[key] for key in keys)]
+            row[0] += 1
+            row[1] += record.wall_ns
+            row[2] += record.cpu_ns
+            row[3] += record.bytes_allocated
+            row[4] += record.start.rows
+
+        table = pd.DataFrame(
+            [(*key, *row) for key, row in totals.items()],
+            columns=[*keys, "calls", "wall_ns", "cpu_ns", "bytes_allocated", "rows"],
+        )
+        table["wall_ms"] = table["wall_ns"] / 1e6
+        table["cpu_ms"] = table["cpu_ns"] / 1e6
+        return table.sort_values("wall_ns", ascending=False, ignore_index=True)
+
+
+class ChromeTraceCollector(RecordingHook):
+    """
+    Exports records as Chrome trace-event JSON (complete "X" events),
+    viewable in chrome://tracing or Perfetto.
+    """
+
+    def events(self) -> List[Dict[str, Any]]:
+        if not self.records:
+            return []
+        origin = min(record.start.start_ns for record in self.records)
+        pid = os.getpid()
+
+        return [
+            {
+                "name": record.name,
+                "cat": record.start.stage,
+                "ph": "X",
+                "ts": (record.start.start_ns - origin) / 1e3,
+                "dur": record.wall_ns / 1e3,
+                "pid": pid,
+                "tid": record.start.thread_id,
+                "args": {
+                    "column": record.start.column,
+                    "rows": record.start.rows,
+                    "cpu_ms": record.cpu_ns / 1e6,
+                    "bytes_allocated": record.bytes_allocated,
+                },
+            }
+            for record in self.records
+        ]
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events()}, f)
+
+
+class SpanCollector(RecordingHook):
+    """
+    Exports records shaped like OpenTelemetry spans (OTLP JSON field names),
+    so they can be forwarded to an exporter without a hard dependency on the
+    OpenTelemetry SDK.
+    """
+
+    def __init__(self, trace_id: Optional[str] = None) -> None:
+        super().__init__()
+        self.trace_id = trace_id or os.urandom(16).hex()
+
+    def spans(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "traceId": self.trace_id,
+                "spanId": f"{record.start.span_id:016x}",
+                "parentSpanId": (
+                    f"{record.start.parent_id:016x}"
+                    if record.start.parent_id is not None
+                    else ""
+                ),
+                "name": record.name,
+                "startTimeUnixNano": record.start.start_unix_ns,
+                "endTimeUnixNano": record.start.start_unix_ns + record.wall_ns,
+                "attributes": {
+                    "pills.column": record.start.column,
+                    "pills.rows": record.start.rows,
+                    "pills.cpu_ns": record.cpu_ns,
+                    "pills.bytes_allocated": record.bytes_allocated,
+                },
+                "status": (
+                    {"code": "STATUS_CODE_ERROR", "message": record.error}
+                    if record.error
+                    else {"code": "STATUS_CODE_OK"}
+                ),
+            }
+            for record in self.records
+        ]
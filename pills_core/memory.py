@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import copy
+import os
+import sys
+import tempfile
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from pills_core.stats_computer import StatsComputer
+
+if TYPE_CHECKING:
+    from pills_core.config import HardwareConfig
+
+ComputerT = TypeVar("ComputerT", bound=StatsComputer)
+
+# Average resident size of one boxed Python object (pointer + small str/int).
+_OBJECT_ITEM_BYTES = 64
+# Full-length temporaries alive at once while computing stats on a column:
+# the dropna copy, the sorted copy behind quantiles and the hash table
+# behind nunique/mode.
+_STATS_COPIES = 4
+# Sampling below this many rows makes the stats themselves unreliable.
+_MIN_SAMPLE_ROWS = 10_000
+
+
+class MemoryBudgetWarning(RuntimeWarning):
+    """Emitted when an operation is expected to exceed the memory budget."""
+
+
+def estimate_bytes(dtype: object, n_rows: int) -> int:
+    """Footprint of `n_rows` values of `dtype`, without inspecting the data."""
+    if isinstance(dtype, np.dtype):
+        if dtype.kind == "O":
+            return _OBJECT_ITEM_BYTES * n_rows
+        return dtype.itemsize * n_rows
+    itemsize = getattr(dtype, "itemsize", None)
+    if isinstance(itemsize, int) and itemsize > 0:
+        return (itemsize + 1) * n_rows  # masked extension arrays carry a mask
+    return _OBJECT_ITEM_BYTES * n_rows
+
+
+def estimate_frame_bytes(frame: pd.DataFrame) -> int:
+    return sum(estimate_bytes(dtype, len(frame)) for dtype in frame.dtypes)
+
+
+def current_rss() -> int:
+    """Resident set size of this process; the lifetime peak where unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class StageMemory:
+    stage: str
+    peak_bytes: int  # peak traced allocations above the stage's starting point
+
+
+@dataclass
+class _OpenStage:
+    name: str
+    start: int
+    peak: int
+
+
+class MemoryGovernor:
+    """
+    Keeps work under `HardwareConfig.max_memory_mb`.
+
+    Footprints are estimated from dtypes and row counts, never by touching the
+    data. When an operation would not fit in what is left of the budget, the
+    governor degrades it instead: stats are computed on a sample, numeric
+    columns are spilled to memory-mapped temp files, worker counts are capped.
+
+    With `track_peaks`, `stage()` blocks record the peak of traced
+    allocations (NumPy buffers included) through tracemalloc. Tracing slows
+    allocation down, so it is off by default.
+    """
+
+    def __init__(
+        self,
+        hardware: HardwareConfig,
+        headroom: float = 0.8,
+        spill_dir: Optional[str] = None,
+        track_peaks: bool = False,
+    ) -> None:
+        if not 0.0 < headroom <= 1.0:
+            raise ValueError(f"headroom must be in (0, 1], got {headroom}")
+
+        self.hardware = hardware
+        self.headroom = headroom
+        self.spill_dir = spill_dir
+        self.track_peaks = track_peaks
+        self.records: List[StageMemory] = []
+        self._open: List[_OpenStage] = []
+        self._owns_tracing = False
+
+    @property
+    def budget_bytes(self) -> int:
+        return int(self.hardware.max_memory_mb * 2**20 * self.headroom)
+
+    def available_bytes(self) -> int:
+        return max(0, self.budget_bytes - current_rss())
+
+    def fits(self, nbytes: int) -> bool:
+        return nbytes <= self.available_bytes()
+
+    def warn_if_over(self, nbytes: int, operation: str) -> bool:
+        available = self.available_bytes()
+        if nbytes <= available:
+            return False
+        warnings.warn(
+            f"{operation} needs ~{nbytes / 2**20:.0f} MB but only "
+            f"{available / 2**20:.0f} MB of the {self.hardware.max_memory_mb} MB "
+            "budget is left.",
+            MemoryBudgetWarning,
+            stacklevel=3,
+        )
+        return True
+
+    def affordable_rows(self, dtype: object, copies: int = 1) -> int:
+        """Rows of `dtype` that fit in the budget left, `copies` alive at once."""
+        per_row = max(estimate_bytes(dtype, 1) * copies, 1)
+        return self.available_bytes() // per_row
+
+    def sample_rows(self, dtype: object, copies: int = 1) -> int:
+        """
+        `affordable_rows`, raised to the smallest sample whose statistics
+        (stats, drift tests) are still reliable.
+        """
+        return max(self.affordable_rows(dtype, copies), _MIN_SAMPLE_ROWS)
+
+    def plan_computer(self, computer: ComputerT, series: pd.Series) -> ComputerT:
+        """
+        Return `computer`, or a sampling copy of it when computing stats on
+        the whole column would not fit. The sample fits by construction, so
+        it is not chunked as well.
+        """
+        rows = self.sample_rows(series.dtype, _STATS_COPIES)
+        if rows >= len(series):
+            return computer
+
+        planned = copy.copy(computer)
+        if planned.sample_size is None or planned.sample_size > rows:
+            planned.sample_size = rows
+        return planned
+
+    def cap_workers(self, requested: int, per_worker_bytes: int) -> int:
+        if per_worker_bytes <= 0:
+            return requested
+        affordable = self.available_bytes() // per_worker_bytes
+        return max(1, min(requested, int(affordable)))
+
+    def spill(self, series: pd.Series) -> pd.Series:
+        """
+        Move a fixed-width column that does not fit into a memory-mapped temp
+        file, so the OS can page it out. Other columns are returned unchanged.
+        """
+        dtype = series.dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind == "O":
+            return series
+        if self.fits(estimate_bytes(dtype, len(series))) or len(series) == 0:
+            return series
+
+        # The file is unlinked on close; the mapping keeps its pages alive.
+        with tempfile.TemporaryFile(dir=self.spill_dir) as backing:
+            mapped = np.memmap(backing, dtype=dtype, mode="w+", shape=(len(series),))
+        mapped[:] = series.to_numpy()
+        return pd.Series(mapped, index=series.index, name=series.name, copy=False)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.track_peaks:
+            yield
+            return
+
+        if not self._open and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        if self._open:
+            parent = self._open[-1]
+            parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+        current = tracemalloc.get_traced_memory()[0]
+        self._open.append(_OpenStage(name=name, start=current, peak=current))
+        try:
+            yield
+        finally:
+            opened = self._open.pop()
+            peak = max(opened.peak, tracemalloc.get_traced_memory()[1])
+            self.records.append(
+                StageMemory(stage=opened.name, peak_bytes=peak - opened.start)
+            )
+            if self._open:
+                self._open[-1].peak = max(self._open[-1].peak, peak)
+            elif self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+    def peaks(self) -> Dict[str, int]:
+        """Highest peak seen for every stage name."""
+        result: Dict[str, int] = {}
+        for record in self.records:
+            result[record.stage] = max(result.get(record.stage, 0), record.peak_bytes)
+        return result
@@ -1,12 +1,16 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 from pills_core._enums import DriftSeverity
 
+if TYPE_CHECKING:
+    from pills_core.memory import MemoryGovernor
+
 
 @dataclass
 class DriftResult:
@@ -32,10 +36,18 @@ class DriftMonitor:
 
     Uses statistical hypothesis testing (KS / Chi-Square) to detect
     distribution shift, and PSI to quantify its severity.
+
+    With a governor, reference columns that do not fit the memory budget are
+    kept as a random sample of rows, which both tests accept.
     """
 
-    def __init__(self, critical_p_value: float = 0.01) -> None:
+    def __init__(
+        self,
+        critical_p_value: float = 0.01,
+        governor: Optional[MemoryGovernor] = None,
+    ) -> None:
         self.critical_p_value = critical_p_value
+        self.governor = governor
         self.reference_profile: Dict[str, pd.Series] = {}
 
     def _get_reference(self, column_name: str) -> pd.Series:
@@ -49,7 +61,14 @@ class DriftMonitor:
         """
         for column in data.columns:
             if data[column].notna().any():
-                self.reference_profile[column] = data[column].copy()
+                self.reference_profile[column] = self._reference_copy(data[column])
+
+    def _reference_copy(self, series: pd.Series) -> pd.Series:
+        if self.governor is not None:
+            rows = self.governor.sample_rows(series.dtype)
+            if rows < len(series):
+                return series.sample(n=rows, random_state=42)
+        return series.copy()
 
     def check_for_drift(self, column_name: str, current: pd.Series) -> DriftResult:
         reference = self._get_reference(column_name)
@@ -73,11 +92,15 @@ class DriftMonitor:
         )
 
     def _ks_pvalue(self, reference: pd.Series, current: pd.Series) -> float:
+        from scipy import stats
+
         result = stats.ks_2samp(current.dropna(), reference.dropna())
         return float(result.pvalue)  # type: ignore
 
     def _chi2_pvalue(self, reference: pd.Series, current: pd.Series) -> float:
         contingency_table = pd.crosstab(reference, current)
+        from scipy import stats
+
         _, pvalue, _, _ = stats.chi2_contingency(contingency_table)
         return float(pvalue)  # type: ignore
 
@@ -1,49 +1,79 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from pills_core._enums import TransformPhase
+from pills_core.instrumentation import NO_INSTRUMENTATION, Instrumentation
 from pills_core.pipeline.context import ColumnContext
 from pills_core.pipeline.sequence import TransformSequence
-from pills_core.pipeline.step import Step
+from pills_core.pipeline.step import Step, fit_params
 from pills_core.pipeline.trace import PhaseTrace
 from pills_core.stats_computer import StatsComputer
 from pills_core.strategies.base import SingleStrategy
 from pills_core.strategies.registry import StrategyRegistry
 from pills_core.strategies.resolver import resolve_phase_order
+from pills_core.types.stats import BaseColumnStats
+
+if TYPE_CHECKING:
+    from pills_core.memory import MemoryGovernor
 
 
 class PipelineBuilder:
     """
     Builds a frozen TransformSequence for a single column.
+
+    Strategies that read other columns (`needs_frame`) are only candidates
+    when the column is built with the `frame` it belongs to.
+
+    With a governor, intermediate columns that do not fit the memory budget
+    are spilled to memory-mapped files between steps.
     """
 
     def __init__(
         self,
         phase_registries: Dict[TransformPhase, StrategyRegistry],
+        governor: Optional[MemoryGovernor] = None,
     ) -> None:
         self._phase_registries = phase_registries
+        self._governor = governor
 
     def build(
-        self, series: pd.Series, context: ColumnContext, computer: StatsComputer
+        self,
+        series: pd.Series,
+        context: ColumnContext,
+        computer: StatsComputer,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+        frame: Optional[pd.DataFrame] = None,
     ) -> Tuple[TransformSequence, Tuple[PhaseTrace, ...]]:
-        ordered, traces = self._resolve(context)
-        sequence = self._fit_steps(series, ordered, computer)
+        ordered, traces = self._resolve(
+            context, len(series), instrumentation, with_frame=frame is not None
+        )
+        sequence = self._fit_steps(
+            series, ordered, computer, context.stats, instrumentation, frame
+        )
         return sequence, tuple(traces)
 
     def _resolve(
         self,
         context: ColumnContext,
+        rows: int,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+        with_frame: bool = False,
     ) -> Tuple[List[Tuple[TransformPhase, SingleStrategy]], List[PhaseTrace]]:
         selected: Dict[TransformPhase, SingleStrategy] = {}
         traces: List[PhaseTrace] = []
 
         for phase, registry in self._phase_registries.items():
-            candidates = registry.resolve(
-                context.meta, context.embedding, context.stats
-            )
+            if registry.column_type != context.meta.role:
+                continue
+            with instrumentation.stage("resolve", context.name, rows, phase.value):
+                candidates = registry.resolve(
+                    context.meta, context.embedding, context.stats
+                )
+            if not with_frame:
+                candidates = [c for c in candidates if not c[0].needs_frame]
             if candidates:
                 winner = candidates[0][0]
                 selected[phase] = winner
@@ -61,14 +91,33 @@ class PipelineBuilder:
         series: pd.Series,
         ordered: List[Tuple[TransformPhase, SingleStrategy]],
         computer: StatsComputer,
+        initial_stats: BaseColumnStats,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+        frame: Optional[pd.DataFrame] = None,
     ) -> TransformSequence:
         steps: List[Step] = []
-        current = series.copy()
+        current = series  # strategies return new series, the input is never mutated
+        stats = initial_stats  # profiled on the untouched series already
 
-        for phase, strategy in ordered:
-            stats = computer.compute(current)
-            step = Step(phase=phase, strategy=strategy, stats=stats)
+        for index, (phase, strategy) in enumerate(ordered):
+            if index > 0:
+                with instrumentation.stage("compute", series.name, len(current)):
+                    stats = computer.compute(current)
+            with instrumentation.stage("fit", series.name, len(current), strategy.name):
+                params = fit_params(strategy, current, stats, frame)
+            step = Step(phase=phase, strategy=strategy, stats=stats, params=params)
             steps.append(step)
-            current = strategy.apply(current, stats)
+            if index == len(ordered) - 1:
+                break  # only later steps need this step's output
+            if strategy.expands:
+                raise ValueError(
+                    f"'{strategy.name}' expands the column and must be the last step."
+                )
+            with instrumentation.stage(
+                "apply", series.name, len(current), strategy.name
+            ):
+                current = step.apply(current, frame)
+            if self._governor is not None:
+                current = self._governor.spill(current)
 
         return TransformSequence(steps=tuple(steps))
@@ -0,0 +1,46 @@
+"""
+Export fitted sequences for `pills_core.runtime`.
+
+Each step is written as its strategy's runtime op with parameters resolved
+from the fitted stats, so serving needs neither the strategies nor the stats.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping
+
+from pills_core.runtime import FORMAT_VERSION
+
+if TYPE_CHECKING:
+    from pills_core.pipeline.pipeline import FittedColumnArtifact
+    from pills_core.pipeline.sequence import TransformSequence
+
+
+def export_sequence(sequence: TransformSequence) -> List[Dict[str, Any]]:
+    return [
+        {
+            "phase": step.phase.value,
+            "strategy": step.name,
+            **step.strategy.runtime_op(step.stats, step.params),
+        }
+        for step in sequence
+    ]
+
+
+def export_artifacts(artifacts: Mapping[str, FittedColumnArtifact]) -> Dict[str, Any]:
+    """
+    Raises NotImplementedError if a step's strategy has no runtime op.
+    """
+    return {
+        "format_version": FORMAT_VERSION,
+        "columns": {
+            name: {"steps": export_sequence(artifact.sequence)}
+            for name, artifact in artifacts.items()
+        },
+    }
+
+
+def save_artifacts(artifacts: Mapping[str, FittedColumnArtifact], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(export_artifacts(artifacts), f, indent=2)
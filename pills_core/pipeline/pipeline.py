@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Tuple
+from typing import (
+    TYPE_CHECKING,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
 from pills_core._infer_types import TypeInferencer
 from pills_core.analyzers import AnalyzerRegistry
 from pills_core.explain import Explanation
+from pills_core.instrumentation import NO_INSTRUMENTATION, Instrumentation
 from pills_core.pipeline.builder import PipelineBuilder
 from pills_core.pipeline.context import ColumnContext
 from pills_core.pipeline.profiler import ColumnProfiler
 from pills_core.pipeline.sequence import TransformSequence
 from pills_core.pipeline.trace import PhaseTrace
-from pills_core.stats_computer import StatsComputerRegistry
+from pills_core.splitting.spec import SplitSpec
+from pills_core.stats_computer import (
+    FactorizedColumn,
+    StatsComputer,
+    StatsComputerRegistry,
+)
+from pills_core.strategies.base import StepOutput
+from pills_core.types.stats import BaseColumnStats
+
+if TYPE_CHECKING:
+    from pills_core.memory import MemoryGovernor
+
+# Copies of a column block alive at once while profiling it together
+_BLOCK_COPIES = 4
+
+
+def _block_bytes(block: pd.DataFrame) -> int:
+    """
+    Footprint of profiling `block` together: numerical columns as float64
+    copies, the others at their deep size (strings, dictionaries).
+    """
+    numeric = np.array([pd.api.types.is_numeric_dtype(d) for d in block.dtypes])
+    other = block.iloc[:, np.flatnonzero(~numeric)]
+    deep = int(other.memory_usage(deep=True, index=False).sum())
+    return _BLOCK_COPIES * (8 * len(block) * int(numeric.sum()) + deep)
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,39 +67,221 @@ class Pipeline:
         type_inferencer: TypeInferencer,
         computer_registry: StatsComputerRegistry,
         analyzer_registry: AnalyzerRegistry,
+        governor: Optional[MemoryGovernor] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> None:
         self._profiler = profiler
         self._builder = builder
         self._type_inferencer = type_inferencer
         self._computer_registry = computer_registry
         self._analyzer_registry = analyzer_registry
+        self._governor = governor
+        self._instrumentation = instrumentation or NO_INSTRUMENTATION
 
-    def fit(self, series: pd.Series, is_target: bool) -> FittedColumnArtifact:
-        type_profile = self._type_inferencer.infer(series)
+    def fit(
+        self,
+        series: pd.Series,
+        is_target: bool,
+        frame: Optional[pd.DataFrame] = None,
+    ) -> FittedColumnArtifact:
+        """
+        Fit one column. Given the `frame` it belongs to, strategies that read
+        other columns (such as KNN imputation) become candidates too; the
+        column must then be transformed with the same columns at hand.
+        """
+        instrumentation = self._instrumentation
+        with instrumentation.stage("infer", series.name, len(series)):
+            type_profile = self._type_inferencer.infer(series)
 
-        computer = self._computer_registry.get_computer(type_profile)
+        computer = self._plan_computer(
+            self._computer_registry.get_computer(type_profile), series
+        )
         analyzer = self._analyzer_registry.get_analyzer(type_profile)
 
-        context = self._profiler.profile(series, is_target, analyzer, computer)
-        sequence, traces = self._builder.build(series, context, computer)  # later fix
+        with self._stage("profile"):
+            context = self._profiler.profile(
+                series, is_target, analyzer, computer, instrumentation
+            )
+        with self._stage("build"):
+            sequence, traces = self._builder.build(
+                series, context, computer, instrumentation, frame
+            )
 
         return FittedColumnArtifact(context=context, sequence=sequence, traces=traces)
 
+    def fit_frame(
+        self, frame: pd.DataFrame, target: str | None = None
+    ) -> Dict[str, FittedColumnArtifact]:
+        """
+        Fit every column of `frame`. Columns of the same inferred type are
+        profiled together as one block; groups whose block would not fit the
+        governor's budget, or would be sampled, are fitted column by column
+        instead. Strategies
+        that read other columns see `frame` without the target.
+        """
+        instrumentation = self._instrumentation
+        features = frame.drop(columns=target) if target in frame else frame
+        groups: Dict[str, List[str]] = {}
+        profiles = {}
+        for column in frame.columns:
+            with instrumentation.stage("infer", column, len(frame)):
+                type_profile = self._type_inferencer.infer(frame[column])
+            profiles[type_profile.inferred_type] = type_profile
+            groups.setdefault(type_profile.inferred_type, []).append(column)
+
+        fitted: Dict[str, FittedColumnArtifact] = {}
+        for inferred_type, columns in groups.items():
+            block = frame[columns]
+            type_profile = profiles[inferred_type]
+            computer = self._computer_registry.get_computer(type_profile)
+            if not self._fits_as_block(block, computer):
+                for column in columns:
+                    fitted[str(column)] = self.fit(
+                        frame[column], column == target, features
+                    )
+                continue
+
+            analyzer = self._analyzer_registry.get_analyzer(type_profile)
+            with self._stage("profile"):
+                contexts = self._profiler.profile_frame(
+                    block, analyzer, computer, target, instrumentation
+                )
+            for column, context in zip(columns, contexts, strict=True):
+                with self._stage("build"):
+                    sequence, traces = self._builder.build(
+                        frame[column], context, computer, instrumentation, features
+                    )
+                fitted[str(column)] = FittedColumnArtifact(
+                    context=context, sequence=sequence, traces=traces
+                )
+
+        return {str(column): fitted[str(column)] for column in frame.columns}
+
+    def fit_folds(
+        self,
+        frame: pd.DataFrame,
+        spec: SplitSpec,
+        target: str | None = None,
+    ) -> Tuple[Dict[str, FittedColumnArtifact], ...]:
+        """
+        Fit one artifact per column for every training fold of `spec`.
+
+        Type inference runs once per column. When a fold trains on the
+        complement of its validation block, its stats are derived from value
+        counts: the column is factorized once, each validation block is
+        counted once, and the training counts are the total minus the block.
+        """
+        if len(frame) != spec.n_samples:
+            raise ValueError(
+                f"frame has {len(frame)} rows but spec was built "
+                f"for {spec.n_samples} samples."
+            )
+
+        fitted: Tuple[Dict[str, FittedColumnArtifact], ...] = tuple(
+            {} for _ in spec.folds
+        )
+
+        instrumentation = self._instrumentation
+        for column in frame.columns:
+            series = frame[column]
+            with instrumentation.stage("infer", column, len(series)):
+                type_profile = self._type_inferencer.infer(series)
+
+            computer = self._plan_computer(
+                self._computer_registry.get_computer(type_profile), series
+            )
+            analyzer = self._analyzer_registry.get_analyzer(type_profile)
+            is_target = column == target
+
+            for fold_id, train, stats in self._fold_stats(series, spec, computer):
+                with self._stage("profile"):
+                    context = self._profiler.profile_with_stats(
+                        train,
+                        computer.profile_stats(train, stats),
+                        is_target,
+                        analyzer,
+                        instrumentation,
+                    )
+                with self._stage("build"):
+                    sequence, traces = self._builder.build(
+                        train, context, computer, instrumentation
+                    )
+                fitted[fold_id][str(column)] = FittedColumnArtifact(
+                    context=context, sequence=sequence, traces=traces
+                )
+
+        return fitted
+
+    def _fits_as_block(self, block: pd.DataFrame, computer: StatsComputer) -> bool:
+        """
+        Whether `block` fits the budget profiled together, with no column
+        that `_plan_computer` would sample when fitted on its own.
+        """
+        if self._governor is None:
+            return True
+        return self._governor.fits(_block_bytes(block)) and all(
+            self._plan_computer(computer, block.iloc[:, i]) is computer
+            for i in range(block.shape[1])
+        )
+
+    def _plan_computer(
+        self, computer: StatsComputer, series: pd.Series
+    ) -> StatsComputer:
+        if self._governor is None:
+            return computer
+        return self._governor.plan_computer(computer, series)
+
+    def _stage(self, name: str) -> ContextManager[None]:
+        if self._governor is None:
+            return nullcontext()
+        return self._governor.stage(name)
+
+    def _fold_stats(
+        self,
+        series: pd.Series,
+        spec: SplitSpec,
+        computer: StatsComputer,
+    ) -> Iterator[Tuple[int, pd.Series, BaseColumnStats]]:
+        factorized = FactorizedColumn(series) if computer.mergeable else None
+        total = factorized.count() if factorized is not None else None
+
+        for fold_id, fold in enumerate(spec.folds):
+            train = series.iloc[fold.train]
+            is_complement = fold.train_size + fold.val_size == spec.n_samples
+
+            with self._instrumentation.stage("compute", series.name, len(train)):
+                if factorized is not None and total is not None and is_complement:
+                    counts = total - factorized.count(fold.val)
+                    stats = computer.compute_from_counts(train, counts)
+                else:
+                    stats = computer.compute(train)
+
+            yield fold_id, train, stats
+
     def transform(
         self,
         series: pd.Series,
         artifact: FittedColumnArtifact,
-    ) -> pd.Series:
+        frame: Optional[pd.DataFrame] = None,
+    ) -> StepOutput:
         if str(series.name) != artifact.context.name:
             raise ValueError(
                 f"transform received stats '{series.name}' but artifact"
                 f"was fitted on column '{artifact.context.name}'."
             )
-        return artifact.sequence.apply(series)
+        return artifact.sequence.apply(series, self._instrumentation, frame)
+
+    def inverse_transform(
+        self,
+        values: Union[pd.Series, np.ndarray],
+        artifact: FittedColumnArtifact,
+    ) -> Union[pd.Series, np.ndarray]:
+        """Map transformed values (e.g. predictions) back to the column's scale."""
+        return artifact.sequence.inverse_apply(values, self._instrumentation)
 
     def fit_transform(
         self, series: pd.Series, is_target: bool
-    ) -> Tuple[FittedColumnArtifact, pd.Series]:
+    ) -> Tuple[FittedColumnArtifact, StepOutput]:
         artifact = self.fit(series, is_target)
         result = self.transform(series, artifact)
         return artifact, result
@@ -1,8 +1,12 @@
+from typing import List, Optional
+
 import pandas as pd
 
 from pills_core.analyzers import ColumnAnalyzer
+from pills_core.instrumentation import NO_INSTRUMENTATION, Instrumentation
 from pills_core.pipeline.context import ColumnContext
 from pills_core.stats_computer import StatsComputer
+from pills_core.types.stats import BaseColumnStats
 
 
 class ColumnProfiler:
@@ -14,9 +18,53 @@ class ColumnProfiler:
         is_target: bool,
         analyzer: ColumnAnalyzer,
         computer: StatsComputer,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+    ) -> ColumnContext:
+        with instrumentation.stage("compute", series.name, len(series)):
+            stats = computer.profile_stats(series, computer.compute(series))
+        return self.profile_with_stats(
+            series, stats, is_target, analyzer, instrumentation
+        )
+
+    def profile_frame(
+        self,
+        frame: pd.DataFrame,
+        analyzer: ColumnAnalyzer,
+        computer: StatsComputer,
+        target: Optional[str] = None,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+    ) -> List[ColumnContext]:
+        """
+        Profile columns sharing one analyzer and computer, with the stats of
+        all of them in one `computer.compute_table` call and their
+        rule decisions from one columnar pass.
+        """
+        with instrumentation.stage(
+            "compute", f"<{frame.shape[1]} columns>", len(frame)
+        ):
+            table = computer.compute_table(frame)
+            profiled = [
+                computer.profile_stats(frame[column], stats)
+                for column, stats in zip(frame.columns, table, strict=True)
+            ]
+        analyzer.prime_decisions(table)
+        return [
+            self.profile_with_stats(
+                frame[column], stats, column == target, analyzer, instrumentation
+            )
+            for column, stats in zip(frame.columns, profiled, strict=True)
+        ]
+
+    def profile_with_stats(
+        self,
+        series: pd.Series,
+        stats: BaseColumnStats,
+        is_target: bool,
+        analyzer: ColumnAnalyzer,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
     ) -> ColumnContext:
-        stats = computer.compute(series)
-        meta = analyzer.build_meta(series, stats, is_target)
+        with instrumentation.stage("build_meta", series.name, len(series)):
+            meta = analyzer.build_meta(series, stats, is_target, analyzer.column_role)
         embedding = analyzer.build_column_embedding(stats, meta)
 
         return ColumnContext(
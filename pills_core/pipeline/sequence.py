@@ -1,21 +1,61 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterator, Tuple
+from typing import Iterator, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from pills_core.instrumentation import NO_INSTRUMENTATION, Instrumentation
 from pills_core.pipeline.step import Step
+from pills_core.strategies.base import StepOutput
 
 
 @dataclass
 class TransformSequence:
     steps: Tuple[Step, ...]
 
-    def apply(self, series: pd.Series) -> pd.Series:
+    def apply(
+        self,
+        series: pd.Series,
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+        frame: Optional[pd.DataFrame] = None,
+    ) -> StepOutput:
+        """
+        The transformed column, or its expansion if the last step expands.
+        Steps that read other columns (`needs_frame`) take them from `frame`.
+        """
         result = series.copy()
         for step in self.steps:
-            result = step.apply(result)
+            with instrumentation.stage("apply", series.name, len(result), step.name):
+                result = step.apply(result, frame)
+        return result
+
+    def inverse_apply(
+        self,
+        values: Union[pd.Series, np.ndarray],
+        instrumentation: Instrumentation = NO_INSTRUMENTATION,
+    ) -> Union[pd.Series, np.ndarray]:
+        """
+        Undo the steps, last first, on a single float64 copy of `values`.
+        A Series comes back as a Series; anything else as an array.
+        Raises ValueError if any step is not invertible.
+        """
+        blocked = [step.name for step in self.steps if not step.strategy.is_invertible]
+        if blocked:
+            raise ValueError(f"{self!r} cannot be inverted: {blocked} not invertible.")
+        kernels = [
+            step.strategy.inverse_kernel(step.stats, step.params)
+            for step in reversed(self.steps)
+        ]
+
+        result = np.array(values, dtype=np.float64)
+        name = getattr(values, "name", None)
+        with instrumentation.stage("inverse", name, len(result)):
+            for kernel in kernels:
+                kernel(result)
+        if isinstance(values, pd.Series):
+            return pd.Series(result, index=values.index, name=name)
         return result
 
     def __iter__(self) -> Iterator[Step]:
@@ -1,22 +1,49 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 import pandas as pd
 
 from pills_core._enums import TransformPhase
-from pills_core.strategies.base import SingleStrategy
+from pills_core.strategies.base import (
+    FittedParams,
+    SingleStrategy,
+    StepOutput,
+    frame_required,
+)
 from pills_core.types.stats import BaseColumnStats
 
 
+def fit_params(
+    strategy: SingleStrategy,
+    data: pd.Series,
+    stats: BaseColumnStats,
+    frame: Optional[pd.DataFrame] = None,
+) -> FittedParams:
+    """`strategy` fitted on `data`, through `fit_frame` if it reads other columns."""
+    if not strategy.needs_frame:
+        return strategy.fit(data, stats)
+    if frame is None:
+        raise frame_required(strategy)
+    return strategy.fit_frame(data, frame, stats)
+
+
 @dataclass(frozen=True, slots=True)
 class Step:
     phase: TransformPhase
     strategy: SingleStrategy
     stats: BaseColumnStats
-
-    def apply(self, data: pd.Series) -> pd.Series:
-        return self.strategy.apply(data, self.stats)
+    params: FittedParams = field(default_factory=dict)
+
+    def apply(
+        self, data: pd.Series, frame: Optional[pd.DataFrame] = None
+    ) -> StepOutput:
+        if not self.strategy.needs_frame:
+            return self.strategy.apply_fitted(data, self.stats, self.params)
+        if frame is None:
+            raise frame_required(self.strategy)
+        return self.strategy.apply_frame(data, frame, self.stats, self.params)
 
     @property
     def name(self) -> str:
@@ -1,7 +1,23 @@
 from __future__ import annotations
 
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Generic, TypeVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import numpy as np
 
 from pills_core.exceptions import UnknownDomainTagError
 from pills_core.explain import Explanation
@@ -13,6 +29,15 @@ ContextT = TypeVar("ContextT")
 _DOMAIN_TAG_FIELDS: frozenset[str] = frozenset(
     {"is_ratio", "is_monetary", "is_rate", "is_score", "is_count"}
 )
+# Bit i of a tag mask is the i-th field here
+_DOMAIN_TAG_ORDER: tuple[str, ...] = (
+    "is_ratio",
+    "is_monetary",
+    "is_rate",
+    "is_score",
+    "is_count",
+)
+_NAME_CACHE_LIMIT = 65_536
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,6 +76,17 @@ class DomainTags:
             is_count=self.is_count or other.is_count,
         )
 
+    def to_mask(self) -> int:
+        return sum(
+            1 << bit
+            for bit, name in enumerate(_DOMAIN_TAG_ORDER)
+            if getattr(self, name)
+        )
+
+    @staticmethod
+    def from_mask(mask: int) -> "DomainTags":
+        return _tags_from_mask(mask)
+
     def any_set(self) -> bool:
         return any(
             (
@@ -63,6 +99,67 @@ class DomainTags:
         )
 
 
+@lru_cache(maxsize=1 << len(_DOMAIN_TAG_ORDER))
+def _tags_from_mask(mask: int) -> DomainTags:
+    return DomainTags(
+        **{name: bool(mask >> bit & 1) for bit, name in enumerate(_DOMAIN_TAG_ORDER)}
+    )
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over keywords that each carry a bitmask. `match`
+    ORs the masks of every keyword occurring in a text, overlapping ones
+    included, in a single pass whatever the number of keywords.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out")
+
+    def __init__(self, keywords: Iterable[Tuple[str, int]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[int] = [0]
+        for keyword, mask in keywords:
+            state = 0
+            for char in keyword:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = goto[state][char] = len(goto)
+                    goto.append({})
+                    out.append(0)
+                state = nxt
+            out[state] |= mask  # the root's mask comes from empty keywords
+
+        # Breadth-first, so a state's fail target is final before its own
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state] |= out[fail[state]]
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                if state == 0:
+                    continue
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                fail[nxt] = goto[target].get(char, 0)
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def match(self, text: str) -> int:
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        mask = out[0]
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            mask |= out[state]
+        return mask
+
+
 @dataclass(frozen=True, slots=True)
 class DomainRule:
     name: str
@@ -76,13 +173,32 @@ class DomainRule:
 
 @dataclass(frozen=True, slots=True)
 class DomainPolicy:
+    """
+    Tags a column name with the union of the tags of every rule having a
+    keyword in it. All keywords are compiled into one automaton, and
+    results are cached per name since names repeat across fits and folds.
+    """
+
     rules: tuple[DomainRule, ...]
+    _automaton: KeywordAutomaton = field(init=False, repr=False, compare=False)
+    _cache: Dict[str, DomainTags] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        automaton = KeywordAutomaton(
+            (keyword, rule.tags.to_mask())
+            for rule in self.rules
+            for keyword in rule.keywords
+        )
+        object.__setattr__(self, "_automaton", automaton)
+        object.__setattr__(self, "_cache", {})
 
     def resolve(self, column_name: str) -> DomainTags:
-        tags = DomainTags()
-        for rule in self.rules:
-            if rule.matches(column_name):
-                tags = tags.merge(rule.tags)
+        tags = self._cache.get(column_name)
+        if tags is None:
+            if len(self._cache) >= _NAME_CACHE_LIMIT:
+                self._cache.clear()
+            tags = _tags_from_mask(self._automaton.match(column_name.lower()))
+            self._cache[column_name] = tags
         return tags
 
 
@@ -92,6 +208,8 @@ class MatchRule(Generic[ContextT, ValueT]):
     value: ValueT
     predicate: Callable[[ContextT], bool]
     reason_builder: Callable[[ContextT], tuple[str, ...]]
+    # Same test over struct-of-arrays columns, one element per context
+    columnar: Optional[Callable[[Any], Any]] = None
 
     def evaluate(self, context: ContextT) -> Decision[ValueT] | None:
         if not self.predicate(context):
@@ -111,3 +229,62 @@ class MatchPolicy(Generic[ContextT, ValueT]):
             if decision is not None:
                 return decision
         return Decision(value=self.fallback_value, reasons=self.fallback_reasons)
+
+    def resolve_many(
+        self, contexts: Sequence[ContextT], columns: Any = None
+    ) -> List[Decision[ValueT]]:
+        """
+        First-match decisions for many contexts at once. Rules with a
+        `columnar` predicate test every undecided context in one call on
+        `columns` (attribute arrays aligned with `contexts`); the others
+        fall back to `predicate` per context. Reasons are built only for
+        the rule each context matched.
+        """
+        n = len(contexts)
+        decisions: List[Optional[Decision[ValueT]]] = [None] * n
+        undecided = np.ones(n, dtype=bool)
+
+        for rule in self.rules:
+            if not undecided.any():
+                break
+            if rule.columnar is not None and columns is not None:
+                mask = np.broadcast_to(np.asarray(rule.columnar(columns), bool), n)
+                hits = undecided & mask
+            else:
+                hits = np.zeros(n, dtype=bool)
+                for i in np.flatnonzero(undecided):
+                    hits[i] = rule.predicate(contexts[i])
+            for i in np.flatnonzero(hits):
+                decisions[i] = Decision(
+                    value=rule.value, reasons=rule.reason_builder(contexts[i])
+                )
+            undecided &= ~hits
+
+        fallback = Decision(value=self.fallback_value, reasons=self.fallback_reasons)
+        return [fallback if decision is None else decision for decision in decisions]
+
+
+class DecisionCache(Generic[ValueT]):
+    """
+    Decisions keyed by the identity of the object they were derived from.
+    An entry lives as long as its key object; mutating that object after
+    its decision is cached is not detected.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Decision[ValueT]] = {}
+
+    def get(self, key: object) -> Optional[Decision[ValueT]]:
+        return self._entries.get(id(key))
+
+    def put(self, key: object, decision: Decision[ValueT]) -> Decision[ValueT]:
+        key_id = id(key)
+        if key_id not in self._entries:
+            weakref.finalize(key, self._entries.pop, key_id, None)
+        self._entries[key_id] = decision
+        return decision
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,198 @@
+"""
+Transform-only runtime for serving fitted pipelines.
+
+Applies sequences exported by `pills_core.pipeline.export` using NumPy alone:
+strategies, stats, analyzers, settings and their dependencies are never
+imported. pandas is optional; a Series or DataFrame passed in comes back as
+the same type, anything else comes back as NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+Kernel = Callable[[np.ndarray, Mapping[str, Any]], np.ndarray]
+
+
+def _is_missing(value: Any) -> bool:
+    try:
+        return value is None or bool(value != value)
+    except TypeError:  # pandas.NA refuses truthiness
+        return True
+
+
+def _missing(values: np.ndarray) -> np.ndarray:
+    kind = values.dtype.kind
+    if kind in "fc":
+        return np.isnan(values)
+    if kind in "mM":
+        return np.isnat(values)
+    if kind == "O":
+        return np.fromiter(
+            (_is_missing(value) for value in values), dtype=bool, count=len(values)
+        )
+    return np.zeros(len(values), dtype=bool)
+
+
+def _as_float(values: np.ndarray) -> np.ndarray:
+    return values.astype(np.float64, copy=False)
+
+
+def _fill(values: np.ndarray, params: Mapping[str, Any]) -> np.ndarray:
+    mask = _missing(values)
+    if not mask.any():
+        return values
+    result = values.copy()
+    result[mask] = params["value"]
+    return result
+
+
+def _ffill(values: np.ndarray, params: Mapping[str, Any]) -> np.ndarray:
+    mask = _missing(values)
+    if not mask.any():
+        return values
+    # Index of the last valid position at or before each row; leading gaps
+    # point at row 0, which is itself missing, so they stay missing.
+    index = np.where(mask, 0, np.arange(len(values)))
+    np.maximum.accumulate(index, out=index)
+    return values[index]
+
+
+def _bfill(values: np.ndarray, params: Mapping[str, Any]) -> np.ndarray:
+    return _ffill(values[::-1], params)[::-1]
+
+
+def box_cox(values: np.ndarray, lmbda: float, shift: float = 0.0) -> np.ndarray:
+    """Box-Cox power transform of `values + shift`; NaN where that is <= 0."""
+    shifted = _as_float(values) + shift
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logs = np.log(np.where(shifted > 0, shifted, np.nan))
+        if lmbda == 0:
+            return logs
+        return np.expm1(lmbda * logs) / lmbda
+
+
+def yeo_johnson(values: np.ndarray, lmbda: float) -> np.ndarray:
+    """Yeo-Johnson power transform; defined for every real value."""
+    values = _as_float(values)
+    result = np.full(values.shape, np.nan)
+    positive = values >= 0
+    negative = values < 0  # NaN is neither
+    up = np.log1p(values[positive])
+    down = np.log1p(-values[negative])
+    result[positive] = up if lmbda == 0 else np.expm1(lmbda * up) / lmbda
+    if lmbda == 2:
+        result[negative] = -down
+    else:
+        result[negative] = -np.expm1((2 - lmbda) * down) / (2 - lmbda)
+    return result
+
+
+_KERNELS: Dict[str, Kernel] = {
+    "identity": lambda values, params: values,
+    "fill": _fill,
+    "ffill": _ffill,
+    "bfill": _bfill,
+    "clip": lambda values, params: np.clip(
+        _as_float(values), params["lower"], params["upper"]
+    ),
+    "affine": lambda values, params: (
+        (_as_float(values) - params["center"]) / params["scale"]
+    ),
+    "log1p": lambda values, params: np.log1p(_as_float(values)),
+    "sqrt": lambda values, params: np.sqrt(_as_float(values)),
+    "box_cox": lambda values, params: box_cox(
+        values, params["lambda"], params["shift"]
+    ),
+    "yeo_johnson": lambda values, params: yeo_johnson(values, params["lambda"]),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeStep:
+    op: str
+    params: Mapping[str, Any]
+    phase: str = ""
+    strategy: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "RuntimeStep":
+        params = dict(data)
+        op = params.pop("op")
+        if op not in _KERNELS:
+            raise ValueError(f"Unknown runtime op '{op}'. Known: {sorted(_KERNELS)}")
+        phase = params.pop("phase", "")
+        strategy = params.pop("strategy", "")
+        return cls(op=op, params=params, phase=phase, strategy=strategy)
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        return _KERNELS[self.op](values, self.params)
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeSequence:
+    steps: Tuple[RuntimeStep, ...]
+
+    @classmethod
+    def from_dict(cls, steps: List[Mapping[str, Any]]) -> "RuntimeSequence":
+        return cls(tuple(RuntimeStep.from_dict(step) for step in steps))
+
+    def apply(self, values: Any) -> Any:
+        result = np.asarray(values)
+        if result.ndim != 1:
+            raise ValueError(f"expected a 1-D column, got shape {result.shape}")
+        for step in self.steps:
+            result = step.apply(result)
+        if hasattr(values, "index") and hasattr(values, "name"):  # pandas Series
+            return type(values)(result, index=values.index, name=values.name)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeModel:
+    columns: Mapping[str, RuntimeSequence]
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "RuntimeModel":
+        version = payload.get("format_version")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported artifact format_version {version!r}; "
+                f"this runtime reads version {FORMAT_VERSION}."
+            )
+        return cls(
+            {
+                name: RuntimeSequence.from_dict(column["steps"])
+                for name, column in payload["columns"].items()
+            }
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RuntimeModel":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def transform(self, data: Any) -> Any:
+        """
+        Transform every fitted column of `data` (a DataFrame or a mapping of
+        column name to values). Other columns pass through untouched.
+        """
+        missing = [name for name in self.columns if name not in data]
+        if missing:
+            raise ValueError(f"transform input is missing fitted columns {missing}")
+
+        result = {name: data[name] for name in data}
+        for name, sequence in self.columns.items():
+            result[name] = sequence.apply(data[name])
+        if hasattr(data, "columns") and hasattr(data, "index"):  # pandas DataFrame
+            return type(data)(result, index=data.index)
+        return result
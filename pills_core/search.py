@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import optuna
+import pandas as pd
+from optuna.storages.journal import JournalFileBackend, JournalStorage
+
+from pills_core._enums import TransformPhase
+from pills_core._infer_types import TypeInferencer
+from pills_core.analyzers import AnalyzerRegistry
+from pills_core.config import HardwareConfig, TrainingConfig
+from pills_core.memory import MemoryGovernor, estimate_frame_bytes
+from pills_core.pipeline.context import ColumnContext
+from pills_core.pipeline.profiler import ColumnProfiler
+from pills_core.pipeline.sequence import TransformSequence
+from pills_core.pipeline.step import Step, fit_params
+from pills_core.shared_frame import SharedFrame, SharedFrameHandle
+from pills_core.splitting.spec import AnyFold, SplitSpec
+from pills_core.stats_computer import StatsComputer, StatsComputerRegistry
+from pills_core.strategies.base import SingleStrategy
+from pills_core.strategies.registry import StrategyRegistry
+from pills_core.strategies.resolver import resolve_phase_order
+
+ScoreFn = Callable[[pd.DataFrame, pd.DataFrame, AnyFold], float]
+ColumnSpace = Dict[TransformPhase, List[str]]
+Prefix = Tuple[Tuple[TransformPhase, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnCandidate:
+    context: ColumnContext
+    computer: StatsComputer
+    space: ColumnSpace
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    best_score: float
+    best_params: Dict[Hashable, Dict[TransformPhase, str]]
+    study: optuna.Study
+
+
+class StepCache:
+    """
+    Fitted steps keyed by (column, fold, strategy prefix).
+
+    A step's stats depend only on the training data and on the steps applied
+    before it, so trials sharing a prefix reuse its fitted steps verbatim.
+    Safe to share between trial threads; two threads missing the same key at
+    once both fit it, which costs time but never correctness.
+    """
+
+    def __init__(self) -> None:
+        self._steps: Dict[Tuple[Hashable, int, Prefix], Step] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fit_sequence(
+        self,
+        column: Hashable,
+        fold_id: int,
+        train: pd.Series,
+        ordered: List[Tuple[TransformPhase, SingleStrategy]],
+        computer: StatsComputer,
+        frame: Optional[pd.DataFrame] = None,
+    ) -> Tuple[TransformSequence, pd.Series]:
+        steps: List[Step] = []
+        current = train
+        prefix: Prefix = ()
+
+        for phase, strategy in ordered:
+            prefix = (*prefix, (phase, strategy.name))
+            key = (column, fold_id, prefix)
+
+            with self._lock:
+                step = self._steps.get(key)
+                if step is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+
+            if step is None:
+                stats = computer.compute(current)
+                step = Step(
+                    phase=phase,
+                    strategy=strategy,
+                    stats=stats,
+                    params=fit_params(strategy, current, stats, frame),
+                )
+                with self._lock:
+                    self._steps[key] = step
+
+            steps.append(step)
+            current = step.apply(current, frame)
+
+        return TransformSequence(steps=tuple(steps)), current
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+
+class TrialRunner:
+    """
+    The work of one trial: sample a strategy per column and phase, fit the
+    sequences on every training fold and score them. Holds no frame, so worker
+    processes rebuild it from the same registries and candidates.
+    """
+
+    def __init__(
+        self,
+        phase_registries: Dict[TransformPhase, StrategyRegistry],
+        candidates: Dict[Hashable, ColumnCandidate],
+        cache: Optional[StepCache] = None,
+    ) -> None:
+        self.phase_registries = phase_registries
+        self.candidates = candidates
+        self.cache = cache if cache is not None else StepCache()
+
+    def objective(
+        self,
+        trial: optuna.Trial,
+        frame: pd.DataFrame,
+        spec: SplitSpec,
+        scorer: ScoreFn,
+    ) -> float:
+        chosen = {
+            column: {
+                phase: trial.suggest_categorical(_param_name(column, phase), names)
+                for phase, names in candidate.space.items()
+            }
+            for column, candidate in self.candidates.items()
+        }
+
+        scores: List[float] = []
+        for fold_id, fold in enumerate(spec.folds):
+            train, val = self._transform_fold(frame, fold, fold_id, chosen)
+            scores.append(float(scorer(train, val, fold)))
+
+            trial.report(sum(scores) / len(scores), step=fold_id)
+            if trial.should_prune():
+                raise optuna.TrialPruned()
+
+        return sum(scores) / len(scores)
+
+    def _transform_fold(
+        self,
+        frame: pd.DataFrame,
+        fold: AnyFold,
+        fold_id: int,
+        chosen: Dict[Hashable, Dict[TransformPhase, str]],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        train_frame = frame.iloc[fold.train]
+        val_frame = frame.iloc[fold.val]
+        train_columns: Dict[Hashable, pd.Series] = {}
+        val_columns: Dict[Hashable, pd.Series] = {}
+
+        for column, selection in chosen.items():
+            train = train_frame[column]
+            val = val_frame[column]
+
+            strategies = {
+                phase: self._strategy(phase, name) for phase, name in selection.items()
+            }
+            if strategies:
+                ordered = [
+                    (phase, strategies[phase])
+                    for phase in resolve_phase_order(*strategies.values())
+                ]
+                sequence, train = self.cache.fit_sequence(
+                    column,
+                    fold_id,
+                    train,
+                    ordered,
+                    self.candidates[column].computer,
+                    train_frame,
+                )
+                val = sequence.apply(val, frame=val_frame)
+
+            train_columns[column] = train
+            val_columns[column] = val
+
+        return pd.DataFrame(train_columns), pd.DataFrame(val_columns)
+
+    def _strategy(self, phase: TransformPhase, name: str) -> SingleStrategy:
+        for strategy in self.phase_registries[phase].strategies:
+            if strategy.name == name:
+                return strategy
+        raise KeyError(f"Strategy '{name}' not registered for phase {phase}.")
+
+
+class StrategySearch:
+    """
+    Optuna search over per-column strategy choices.
+
+    The space of every column is the union of its phase registries'
+    `get_search_space`, so only strategies that pass the registry's validity
+    checks are ever sampled. Strategies that expand a column (encoders,
+    date features) are not searched. Each trial fits the chosen sequences on every
+    training fold, scores them with a user callback and reports the running
+    mean to Optuna so unpromising trials are pruned early.
+
+    Trials run on `n_jobs` threads. Given a `storage` (an SQLAlchemy URL such
+    as ``sqlite:///search.db`` or a journal file path), the study is instead
+    shared by `HardwareConfig.cpu_limit` worker processes that read the frame
+    from shared memory. Worker processes receive the scorer by pickle on
+    platforms that spawn rather than fork, so it must then be importable.
+    Concurrent trials each hold transformed fold copies, so their number is
+    capped by the memory governor (one for `hardware` by default).
+    """
+
+    def __init__(
+        self,
+        profiler: ColumnProfiler,
+        phase_registries: Dict[TransformPhase, StrategyRegistry],
+        type_inferencer: TypeInferencer,
+        computer_registry: StatsComputerRegistry,
+        analyzer_registry: AnalyzerRegistry,
+        config: TrainingConfig,
+        direction: str = "maximize",
+        pruner: Optional[optuna.pruners.BasePruner] = None,
+        sampler: Optional[optuna.samplers.BaseSampler] = None,
+        hardware: Optional[HardwareConfig] = None,
+        governor: Optional[MemoryGovernor] = None,
+    ) -> None:
+        self._profiler = profiler
+        self._phase_registries = phase_registries
+        self._type_inferencer = type_inferencer
+        self._computer_registry = computer_registry
+        self._analyzer_registry = analyzer_registry
+        self.config = config
+        self.hardware = hardware or HardwareConfig()
+        self.governor = governor or MemoryGovernor(self.hardware)
+        self.direction = direction
+        self.pruner = pruner or optuna.pruners.MedianPruner()
+        self.sampler = sampler or optuna.samplers.TPESampler(seed=config.random_state)
+        self._seed_per_worker = sampler is None
+        self.cache = StepCache()  # the last run's, replaced by every run
+
+    def build_candidates(self, frame: pd.DataFrame) -> Dict[Hashable, ColumnCandidate]:
+        candidates: Dict[Hashable, ColumnCandidate] = {}
+
+        for column in frame.columns:
+            series = frame[column]
+            type_profile = self._type_inferencer.infer(series)
+            computer = self._computer_registry.get_computer(type_profile)
+            analyzer = self._analyzer_registry.get_analyzer(type_profile)
+            context = self._profiler.profile(series, False, analyzer, computer)
+
+            space: ColumnSpace = {}
+            for phase, registry in self._phase_registries.items():
+                if registry.column_type != context.meta.role:
+                    continue
+                names = registry.get_search_space(
+                    context.meta, context.embedding, context.stats
+                )[phase.value]
+                # Expanding strategies turn a column into a block; trials
+                # score one column per column, so they are left to the builder
+                expanding = {s.name for s in registry.strategies if s.expands}
+                names = [name for name in names if name not in expanding]
+                if names:
+                    space[phase] = names
+
+            candidates[column] = ColumnCandidate(
+                context=context, computer=computer, space=space
+            )
+
+        return candidates
+
+    def run(
+        self,
+        frame: pd.DataFrame,
+        spec: SplitSpec,
+        scorer: ScoreFn,
+        n_trials: Optional[int] = None,
+        n_jobs: int = 1,
+        storage: Optional[str] = None,
+    ) -> SearchResult:
+        if len(frame) != spec.n_samples:
+            raise ValueError(
+                f"frame has {len(frame)} rows but spec was built "
+                f"for {spec.n_samples} samples."
+            )
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be >= 1, got {n_jobs}")
+
+        # A trial holds its fold slices and their transformed copies.
+        trial_bytes = 2 * estimate_frame_bytes(frame)
+        n_jobs = self.governor.cap_workers(n_jobs, trial_bytes)
+
+        candidates = self.build_candidates(frame)
+        self.cache = StepCache()  # steps fitted on another frame never apply
+        with self.governor.stage("search"):
+            if storage is None:
+                study = self._run_threads(
+                    frame, spec, scorer, candidates, n_trials, n_jobs
+                )
+            else:
+                n_workers = self.governor.cap_workers(
+                    self.n_workers, trial_bytes * n_jobs
+                )
+                study = self._run_processes(
+                    frame,
+                    spec,
+                    scorer,
+                    candidates,
+                    n_trials,
+                    n_jobs,
+                    n_workers,
+                    storage,
+                )
+
+        return SearchResult(
+            best_score=float(study.best_value),
+            best_params=self._decode_params(study.best_params, candidates),
+            study=study,
+        )
+
+    def _run_threads(
+        self,
+        frame: pd.DataFrame,
+        spec: SplitSpec,
+        scorer: ScoreFn,
+        candidates: Dict[Hashable, ColumnCandidate],
+        n_trials: Optional[int],
+        n_jobs: int,
+    ) -> optuna.Study:
+        runner = TrialRunner(self._phase_registries, candidates, self.cache)
+        study = optuna.create_study(
+            direction=self.direction, sampler=self.sampler, pruner=self.pruner
+        )
+        study.optimize(
+            lambda trial: runner.objective(trial, frame, spec, scorer),
+            n_trials=n_trials,
+            timeout=self.config.timeout,
+            n_jobs=n_jobs,
+        )
+        return study
+
+    def _run_processes(
+        self,
+        frame: pd.DataFrame,
+        spec: SplitSpec,
+        scorer: ScoreFn,
+        candidates: Dict[Hashable, ColumnCandidate],
+        n_trials: Optional[int],
+        n_jobs: int,
+        n_workers: int,
+        storage: str,
+    ) -> optuna.Study:
+        study = optuna.create_study(
+            storage=_open_storage(storage),
+            study_name=f"pills-search-{uuid.uuid4().hex}",
+            direction=self.direction,
+            sampler=self.sampler,
+            pruner=self.pruner,
+        )
+
+        if n_trials is not None:
+            n_workers = max(1, min(n_workers, n_trials))
+
+        context = multiprocessing.get_context()
+        with SharedFrame(frame) as shared:
+            workers = [
+                context.Process(
+                    target=_run_worker,
+                    args=(
+                        _WorkerTask(
+                            phase_registries=self._phase_registries,
+                            candidates=candidates,
+                            frame=shared.handle,
+                            spec=spec,
+                            scorer=scorer,
+                            storage=storage,
+                            study_name=study.study_name,
+                            sampler=self._worker_sampler(worker_id),
+                            pruner=self.pruner,
+                            n_trials=n_trials,
+                            timeout=self.config.timeout,
+                            n_jobs=n_jobs,
+                        ),
+                    ),
+                )
+                for worker_id in range(n_workers)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        failed = [worker.exitcode for worker in workers if worker.exitcode != 0]
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {n_workers} search workers failed "
+                f"(exit codes {failed})."
+            )
+        return study
+
+    @property
+    def n_workers(self) -> int:
+        if self.hardware.cpu_limit > 0:
+            return self.hardware.cpu_limit
+        return os.cpu_count() or 1
+
+    def _worker_sampler(self, worker_id: int) -> optuna.samplers.BaseSampler:
+        # Identically seeded workers would sample the same first trials.
+        if self._seed_per_worker:
+            return optuna.samplers.TPESampler(seed=self.config.random_state + worker_id)
+        return self.sampler
+
+    @staticmethod
+    def _decode_params(
+        params: Dict[str, str], candidates: Dict[Hashable, ColumnCandidate]
+    ) -> Dict[Hashable, Dict[TransformPhase, str]]:
+        return {
+            column: {
+                phase: params[_param_name(column, phase)] for phase in candidate.space
+            }
+            for column, candidate in candidates.items()
+        }
+
+
+def _param_name(column: Hashable, phase: TransformPhase) -> str:
+    return f"{column}__{phase.value}"
+
+
+def _open_storage(storage: str) -> optuna.storages.BaseStorage:
+    if "://" in storage:
+        return optuna.storages.RDBStorage(storage)
+    return JournalStorage(JournalFileBackend(storage))
+
+
+@dataclass(frozen=True, slots=True)
+class _WorkerTask:
+    phase_registries: Dict[TransformPhase, StrategyRegistry]
+    candidates: Dict[Hashable, ColumnCandidate]
+    frame: SharedFrameHandle
+    spec: SplitSpec
+    scorer: ScoreFn
+    storage: str
+    study_name: str
+    sampler: optuna.samplers.BaseSampler
+    pruner: optuna.pruners.BasePruner
+    n_trials: Optional[int]
+    timeout: int
+    n_jobs: int
+
+
+def _run_worker(task: _WorkerTask) -> None:
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=task.study_name,
+        storage=_open_storage(task.storage),
+        sampler=task.sampler,
+        pruner=task.pruner,
+    )
+    # Workers pull trials until the study as a whole reaches n_trials.
+    callbacks = []
+    if task.n_trials is not None:
+        callbacks.append(optuna.study.MaxTrialsCallback(task.n_trials, states=None))
+
+    runner = TrialRunner(task.phase_registries, task.candidates)
+    with task.frame.attach() as attached:
+        study.optimize(
+            lambda trial: runner.objective(
+                trial, attached.frame, task.spec, task.scorer
+            ),
+            n_trials=task.n_trials,
+            timeout=task.timeout,
+            n_jobs=task.n_jobs,
+            callbacks=callbacks,
+        )
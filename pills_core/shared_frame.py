@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, take
+
+ArrayLike = Union[np.ndarray, ExtensionArray]
+
+
+@dataclass(frozen=True, slots=True)
+class SharedColumn:
+    """
+    Where one column lives in shared memory.
+
+    Fixed-width NumPy columns are stored as-is. Anything else is factorized:
+    the integer codes go to shared memory, the uniques (keeping their dtype)
+    travel with the handle.
+    """
+
+    name: Hashable
+    block: str
+    dtype: str
+    uniques: Optional[ArrayLike] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SharedFrameHandle:
+    """
+    Picklable description of a SharedFrame, cheap to send to workers. The
+    column labels travel as they are; a RangeIndex or MultiIndex travels
+    with the handle, any other index is shared like a column.
+    """
+
+    n_rows: int
+    columns: Tuple[SharedColumn, ...]
+    labels: pd.Index
+    index: Union[pd.Index, SharedColumn]
+
+    def attach(self) -> "AttachedFrame":
+        return AttachedFrame(self)
+
+
+def _is_fixed_width(series: pd.Series) -> bool:
+    dtype = series.dtype
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+
+class SharedFrame:
+    """
+    Copy of a DataFrame's columns in named shared-memory blocks.
+
+    The owner creates the blocks once; worker processes attach by name through
+    the handle and read the columns zero-copy. Workers must be child processes
+    of the owner (they share its resource tracker), and the owner must outlive
+    them and release the blocks with `close()`.
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._blocks: List[SharedMemory] = []
+        columns: List[SharedColumn] = []
+
+        index: Union[pd.Index, SharedColumn] = frame.index
+        try:
+            for position, name in enumerate(frame.columns):
+                columns.append(self._share(name, frame.iloc[:, position]))
+            if not isinstance(frame.index, (pd.RangeIndex, pd.MultiIndex)):
+                index = self._share(frame.index.name, frame.index.to_series())
+        except BaseException:
+            self.close()
+            raise
+
+        self.handle = SharedFrameHandle(
+            n_rows=len(frame),
+            columns=tuple(columns),
+            labels=frame.columns,
+            index=index,
+        )
+
+    def _share(self, name: Hashable, series: pd.Series) -> SharedColumn:
+        uniques: Optional[ArrayLike] = None
+        if _is_fixed_width(series):
+            values = series.to_numpy()
+        else:
+            codes, index = pd.factorize(series, sort=False)
+            values = codes.astype(np.int32 if len(index) < 2**31 else np.int64)
+            uniques = index.array if isinstance(index, pd.Index) else index
+
+        block = SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._blocks.append(block)
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+
+        return SharedColumn(
+            name=name, block=block.name, dtype=values.dtype.str, uniques=uniques
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(block.size for block in self._blocks)
+
+    def close(self) -> None:
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class AttachedFrame:
+    """Worker-side view of a SharedFrame, rebuilt without copying numeric data."""
+
+    def __init__(self, handle: SharedFrameHandle) -> None:
+        self._blocks: List[SharedMemory] = []
+        self._n_rows = handle.n_rows
+        columns = {
+            position: self._attach(column)
+            for position, column in enumerate(handle.columns)
+        }
+        index = handle.index
+        if isinstance(index, SharedColumn):
+            index = pd.Index(self._attach(index), name=index.name, copy=False)
+
+        self.frame = pd.DataFrame(columns, index=index, copy=False)
+        self.frame.columns = handle.labels
+
+    def _attach(self, column: SharedColumn) -> ArrayLike:
+        block = SharedMemory(name=column.block)
+        self._blocks.append(block)
+        values = np.ndarray(
+            (self._n_rows,), dtype=np.dtype(column.dtype), buffer=block.buf
+        )
+        if column.uniques is None:
+            return values
+        return take(column.uniques, values, allow_fill=True)
+
+    def close(self) -> None:
+        # Drop the frame first: blocks cannot close while arrays export them.
+        del self.frame
+        for block in self._blocks:
+            block.close()
+        self._blocks.clear()
+
+    def __enter__(self) -> "AttachedFrame":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
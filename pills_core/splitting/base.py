@@ -6,7 +6,13 @@ from typing import ClassVar
 import pandas as pd
 
 from pills_core._enums import ValidationStrategy
-from pills_core.splitting.spec import FoldIndices, SplitRequest, SplitSpec
+from pills_core.splitting.spec import (
+    AnyFold,
+    FoldIndices,
+    RangeFoldIndices,
+    SplitRequest,
+    SplitSpec,
+)
 
 
 def _validate_request(request: SplitRequest) -> None:
@@ -16,12 +22,12 @@ def _validate_request(request: SplitRequest) -> None:
         raise ValueError("Splitting requires at least two samples.")
 
 
-def _validate_folds(request: SplitRequest, folds: tuple[FoldIndices, ...]) -> None:
+def _validate_folds(request: SplitRequest, folds: tuple[AnyFold, ...]) -> None:
     if len(folds) == 0:
         raise ValueError("Splitter must produce at least one fold.")
 
     for fold in folds:
-        if not isinstance(fold, FoldIndices):
+        if not isinstance(fold, (FoldIndices, RangeFoldIndices)):
             raise TypeError("Splitter must produce FoldIndices instances.")
         fold.validate_bounds(request.n_samples)
         if fold.train_size + fold.val_size > request.n_samples:
@@ -47,7 +53,10 @@ class BaseSplitter(ABC):
         )
 
     def build_spec(self, df: pd.DataFrame, y: pd.Series) -> SplitSpec:
-        return self.build(SplitRequest(frame=df, target=y))
+        return self.build(self._request_from_frame(df, y))
+
+    def _request_from_frame(self, df: pd.DataFrame, y: pd.Series) -> SplitRequest:
+        return SplitRequest.from_frame(df, y)
 
     def _get_strategy(self) -> ValidationStrategy:
         try:
@@ -65,7 +74,7 @@ class BaseSplitter(ABC):
         return strategy
 
     @abstractmethod
-    def _build_folds(self, request: SplitRequest) -> tuple[FoldIndices, ...]: ...
+    def _build_folds(self, request: SplitRequest) -> tuple[AnyFold, ...]: ...
 
     @abstractmethod
     def _get_random_state(self) -> int: ...
@@ -1,12 +1,14 @@
-from typing import ClassVar
+from __future__ import annotations
 
-from sklearn.model_selection import KFold, StratifiedKFold
+from typing import TYPE_CHECKING, ClassVar
 
 from pills_core._enums import ValidationStrategy
-from pills_core.config import TrainingConfig
 from pills_core.splitting.base import BaseSplitter
 from pills_core.splitting.spec import FoldIndices, SplitRequest
 
+if TYPE_CHECKING:
+    from pills_core.config import TrainingConfig
+
 
 class CVSplitter(BaseSplitter):
     strategy: ClassVar[ValidationStrategy] = ValidationStrategy.CV
@@ -16,21 +18,25 @@ class CVSplitter(BaseSplitter):
         self.stratify = stratify
 
     def _build_folds(self, request: SplitRequest) -> tuple[FoldIndices, ...]:
+        from sklearn.model_selection import KFold, StratifiedKFold
+
         if self.stratify:
             skf = StratifiedKFold(
                 n_splits=self.config.folds,
                 shuffle=True,
                 random_state=self.config.random_state,
             )
+            target = request.require_target()
         else:
             skf = KFold(
                 n_splits=self.config.folds,
                 shuffle=True,
                 random_state=self.config.random_state,
             )
+            target = None
         return tuple(
             FoldIndices(train=train_idx, val=val_idx)
-            for train_idx, val_idx in skf.split(request.frame, request.target)
+            for train_idx, val_idx in skf.split(request.positions, target)
         )
 
     def _get_random_state(self) -> int:
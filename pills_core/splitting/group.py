@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+import pandas as pd
+
+from pills_core._enums import ValidationStrategy
+from pills_core.splitting.base import BaseSplitter
+from pills_core.splitting.spec import FoldIndices, SplitRequest
+
+if TYPE_CHECKING:
+    from pills_core.config import TrainingConfig
+
+# Largest groups are placed one by one on the lightest fold, the long tail in
+# vectorized serpentine rounds. The tail imbalance is bounded by the size of
+# the last greedily placed group.
+_GREEDY_HEAD = 1024
+
+# A target with more distinct values than this is not a class label: numeric
+# targets are stratified on quantile bins instead, others are rejected.
+_MAX_CLASSES = 64
+_QUANTILE_BINS = 10
+
+
+def _assign_groups(
+    sizes: np.ndarray,
+    n_splits: int,
+    rng: np.random.Generator,
+    loads: np.ndarray,
+) -> np.ndarray:
+    """
+    Assign groups to folds so that fold loads (updated in place) stay balanced.
+    Returns the fold id of every group.
+    """
+    n_groups = sizes.size
+    tiebreak = rng.permutation(n_groups)
+    order = tiebreak[np.argsort(-sizes[tiebreak], kind="stable")]
+
+    group_fold = np.empty(n_groups, dtype=np.intp)
+
+    head, tail = order[:_GREEDY_HEAD], order[_GREEDY_HEAD:]
+    for group in head:
+        fold = int(np.argmin(loads))
+        group_fold[group] = fold
+        loads[fold] += sizes[group]
+
+    if tail.size:
+        rank = np.arange(tail.size)
+        position = rank % n_splits
+        reverse = (rank // n_splits) % 2 == 1
+        position[reverse] = n_splits - 1 - position[reverse]
+
+        by_load = np.argsort(loads, kind="stable")
+        group_fold[tail] = by_load[position]
+        loads += np.bincount(group_fold[tail], weights=sizes[tail], minlength=n_splits)
+
+    return group_fold
+
+
+def _class_codes(target: np.ndarray) -> tuple[np.ndarray, int]:
+    """Dense class codes of `target`, binned on quantiles when it is continuous."""
+    class_codes, classes = pd.factorize(target, sort=True)
+    if (class_codes < 0).any():
+        raise ValueError("Stratified group split requires a target without NaN.")
+    if len(classes) <= _MAX_CLASSES:
+        return class_codes, len(classes)
+    if not np.issubdtype(np.asarray(target).dtype, np.number):
+        raise ValueError(
+            f"Cannot stratify on {len(classes)} target classes "
+            f"(at most {_MAX_CLASSES}); pass stratify=False."
+        )
+    # Codes follow the sorted values, so their quantiles bin the target
+    edges = np.quantile(class_codes, np.linspace(0, 1, _QUANTILE_BINS + 1)[1:-1])
+    binned = np.searchsorted(np.unique(edges), class_codes, side="right")
+    return binned.astype(np.intp, copy=False), int(binned.max()) + 1
+
+
+def _folds_from_assignment(
+    row_fold: np.ndarray, n_splits: int
+) -> tuple[FoldIndices, ...]:
+    order = np.argsort(row_fold, kind="stable")
+    bounds = np.cumsum(np.bincount(row_fold, minlength=n_splits))[:-1]
+    blocks = np.split(order, bounds)
+
+    return tuple(
+        FoldIndices(
+            train=np.concatenate(blocks[:fold_id] + blocks[fold_id + 1 :]),
+            val=blocks[fold_id],
+        )
+        for fold_id in range(n_splits)
+    )
+
+
+class GroupCVSplitter(BaseSplitter):
+    """
+    K-fold over groups: all rows of a group land in the same validation fold.
+
+    Groups are factorized to integer codes and balanced with bincount sizes,
+    so the cost is dominated by one sort over the groups. With `stratify`,
+    groups are bucketed by their dominant target class and each bucket is
+    spread across folds by its rows of that class, which keeps class counts
+    close per fold. Continuous targets are stratified on quantile bins.
+    """
+
+    strategy: ClassVar[ValidationStrategy] = ValidationStrategy.GROUP_CV
+
+    def __init__(
+        self,
+        config: TrainingConfig,
+        group_column: str | None = None,
+        stratify: bool = True,
+    ) -> None:
+        self.config = config
+        self.group_column = group_column
+        self.stratify = stratify
+
+    def _build_folds(self, request: SplitRequest) -> tuple[FoldIndices, ...]:
+        n_splits = self.config.folds
+        group_codes, n_groups = self._factorize_groups(request)
+
+        if n_splits < 2:
+            raise ValueError(f"folds must be >= 2, got {n_splits}")
+        if n_groups < n_splits:
+            raise ValueError(f"Cannot split {n_groups} groups into {n_splits} folds.")
+
+        rng = np.random.default_rng(self.config.random_state)
+        sizes = np.bincount(group_codes, minlength=n_groups)
+
+        if self.stratify:
+            group_fold = self._assign_stratified(request, group_codes, n_splits, rng)
+        else:
+            loads = np.zeros(n_splits, dtype=np.float64)
+            group_fold = _assign_groups(sizes, n_splits, rng, loads)
+
+        return _folds_from_assignment(group_fold[group_codes], n_splits)
+
+    def _request_from_frame(self, df: pd.DataFrame, y: pd.Series) -> SplitRequest:
+        if self.group_column is None:
+            raise ValueError("group_column is required to split a DataFrame.")
+        return SplitRequest.from_frame(df, y, group_column=self.group_column)
+
+    def _factorize_groups(self, request: SplitRequest) -> tuple[np.ndarray, int]:
+        if request.groups is None:
+            raise ValueError("GroupCVSplitter requires a request with groups.")
+
+        codes, uniques = pd.factorize(request.groups, sort=False)
+        if (codes < 0).any():
+            raise ValueError("groups must not contain missing values.")
+        return codes.astype(np.intp, copy=False), len(uniques)
+
+    def _assign_stratified(
+        self,
+        request: SplitRequest,
+        group_codes: np.ndarray,
+        n_splits: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        class_codes, n_classes = _class_codes(request.require_target())
+
+        # Rows per (group, class) pair that occurs, sorted by group then class:
+        # no dense n_groups x n_classes matrix at millions of groups.
+        n_groups = int(group_codes.max()) + 1
+        pairs, pair_counts = np.unique(
+            group_codes.astype(np.int64) * n_classes + class_codes, return_counts=True
+        )
+        pair_groups, pair_classes = np.divmod(pairs, n_classes)
+
+        # The dominant class of a group is its most frequent, lowest on ties.
+        ranked = np.lexsort((pair_classes, -pair_counts, pair_groups))
+        ranked_groups = pair_groups[ranked]
+        first = ranked[np.r_[True, ranked_groups[1:] != ranked_groups[:-1]]]
+        dominant = np.empty(n_groups, dtype=np.intp)
+        dominant_counts = np.empty(n_groups, dtype=np.int64)
+        dominant[pair_groups[first]] = pair_classes[first]
+        dominant_counts[pair_groups[first]] = pair_counts[first]
+
+        buckets = np.argsort(dominant, kind="stable")
+        bucket_bounds = np.searchsorted(dominant[buckets], np.arange(n_classes + 1))
+        pair_dominant = dominant[pair_groups]
+        pair_buckets = np.argsort(pair_dominant, kind="stable")
+        pair_bounds = np.searchsorted(
+            pair_dominant[pair_buckets], np.arange(n_classes + 1)
+        )
+
+        # Each bucket is balanced on its own class, against the rows of that
+        # class already placed by earlier buckets' mixed groups.
+        class_loads = np.zeros((n_splits, n_classes), dtype=np.float64)
+        group_fold = np.empty(n_groups, dtype=np.intp)
+        for cls in range(n_classes):
+            members = buckets[bucket_bounds[cls] : bucket_bounds[cls + 1]]
+            if not members.size:
+                continue
+            group_fold[members] = _assign_groups(
+                dominant_counts[members], n_splits, rng, class_loads[:, cls].copy()
+            )
+            placed = pair_buckets[pair_bounds[cls] : pair_bounds[cls + 1]]
+            np.add.at(
+                class_loads,
+                (group_fold[pair_groups[placed]], pair_classes[placed]),
+                pair_counts[placed],
+            )
+        return group_fold
+
+    def _get_random_state(self) -> int:
+        return int(self.config.random_state)
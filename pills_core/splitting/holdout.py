@@ -1,7 +1,5 @@
 from typing import ClassVar
 
-from sklearn.model_selection import train_test_split
-
 from pills_core._enums import ValidationStrategy
 from pills_core.splitting.base import BaseSplitter
 from pills_core.splitting.spec import FoldIndices, SplitRequest
@@ -24,11 +22,13 @@ class HoldoutSplitter(BaseSplitter):
         self.stratify = stratify
 
     def _build_folds(self, request: SplitRequest) -> tuple[FoldIndices, ...]:
+        from sklearn.model_selection import train_test_split
+
         train_idx, val_idx = train_test_split(
             request.positions,
             test_size=self.test_size,
             random_state=self.random_state,
-            stratify=request.target if self.stratify else None,
+            stratify=request.require_target() if self.stratify else None,
         )
 
         return (FoldIndices(train=train_idx, val=val_idx),)
@@ -24,39 +24,110 @@ def _normalize_positions(values: np.ndarray, *, name: str) -> np.ndarray:
         raise TypeError(f"{name} indices must be integer positions.")
 
     normalized = positions.astype(np.intp, copy=False)
-    if np.unique(normalized).size != normalized.size:
+    ordered = np.sort(normalized)
+    if (ordered[1:] == ordered[:-1]).any():
         raise ValueError(f"{name} indices must be unique within a fold.")
 
     return normalized
 
 
+def _as_column(values: object, *, name: str, n_samples: int) -> np.ndarray | None:
+    if values is None:
+        return None
+
+    if isinstance(values, (pd.Series, pd.Index)):
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            values = pd.DatetimeIndex(values).tz_convert(None)
+        column = values.to_numpy()
+    elif isinstance(values, np.ndarray):
+        column = values
+    elif hasattr(values, "to_numpy"):  # pyarrow Array / ChunkedArray
+        try:
+            column = values.to_numpy(zero_copy_only=False)  # type: ignore[attr-defined]
+        except TypeError:
+            column = values.to_numpy()  # type: ignore[attr-defined]
+    else:
+        column = np.asarray(values)
+
+    if column.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional.")
+    if column.shape[0] != n_samples:
+        raise ValueError(f"{name} must contain exactly n_samples={n_samples} values.")
+
+    return column
+
+
 @dataclass(frozen=True, slots=True)
 class SplitRequest:
-    frame: pd.DataFrame
-    target: pd.Series
+    """
+    Everything a splitter needs to know about the data: its length and the
+    few columns some strategies read (target for stratification, groups,
+    timestamps). Columns may be NumPy arrays, pandas Series or Arrow arrays.
+    """
+
+    n_samples: int
+    target: np.ndarray | None = None
+    groups: np.ndarray | None = None
+    timestamps: np.ndarray | None = None
 
     def __post_init__(self) -> None:
-        if not isinstance(self.frame, pd.DataFrame):
+        if isinstance(self.n_samples, bool) or not isinstance(
+            self.n_samples, (int, np.integer)
+        ):
+            raise TypeError("n_samples must be an integer.")
+        if self.n_samples <= 0:
+            raise ValueError("request must contain at least one row.")
+
+        n_samples = int(self.n_samples)
+        object.__setattr__(self, "n_samples", n_samples)
+        for name in ("target", "groups", "timestamps"):
+            column = _as_column(getattr(self, name), name=name, n_samples=n_samples)
+            object.__setattr__(self, name, column)
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        target: pd.Series,
+        *,
+        group_column: str | None = None,
+        time_column: str | None = None,
+    ) -> "SplitRequest":
+        if not isinstance(frame, pd.DataFrame):
             raise TypeError("frame must be a pandas DataFrame.")
-        if not isinstance(self.target, pd.Series):
+        if not isinstance(target, pd.Series):
             raise TypeError("target must be a pandas Series.")
-        if len(self.frame.index) == 0:
-            raise ValueError("frame must contain at least one row.")
-        if len(self.frame) != len(self.target):
+        if len(frame) != len(target):
             raise ValueError(
                 "frame and target must contain the same number of samples."
             )
-        if not self.frame.index.equals(self.target.index):
+        if frame.index is not target.index and not frame.index.equals(target.index):
             raise ValueError("frame and target must share the same index.")
 
-    @property
-    def n_samples(self) -> int:
-        return int(len(self.frame))
+        return cls(
+            n_samples=len(frame),
+            target=target,
+            groups=cls._frame_column(frame, group_column),
+            timestamps=cls._frame_column(frame, time_column),
+        )
+
+    @staticmethod
+    def _frame_column(frame: pd.DataFrame, column: str | None) -> pd.Series | None:
+        if column is None:
+            return None
+        if column not in frame.columns:
+            raise KeyError(f"Column '{column}' not found in frame.")
+        return frame[column]
 
     @property
     def positions(self) -> np.ndarray:
         return np.arange(self.n_samples, dtype=np.intp)
 
+    def require_target(self) -> np.ndarray:
+        if self.target is None:
+            raise ValueError("This split strategy requires a target column.")
+        return self.target
+
 
 @dataclass(frozen=True, slots=True)
 class FoldIndices:
@@ -98,6 +169,91 @@ class FoldIndices:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class RangeFoldIndices:
+    """
+    Fold described by two contiguous ranges instead of materialized arrays.
+
+    Ranges are expressed in `order` space: when `order` is set, position `i`
+    of the range maps to row `order[i]`, otherwise ranges are row positions.
+    Construction and validation are O(1), index arrays are only built on access.
+    """
+
+    train_start: int
+    train_stop: int
+    val_start: int
+    val_stop: int
+    order: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.train_start < self.train_stop:
+            raise ValueError("train range must be non-empty and non-negative.")
+        if not 0 <= self.val_start < self.val_stop:
+            raise ValueError("val range must be non-empty and non-negative.")
+        if self.train_start < self.val_stop and self.val_start < self.train_stop:
+            raise ValueError("train and val ranges must be disjoint within a fold.")
+        if self.order is not None and self.order.ndim != 1:
+            raise ValueError("order must be one-dimensional.")
+
+    @property
+    def train(self) -> np.ndarray:
+        return self._materialize(self.train_start, self.train_stop)
+
+    @property
+    def val(self) -> np.ndarray:
+        return self._materialize(self.val_start, self.val_stop)
+
+    @property
+    def train_size(self) -> int:
+        return self.train_stop - self.train_start
+
+    @property
+    def val_size(self) -> int:
+        return self.val_stop - self.val_start
+
+    def validate_bounds(self, n_samples: int) -> None:
+        if n_samples <= 0:
+            raise ValueError("n_samples must be positive.")
+        if self.order is not None and self.order.size != n_samples:
+            raise ValueError("order must contain exactly n_samples positions.")
+        if max(self.train_stop, self.val_stop) > n_samples:
+            raise ValueError(f"Fold ranges must be within [0, {n_samples}).")
+
+    def _materialize(self, start: int, stop: int) -> np.ndarray:
+        if self.order is None:
+            return np.arange(start, stop, dtype=np.intp)
+        return self.order[start:stop]
+
+    def __repr__(self) -> str:
+        return (
+            f"RangeFoldIndices(train=[{self.train_start}, {self.train_stop}), "
+            f"val=[{self.val_start}, {self.val_stop}))"
+        )
+
+
+AnyFold = FoldIndices | RangeFoldIndices
+
+
+def _coverage(n_samples: int, positions: list[np.ndarray]) -> int:
+    seen = np.zeros(n_samples, dtype=bool)
+    for values in positions:
+        seen[values] = True
+    return int(np.count_nonzero(seen))
+
+
+def _union_size(ranges: list[tuple[int, int]]) -> int:
+    covered = 0
+    current_stop = -1
+    for start, stop in sorted(ranges):
+        if start > current_stop:
+            covered += stop - start
+            current_stop = stop
+        elif stop > current_stop:
+            covered += stop - current_stop
+            current_stop = stop
+    return covered
+
+
 @dataclass(frozen=True, slots=True)
 class SplitDiagnostics:
     n_samples: int
@@ -115,7 +271,7 @@ class SplitDiagnostics:
     def from_folds(
         cls,
         n_samples: int,
-        folds: tuple[FoldIndices, ...],
+        folds: tuple[AnyFold, ...],
     ) -> "SplitDiagnostics":
         if n_samples <= 0:
             raise ValueError("n_samples must be positive.")
@@ -125,15 +281,21 @@ class SplitDiagnostics:
         train_sizes = tuple(fold.train_size for fold in folds)
         val_sizes = tuple(fold.val_size for fold in folds)
 
-        train_concat = np.concatenate([fold.train for fold in folds])
-        val_concat = np.concatenate([fold.val for fold in folds])
-
-        unique_train_coverage = int(np.unique(train_concat).size)
-        unique_val_coverage = int(np.unique(val_concat).size)
+        if all(isinstance(fold, RangeFoldIndices) for fold in folds):
+            # Every fold shares one ordering, so coverage is an interval union.
+            unique_train_coverage = _union_size(
+                [(fold.train_start, fold.train_stop) for fold in folds]
+            )
+            unique_val_coverage = _union_size(
+                [(fold.val_start, fold.val_stop) for fold in folds]
+            )
+        else:
+            unique_train_coverage = _coverage(n_samples, [fold.train for fold in folds])
+            unique_val_coverage = _coverage(n_samples, [fold.val for fold in folds])
 
         train_coverage_ratio = unique_train_coverage / n_samples
         val_coverage_ratio = unique_val_coverage / n_samples
-        has_validation_overlap = unique_val_coverage != int(val_concat.size)
+        has_validation_overlap = unique_val_coverage != sum(val_sizes)
         is_exhaustive_validation = unique_val_coverage == n_samples
 
         return cls(
@@ -155,7 +317,7 @@ class SplitSpec:
     strategy: ValidationStrategy
     random_state: int
     n_samples: int
-    folds: tuple[FoldIndices, ...]
+    folds: tuple[AnyFold, ...]
     created_at: str = field(default_factory=_utc_now_iso)
     diagnostics: SplitDiagnostics = field(init=False)
 
@@ -171,7 +333,7 @@ class SplitSpec:
 
         normalized_folds = tuple(self.folds)
         for fold in normalized_folds:
-            if not isinstance(fold, FoldIndices):
+            if not isinstance(fold, (FoldIndices, RangeFoldIndices)):
                 raise TypeError("folds must contain FoldIndices objects.")
             fold.validate_bounds(self.n_samples)
 
@@ -191,7 +353,7 @@ class SplitSpec:
         strategy: ValidationStrategy,
         random_state: int,
         n_samples: int,
-        folds: tuple[FoldIndices, ...],
+        folds: tuple[AnyFold, ...],
     ) -> "SplitSpec":
         return cls(
             strategy=strategy,
@@ -200,7 +362,7 @@ class SplitSpec:
             folds=folds,
         )
 
-    def get_fold(self, fold_id: int) -> FoldIndices:
+    def get_fold(self, fold_id: int) -> AnyFold:
         if fold_id < 0 or fold_id >= len(self.folds):
             raise IndexError(
                 f"fold_id={fold_id} out of range, spec has {len(self.folds)} folds."
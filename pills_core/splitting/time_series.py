@@ -0,0 +1,133 @@
+from typing import ClassVar, Literal
+
+import numpy as np
+import pandas as pd
+
+from pills_core._enums import ValidationStrategy
+from pills_core.splitting.base import BaseSplitter
+from pills_core.splitting.spec import RangeFoldIndices, SplitRequest
+
+WindowType = Literal["expanding", "sliding"]
+
+
+class TimeSeriesSplitter(BaseSplitter):
+    """
+    Forward-chaining splitter: every validation window lies strictly after its
+    training window, so no fold trains on the future.
+
+    Validation windows are the last `n_splits` equal blocks of the ordered rows.
+    With timestamps, every window boundary moves forward to the next change
+    of time, so rows sharing a timestamp never straddle train and validation
+    (windows may then be unequal, and the split fails if one empties).
+
+    `purge` and `embargo` count rows in time order, not time deltas: `purge`
+    drops rows from the end of the training window (labels overlapping
+    validation), `embargo` drops rows from the start of the validation window
+    (features still looking back into training). Folds only ever train on
+    the past, so there is no training after a validation window to embargo.
+    Folds are emitted as RangeFoldIndices, so building a spec is O(n_folds)
+    once rows are ordered.
+    """
+
+    strategy: ClassVar[ValidationStrategy] = ValidationStrategy.TIME_SERIES
+
+    def __init__(
+        self,
+        n_splits: int = 5,
+        window: WindowType = "expanding",
+        max_train_size: int | None = None,
+        val_size: int | None = None,
+        purge: int = 0,
+        embargo: int = 0,
+        time_column: str | None = None,
+    ) -> None:
+        if n_splits < 1:
+            raise ValueError(f"n_splits must be >= 1, got {n_splits}")
+        if window not in ("expanding", "sliding"):
+            raise ValueError(f"window must be 'expanding' or 'sliding', got {window!r}")
+        if max_train_size is not None and max_train_size < 1:
+            raise ValueError(f"max_train_size must be >= 1, got {max_train_size}")
+        if val_size is not None and val_size < 1:
+            raise ValueError(f"val_size must be >= 1, got {val_size}")
+        if purge < 0 or embargo < 0:
+            raise ValueError("purge and embargo must be non-negative.")
+
+        self.n_splits = n_splits
+        self.window = window
+        self.max_train_size = max_train_size
+        self.val_size = val_size
+        self.purge = purge
+        self.embargo = embargo
+        self.time_column = time_column
+
+    def _build_folds(self, request: SplitRequest) -> tuple[RangeFoldIndices, ...]:
+        n_samples = request.n_samples
+        order = self._resolve_order(request)
+
+        val_size = self.val_size or n_samples // (self.n_splits + 1)
+        starts = n_samples - val_size * np.arange(self.n_splits, 0, -1)
+        if request.timestamps is not None and starts[0] > 0:
+            starts = self._snap_to_changes(request.timestamps, order, starts)
+        stops = np.append(starts[1:], n_samples)
+        if (stops - starts <= self.embargo).any() or starts[0] - self.purge <= 0:
+            raise ValueError(
+                f"Cannot build {self.n_splits} time-series folds of val_size={val_size} "
+                f"with purge={self.purge}, embargo={self.embargo} "
+                f"from {n_samples} samples."
+            )
+
+        train_size = self.max_train_size
+        if self.window == "sliding" and train_size is None:
+            train_size = int(starts[0]) - self.purge
+
+        folds: list[RangeFoldIndices] = []
+        for val_start, val_stop in zip(starts.tolist(), stops.tolist(), strict=True):
+            train_stop = val_start - self.purge
+            train_start = 0 if train_size is None else max(0, train_stop - train_size)
+
+            folds.append(
+                RangeFoldIndices(
+                    train_start=train_start,
+                    train_stop=train_stop,
+                    val_start=val_start + self.embargo,
+                    val_stop=val_stop,
+                    order=order,
+                )
+            )
+
+        return tuple(folds)
+
+    @staticmethod
+    def _snap_to_changes(
+        timestamps: np.ndarray, order: np.ndarray | None, starts: np.ndarray
+    ) -> np.ndarray:
+        """Each start moved forward past the rows sharing its predecessor's time."""
+        ordered = timestamps if order is None else timestamps[order]
+        return np.searchsorted(ordered, ordered[starts - 1], side="right")
+
+    def _request_from_frame(self, df: pd.DataFrame, y: pd.Series) -> SplitRequest:
+        return SplitRequest.from_frame(df, y, time_column=self.time_column)
+
+    def _resolve_order(self, request: SplitRequest) -> np.ndarray | None:
+        timestamps = request.timestamps
+        if timestamps is None:
+            return None
+
+        if np.issubdtype(timestamps.dtype, np.datetime64):
+            has_missing = bool(np.isnat(timestamps).any())
+        elif np.issubdtype(timestamps.dtype, np.number):
+            has_missing = bool(np.isnan(timestamps).any())
+        else:
+            raise TypeError(
+                f"timestamps must be datetime or numeric, got {timestamps.dtype}."
+            )
+        if has_missing:
+            raise ValueError("timestamps contain missing values.")
+
+        if (timestamps[1:] >= timestamps[:-1]).all():
+            return None
+
+        return np.argsort(timestamps, kind="stable").astype(np.intp, copy=False)
+
+    def _get_random_state(self) -> int:
+        return 0  # time-ordered folds are deterministic
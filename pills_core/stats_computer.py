@@ -1,25 +1,227 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Generic, Optional
+from dataclasses import dataclass, fields
+from typing import Callable, ClassVar, Generic, List, Optional
 
 import numpy as np
 import pandas as pd
 
+from pills_core._datetime import NAT, NS_PER_DAY, NS_PER_SECOND, datetime_ns
+from pills_core._typos import find_typos
 from pills_core.types.profiles import ColumnTypeProfile
-from pills_core.types.stats import CategoricalColumnStats, NumericalColumnStats, StatsT
+from pills_core.types.stats import (
+    CategoricalColumnStats,
+    DatetimeColumnStats,
+    NumericalColumnStats,
+    StatsT,
+)
+from pills_core.types.stats_table import StatsTable, replace_stats
+
+
+@dataclass(frozen=True, slots=True)
+class ValueCounts:
+    """
+    Occurrences of each dictionary value within a block of rows.
+
+    Blocks factorized against the same FactorizedColumn share `uniques`, so
+    counts of disjoint blocks merge by addition and a block is removed from
+    a union by subtraction.
+    """
+
+    uniques: np.ndarray
+    counts: np.ndarray
+    n_missing: int
+
+    def __add__(self, other: "ValueCounts") -> "ValueCounts":
+        return ValueCounts(
+            uniques=self.uniques,
+            counts=self.counts + other.counts,
+            n_missing=self.n_missing + other.n_missing,
+        )
+
+    def __sub__(self, other: "ValueCounts") -> "ValueCounts":
+        return ValueCounts(
+            uniques=self.uniques,
+            counts=self.counts - other.counts,
+            n_missing=self.n_missing - other.n_missing,
+        )
+
+
+class FactorizedColumn:
+    """
+    A column encoded once as integer codes over a sorted value dictionary.
+    Counting any subset of rows is then a single bincount.
+    """
+
+    __slots__ = ("uniques", "codes")
+
+    def __init__(self, series: pd.Series) -> None:
+        try:
+            codes, uniques = pd.factorize(series, sort=True)
+        except TypeError:  # mixed, unorderable object values
+            codes, uniques = pd.factorize(series, sort=False)
+        self.codes: np.ndarray = codes
+        self.uniques: np.ndarray = np.asarray(uniques)
+
+    def count(self, positions: np.ndarray | None = None) -> ValueCounts:
+        codes = self.codes if positions is None else self.codes[positions]
+        present = codes[codes >= 0]
+        return ValueCounts(
+            uniques=self.uniques,
+            counts=np.bincount(present, minlength=self.uniques.size),
+            n_missing=int(codes.size - present.size),
+        )
 
 
 class StatsComputer(ABC, Generic[StatsT]):
+    mergeable: ClassVar[bool] = False  # can compute stats from ValueCounts
+
     def __init__(self, sample_size: Optional[int] = None) -> None:
         self.sample_size = sample_size
 
+    def _samples(self, series: pd.Series) -> bool:
+        return bool(self.sample_size) and len(series) > self.sample_size
+
     def _maybe_sample(self, series: pd.Series) -> pd.Series:
-        if self.sample_size and len(series) > self.sample_size:
+        if self._samples(series):
             return series.sample(n=self.sample_size, random_state=42)
         return series
 
     @abstractmethod
     def compute(self, series: pd.Series) -> StatsT: ...
 
+    def compute_frame(self, frame: pd.DataFrame) -> List[StatsT]:
+        """Stats of every column of `frame`, in column order."""
+        return [self.compute(frame.iloc[:, i]) for i in range(frame.shape[1])]
+
+    def compute_table(self, frame: pd.DataFrame) -> StatsTable[StatsT]:
+        """`compute_frame` as one StatsTable row per column."""
+        return StatsTable.from_stats(list(frame.columns), self.compute_frame(frame))
+
+    def profile_stats(self, series: pd.Series, stats: StatsT) -> StatsT:
+        """
+        `stats` of `series` completed with the checks too costly to repeat on
+        every step and fold, run once when the column is profiled.
+        """
+        return stats
+
+    def compute_from_counts(self, series: pd.Series, counts: ValueCounts) -> StatsT:
+        """
+        Stats of `series` whose value distribution is already known as
+        `counts`. `mergeable` computers read them from `counts`, touching
+        `series` only for order-dependent stats; others, and any computer
+        that would sample `series`, fall back to `compute`.
+        """
+        return self.compute(series)
+
+
+def _monotonic_ratio(clean: pd.Series) -> float:
+    diffs = clean.sort_index().diff().dropna()
+    return float((diffs > 0).sum() / len(diffs)) if len(diffs) > 0 else 0.0
+
+
+def _quantiles_from_counts(
+    values: np.ndarray, freq: np.ndarray, qs: tuple[float, ...]
+) -> tuple[float, ...]:
+    """Linear-interpolated quantiles (pandas' default) of sorted values with counts."""
+    cumulative = np.cumsum(freq)
+    position = (cumulative[-1] - 1) * np.asarray(qs)
+    lower = np.floor(position)
+    upper = np.minimum(lower + 1, cumulative[-1] - 1)
+
+    lower_values = values[np.searchsorted(cumulative, lower, side="right")]
+    upper_values = values[np.searchsorted(cumulative, upper, side="right")]
+    result = lower_values + (position - lower) * (upper_values - lower_values)
+    return tuple(float(q) for q in result)
+
+
+def _sorted_quantiles(ordered: np.ndarray, last: np.ndarray, q: float) -> np.ndarray:
+    """Linear-interpolated quantile of each row of NaN-last sorted `ordered`."""
+    position = last * q
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, last)
+    rows = np.arange(len(ordered))
+    low, high = ordered[rows, lower], ordered[rows, upper]
+    return low + (position - lower) * (high - low)
+
+
+def _sorted_modes(ordered: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """
+    Mode (smallest on ties, as pandas) of each row of NaN-last sorted
+    `ordered` holding `count` >= 1 valid values.
+    """
+    values = ordered[np.arange(ordered.shape[1]) < count[:, None]]
+    owner = np.repeat(np.arange(len(ordered)), count)
+    starts = np.ones(values.size, dtype=bool)
+    starts[1:] = (values[1:] != values[:-1]) | (owner[1:] != owner[:-1])
+    start = np.flatnonzero(starts)
+    length = np.diff(np.append(start, values.size))
+    run_owner = owner[start]
+
+    # Longest run first within each row, earliest (smallest value) on ties
+    order = np.lexsort((start, -length, run_owner))
+    first = np.searchsorted(run_owner[order], np.arange(len(ordered)))
+    return values[start[order[first]]]
+
+
+def _moment_stats(
+    func: Callable[[int, float, float, float], float],
+    count: np.ndarray,
+    m2: np.ndarray,
+    other: np.ndarray,
+    minimum: np.ndarray,
+    maximum: np.ndarray,
+) -> np.ndarray:
+    """`func` (_skewness or _kurtosis) of every row's moment sums."""
+    max_abs = np.maximum(np.abs(minimum), np.abs(maximum))
+    return np.fromiter(
+        (
+            func(int(n), float(a), float(b), float(c))
+            for n, a, b, c in zip(count, m2, other, max_abs, strict=True)
+        ),
+        dtype=np.float64,
+        count=len(count),
+    )
+
+
+def _rising_steps(block: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Per row, how many valid values exceed the previous valid value."""
+    previous = block[:, :-1]
+    if not valid.all():
+        # Carry the last valid value forward over gaps; leading gaps keep NaN
+        index = np.where(valid, np.arange(block.shape[1]), 0)
+        np.maximum.accumulate(index, axis=1, out=index)
+        previous = np.take_along_axis(block, index, axis=1)[:, :-1]
+    return ((block[:, 1:] > previous) & valid[:, 1:]).sum(axis=1)
+
+
+def _zero_out_fperr(moment: float, max_abs: float, power: int, count: int) -> float:
+    tolerance = (np.finfo(np.float64).eps * max_abs) ** power * count
+    return 0.0 if abs(moment) <= tolerance else moment
+
+
+def _skewness(count: int, m2: float, m3: float, max_abs: float) -> float:
+    """Adjusted Fisher-Pearson skewness from central moment sums, as pandas."""
+    if count < 3:
+        return np.nan
+    m2 = _zero_out_fperr(m2, max_abs, 2, count)
+    m3 = _zero_out_fperr(m3, max_abs, 3, count)
+    if m2 == 0:
+        return 0.0
+    return float((count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2**1.5))
+
+
+def _kurtosis(count: int, m2: float, m4: float, max_abs: float) -> float:
+    """Bias-corrected excess kurtosis from central moment sums, as pandas."""
+    if count < 4:
+        return np.nan
+    m2 = _zero_out_fperr(m2, max_abs, 2, count)
+    m4 = _zero_out_fperr(m4, max_abs, 4, count)
+    denominator = (count - 2) * (count - 3) * m2**2
+    if denominator == 0:
+        return 0.0
+    adjustment = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+    return float(count * (count + 1) * (count - 1) * m4 / denominator - adjustment)
+
 
 class WelfordAccumulator:
     """
@@ -55,6 +257,8 @@ class WelfordAccumulator:
 
 
 class NumericalStatsComputer(StatsComputer[NumericalColumnStats]):
+    mergeable: ClassVar[bool] = True
+
     def __init__(
         self, sample_size: int | None = None, chunk_size: int | None = None
     ) -> None:
@@ -76,11 +280,7 @@ class NumericalStatsComputer(StatsComputer[NumericalColumnStats]):
         count = len(clean)
         n_unique = clean.nunique()
 
-        diffs = clean.sort_index().diff().dropna()
-
-        monotonic_ratio = (
-            float((diffs > 0).sum() / len(diffs)) if len(diffs) > 0 else 0.0
-        )
+        monotonic_ratio = _monotonic_ratio(clean)
 
         mode_vals = clean.mode()
         mode = mode_vals.iloc[0] if not mode_vals.empty else clean.median()
@@ -111,6 +311,163 @@ class NumericalStatsComputer(StatsComputer[NumericalColumnStats]):
             zero_ratio=float((clean == 0).mean()),
         )
 
+    def compute_from_counts(
+        self, series: pd.Series, counts: ValueCounts
+    ) -> NumericalColumnStats:
+        present = counts.counts > 0
+        values = counts.uniques[present]
+        freq = counts.counts[present]
+        count = int(freq.sum())
+
+        if count == 0 or self._samples(series):
+            return self.compute(series)
+
+        floats = values.astype(np.float64)
+        mean = float(np.dot(freq, floats) / count)
+        deviation = floats - mean
+        squared = deviation * deviation
+        m2 = float(np.dot(freq, squared))
+        m3 = float(np.dot(freq, squared * deviation))
+        m4 = float(np.dot(freq, squared * squared))
+        max_abs = float(max(abs(floats[0]), abs(floats[-1])))
+
+        variance = m2 / (count - 1) if count > 1 else np.nan
+        std = float(np.sqrt(variance))
+
+        p05, q1, median, q3, p95 = _quantiles_from_counts(
+            floats, freq, (0.05, 0.25, 0.5, 0.75, 0.95)
+        )
+        iqr = q3 - q1
+        n_outliers = freq[(floats < q1 - 1.5 * iqr) | (floats > q3 + 1.5 * iqr)].sum()
+
+        n_unique = int(values.size)
+        clean = series.dropna()
+
+        return NumericalColumnStats(
+            max=values[-1],
+            min=values[0],
+            mean=mean,
+            median=median,
+            mode=values[int(np.argmax(freq))],
+            std=std,
+            count=count,
+            variance=float(variance),
+            skewness=_skewness(count, m2, m3, max_abs),
+            kurtosis=_kurtosis(count, m2, m4, max_abs),
+            range=values[-1] - values[0],
+            n_unique=n_unique,
+            missing_ratio=float(counts.n_missing / (count + counts.n_missing)),
+            outlier_ratio=float(n_outliers / count),
+            q1=q1,
+            q3=q3,
+            p05=p05,
+            p95=p95,
+            is_integer_valued=bool((floats == np.round(floats)).all()),
+            monotonic_ratio=_monotonic_ratio(clean),
+            cv=float(abs(std / mean)) if mean != 0 else 0.0,
+            unique_ratio=float(n_unique / count),
+            zero_ratio=float(freq[floats == 0].sum() / count),
+        )
+
+    def compute_frame(self, frame: pd.DataFrame) -> List[NumericalColumnStats]:
+        """The rows of `compute_table`, materialized as NumericalColumnStats."""
+        return [row.to_stats() for row in self.compute_table(frame)]
+
+    def compute_table(self, frame: pd.DataFrame) -> StatsTable[NumericalColumnStats]:
+        """
+        Stats of all columns at once from a contiguous float block: one sort
+        per column gives quantiles, extremes, unique counts and modes, and the
+        moments are 2-D reductions. All-missing columns fall back to compute.
+        """
+        names = list(frame.columns)
+        if self.sample_size and len(frame) > self.sample_size:
+            frame = frame.sample(n=self.sample_size, random_state=42)
+        if not frame.index.is_monotonic_increasing:  # monotonic_ratio is by index
+            frame = frame.iloc[np.argsort(frame.index.to_numpy(), kind="stable")]
+
+        # One row per column, so every per-column reduction runs along axis 1
+        block = np.ascontiguousarray(frame.to_numpy(dtype=np.float64).T)
+        n_columns, n_rows = block.shape
+        valid = ~np.isnan(block)
+        count = valid.sum(axis=1)
+        all_valid = bool(count.min(initial=n_rows) == n_rows)
+        has_values = count > 0
+        # Clamped so all-missing columns index safely; they are replaced below
+        last = np.maximum(count - 1, 0)
+        rows = np.arange(n_columns)
+
+        ordered = np.sort(block, axis=1)  # NaN sorts last
+        minimum = ordered[:, 0]
+        maximum = ordered[rows, last]
+        p05, q1, median, q3, p95 = (
+            _sorted_quantiles(ordered, last, q) for q in (0.05, 0.25, 0.5, 0.75, 0.95)
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            filled = block if all_valid else np.where(valid, block, 0.0)
+            mean = filled.sum(axis=1) / count
+            deviation = filled - mean[:, None]
+            if not all_valid:
+                deviation[~valid] = 0.0
+            squared = deviation * deviation
+            m2 = squared.sum(axis=1)
+            m3 = (squared * deviation).sum(axis=1)
+            m4 = (squared * squared).sum(axis=1)
+            variance = np.where(count > 1, m2 / (count - 1), np.nan)
+            std = np.sqrt(variance)
+
+            iqr = q3 - q1
+            outliers = (block < (q1 - 1.5 * iqr)[:, None]) | (
+                block > (q3 + 1.5 * iqr)[:, None]
+            )
+            outlier_ratio = outliers.sum(axis=1) / count
+            zero_ratio = (block == 0).sum(axis=1) / count
+        is_integer = ((block == np.round(block)) | ~valid).all(axis=1)
+
+        changes = (ordered[:, 1:] != ordered[:, :-1]) & (
+            np.arange(1, n_rows) < count[:, None]
+        )
+        n_unique = has_values + changes.sum(axis=1)
+        # Without repeated values the mode is the smallest, as in pandas
+        mode = minimum.copy()
+        repeated = has_values & (n_unique < count)
+        if repeated.any():
+            mode[repeated] = _sorted_modes(ordered[repeated], count[repeated])
+        rising = _rising_steps(block, valid)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            arrays = {
+                "max": maximum,
+                "min": minimum,
+                "mean": mean,
+                "median": median,
+                "mode": mode,
+                "std": std,
+                "count": count,
+                "variance": variance,
+                "skewness": _moment_stats(_skewness, count, m2, m3, minimum, maximum),
+                "kurtosis": _moment_stats(_kurtosis, count, m2, m4, minimum, maximum),
+                "range": maximum - minimum,
+                "n_unique": n_unique,
+                "missing_ratio": 1 - count / n_rows,
+                "outlier_ratio": outlier_ratio,
+                "q1": q1,
+                "q3": q3,
+                "p05": p05,
+                "p95": p95,
+                "is_integer_valued": is_integer,
+                "monotonic_ratio": np.where(count > 1, rising / (count - 1), 0.0),
+                "cv": np.where(mean != 0, np.abs(std / mean), 0.0),
+                "unique_ratio": n_unique / count,
+                "zero_ratio": zero_ratio,
+            }
+
+        for i in np.flatnonzero(~has_values):
+            fallback = self.compute(frame.iloc[:, i])
+            for f in fields(NumericalColumnStats):
+                arrays[f.name][i] = getattr(fallback, f.name)
+        return StatsTable(NumericalColumnStats, names, arrays)
+
     def _compute_mean_var(self, clean: pd.Series) -> tuple[float, float, float]:
         if self.chunk_size:
             acc = WelfordAccumulator()
@@ -125,13 +482,31 @@ class NumericalStatsComputer(StatsComputer[NumericalColumnStats]):
 
 
 class CategoricalStatsComputer(StatsComputer[CategoricalColumnStats]):
+    mergeable: ClassVar[bool] = True
+
     def __init__(
         self,
         rare_thresholds: float,
         sample_size: int | None = None,
+        detect_typos: bool = True,
     ) -> None:
         super().__init__(sample_size)
         self.rare_thresholds = rare_thresholds
+        self.detect_typos = detect_typos
+
+    def profile_stats(
+        self, series: pd.Series, stats: CategoricalColumnStats
+    ) -> CategoricalColumnStats:
+        if not self.detect_typos or stats.count == 0:
+            return stats
+        value_counts = self._maybe_sample(series).value_counts()
+        value_counts = value_counts[value_counts > 0]
+        labels, freq = value_counts.index.tolist(), value_counts.to_numpy()
+        typos = find_typos(labels, freq)
+        if not typos:
+            return stats
+        is_typo = np.fromiter((label in typos for label in labels), bool, len(labels))
+        return replace_stats(stats, typo_ratio=float(freq[is_typo].sum() / freq.sum()))
 
     def compute(self, series: pd.Series) -> CategoricalColumnStats:
         series = self._maybe_sample(series)
@@ -151,9 +526,11 @@ class CategoricalStatsComputer(StatsComputer[CategoricalColumnStats]):
                 rare_ratio=0.0,
                 entropy=0.0,
                 mode="",
+                typo_ratio=0.0,
             )
 
         value_counts = clean.value_counts()
+        value_counts = value_counts[value_counts > 0]  # unused categories
         probs = value_counts / count
 
         n_unique = int(value_counts.shape[0])
@@ -181,6 +558,91 @@ class CategoricalStatsComputer(StatsComputer[CategoricalColumnStats]):
             rare_ratio=rare_ratio,
             entropy=entropy,
             mode=str(mode),
+            typo_ratio=0.0,  # see profile_stats
+        )
+
+    def compute_from_counts(
+        self, series: pd.Series, counts: ValueCounts
+    ) -> CategoricalColumnStats:
+        present = counts.counts > 0
+        labels = counts.uniques[present]
+        freq = counts.counts[present]
+        count = int(freq.sum())
+
+        if count == 0 or self._samples(series):
+            return self.compute(series)
+
+        order = np.argsort(-freq, kind="stable")
+        probs = freq[order] / count
+        ordered_labels = labels[order]
+
+        rare_mask = probs < self.rare_thresholds
+        n_unique = int(labels.size)
+
+        return CategoricalColumnStats(
+            count=count,
+            unique_ratio=n_unique / count,
+            n_unique=n_unique,
+            missing_ratio=float(counts.n_missing / (count + counts.n_missing)),
+            most_frequent=str(ordered_labels[0]),
+            most_frequent_ratio=float(probs[0]),
+            rare_categories=[str(x) for x in ordered_labels[rare_mask]],
+            rare_ratio=float(probs[rare_mask].sum()),
+            entropy=float(-(probs * np.log2(probs)).sum()),
+            mode=str(labels[int(np.argmax(freq))]),
+            typo_ratio=0.0,
+        )
+
+
+class DatetimeStatsComputer(StatsComputer[DatetimeColumnStats]):
+    """
+    Range, gaps and ordering of a datetime column (or strings parsed as
+    one), computed on its int64 nanosecond buffer.
+    """
+
+    def compute(self, series: pd.Series) -> DatetimeColumnStats:
+        series = self._maybe_sample(series)
+        ns = datetime_ns(series)
+        valid = ns != NAT
+        values = ns[valid]
+        count = int(values.size)
+
+        if count == 0:
+            return DatetimeColumnStats(
+                count=0,
+                n_unique=0,
+                missing_ratio=1.0 if len(series) else 0.0,
+                unique_ratio=0.0,
+                min=pd.NaT,
+                max=pd.NaT,
+                span_days=0.0,
+                median_gap_seconds=0.0,
+                max_gap_seconds=0.0,
+                regularity=0.0,
+                monotonic_ratio=0.0,
+                has_time=False,
+            )
+
+        distinct = np.unique(values)
+        gaps = np.diff(distinct)
+        median_gap = float(np.median(gaps)) if gaps.size else 0.0
+        if not series.index.is_monotonic_increasing:
+            values = values[np.argsort(series.index[valid], kind="stable")]
+        steps = np.diff(values)
+
+        return DatetimeColumnStats(
+            count=count,
+            n_unique=int(distinct.size),
+            missing_ratio=float(1.0 - count / len(series)),
+            unique_ratio=float(distinct.size / count),
+            min=pd.Timestamp(int(distinct[0])),
+            max=pd.Timestamp(int(distinct[-1])),
+            span_days=float((distinct[-1] - distinct[0]) / NS_PER_DAY),
+            median_gap_seconds=median_gap / NS_PER_SECOND,
+            max_gap_seconds=float(gaps.max() / NS_PER_SECOND) if gaps.size else 0.0,
+            regularity=float((gaps == median_gap).mean()) if gaps.size else 0.0,
+            monotonic_ratio=float((steps > 0).mean()) if steps.size else 0.0,
+            has_time=bool((distinct % NS_PER_DAY).any()),
         )
 
 
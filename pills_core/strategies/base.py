@@ -1,6 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
-from typing import ClassVar, Dict, Generic, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -13,11 +23,21 @@ from pills_core._enums import (
     TransformPhase,
 )
 from pills_core.explain import Explanation
+from pills_core.types.sparse import SparseBlock
 from pills_core.types.stats import StatsT
 
 MetaT = TypeVar("MetaT", bound="ColumnMeta")
 EmbeddingT = TypeVar("EmbeddingT", bound="StrategyEmbedding")
 
+# Parameters a strategy estimates from the training data, kept in the fitted step
+FittedParams = Mapping[str, Any]
+
+# A transformed column, or the columns an expanding strategy turns it into
+StepOutput = Union[pd.Series, pd.DataFrame, SparseBlock]
+
+# Undoes a strategy's transform in place on a float64 array
+InverseKernel = Callable[[np.ndarray], None]
+
 
 @dataclass
 class ColumnMeta:
@@ -72,11 +92,19 @@ class TransformStrategy(ABC, Generic[StatsT, MetaT, EmbeddingT]):
     def explain(self, stats: StatsT, meta: MetaT) -> Explanation: ...
 
 
+def frame_required(strategy: "SingleStrategy") -> ValueError:
+    """The error for a `needs_frame` strategy fitted or applied without its frame."""
+    return ValueError(f"'{strategy.name}' reads other columns and needs a frame.")
+
+
 class SingleStrategy(
     TransformStrategy[StatsT, MetaT, EmbeddingT], Generic[StatsT, MetaT, EmbeddingT]
 ):
     name: ClassVar[str]
     family_role: ClassVar[FamilyRole]
+    is_invertible: ClassVar[bool] = False  # implements inverse_kernel
+    expands: ClassVar[bool] = False  # apply returns several columns; runs last
+    needs_frame: ClassVar[bool] = False  # reads other columns; fit_frame/apply_frame
 
     def __init__(self, *, embedding: EmbeddingT, radius: float) -> None:
         self.embedding = embedding
@@ -120,3 +148,50 @@ class SingleStrategy(
         self, present_phases: set[TransformPhase]
     ) -> set[tuple[TransformPhase, TransformPhase]]:
         return set()
+
+    def fit(self, data: pd.Series, stats: StatsT) -> Dict[str, Any]:
+        """
+        Estimate the parameters `apply_fitted` needs beyond the stats. Called
+        once at fit time; most strategies are fully described by the stats.
+        """
+        return {}
+
+    def apply_fitted(
+        self, data: pd.Series, stats: StatsT, params: FittedParams
+    ) -> pd.Series:
+        return self.apply(data, stats)
+
+    def fit_frame(
+        self, data: pd.Series, frame: pd.DataFrame, stats: StatsT
+    ) -> Dict[str, Any]:
+        """
+        `fit` for strategies that read other columns (`needs_frame`): `frame`
+        holds the rows of `data` and the columns the strategy may use.
+        """
+        return self.fit(data, stats)
+
+    def apply_frame(
+        self,
+        data: pd.Series,
+        frame: pd.DataFrame,
+        stats: StatsT,
+        params: FittedParams,
+    ) -> StepOutput:
+        """`apply_fitted` with the rows of `frame` that `data` belongs to."""
+        return self.apply_fitted(data, stats, params)
+
+    def runtime_op(self, stats: StatsT, params: FittedParams) -> Dict[str, Any]:
+        """
+        This transform as a `pills_core.runtime` op: `{"op": ..., **params}`
+        with every parameter resolved to a JSON-serializable constant.
+        """
+        raise NotImplementedError(
+            f"Strategy '{self.name}' has no pills_core.runtime equivalent"
+        )
+
+    def inverse_kernel(self, stats: StatsT, params: FittedParams) -> InverseKernel:
+        """
+        The inverse of this transform as an in-place kernel over a float64
+        array. Only invertible strategies (`is_invertible`) provide one.
+        """
+        raise NotImplementedError(f"Strategy '{self.name}' is not invertible")
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from pills_core._enums import ColumnRole, TransformPhase
+from pills_core.config import ComputeConfig
+from pills_core.strategies.categorical.encoding import HashingStrategy, OneHotStrategy
+from pills_core.strategies.categorical.grouping import RareGroupingStrategy
+from pills_core.strategies.config import (
+    CategoricalEncodingRegistryConfig,
+    CategoricalRareRegistryConfig,
+)
+from pills_core.strategies.registry import StrategyRegistry, build_if_enabled
+
+
+def build_rare_grouping_registry(
+    config: CategoricalRareRegistryConfig,
+    compute: Optional[ComputeConfig] = None,
+) -> StrategyRegistry:
+    """
+    The RARE_GROUPING registry. Categories are rare below
+    `compute.rare_threshold`, the threshold the stats flag them with.
+    """
+    s = config.strategies
+    compute = compute or ComputeConfig()
+
+    strategies = [
+        build_if_enabled(
+            RareGroupingStrategy, s.rare_grouping, min_frequency=compute.rare_threshold
+        ),
+    ]
+
+    return StrategyRegistry(
+        ColumnRole.CATEGORICAL,
+        TransformPhase.RARE_GROUPING,
+        config.weights.as_dict(),
+    ).bulk_register(strategies)
+
+
+def build_encoding_registry(
+    config: CategoricalEncodingRegistryConfig,
+) -> StrategyRegistry:
+    s = config.strategies
+
+    strategies = [
+        build_if_enabled(OneHotStrategy, s.one_hot),
+        build_if_enabled(HashingStrategy, s.hashing),
+    ]
+
+    return StrategyRegistry(
+        ColumnRole.CATEGORICAL,
+        TransformPhase.ENCODING,
+        config.weights.as_dict(),
+    ).bulk_register(strategies)
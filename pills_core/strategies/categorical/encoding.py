@@ -0,0 +1,175 @@
+"""
+Encoders expanding a categorical column into a sparse block.
+
+Both work on the column's dictionary codes: each category is mapped to an
+output column once, and the per-row column is a single take over the
+codes. Each row has at most one non-zero, so the CSR arrays are built
+directly from that and no dense dummy frame ever exists.
+"""
+
+from typing import Any, ClassVar, Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from pills_core._categorical import codes_and_categories, take
+from pills_core._enums import FamilyRole, TransformPhase
+from pills_core.explain import Explanation
+from pills_core.strategies.base import FittedParams
+from pills_core.strategies.categorical.base import (
+    CategoricalColumnMeta,
+    CategoricalEmbedding,
+    CategoricalStrategy,
+)
+from pills_core.types.sparse import SparseBlock
+from pills_core.types.stats import CategoricalColumnStats
+
+_VALUE_DTYPE = np.float32
+
+
+def _indicator_block(
+    columns_of_rows: np.ndarray,
+    values: np.ndarray,
+    columns: Sequence[str],
+    index: pd.Index,
+) -> SparseBlock:
+    from scipy import sparse  # heavy, only needed once a block is built
+
+    present = columns_of_rows >= 0
+    index_dtype = np.int32 if len(index) < np.iinfo(np.int32).max else np.int64
+    indptr = np.zeros(len(index) + 1, dtype=index_dtype)
+    np.cumsum(present, out=indptr[1:])
+    matrix = sparse.csr_matrix(
+        (values, columns_of_rows[present].astype(index_dtype), indptr),
+        shape=(len(index), len(columns)),
+    )
+    return SparseBlock(matrix=matrix, columns=tuple(columns), index=index)
+
+
+class CategoricalEncodingStrategy(CategoricalStrategy):
+    expands: ClassVar[bool] = True
+
+    @property
+    def phase(self) -> TransformPhase:
+        return TransformPhase.ENCODING
+
+    def should_apply(
+        self, stats: CategoricalColumnStats, meta: CategoricalColumnMeta
+    ) -> bool:
+        return not meta.is_target and stats.count > 0
+
+    def apply(self, data: pd.Series, stats: CategoricalColumnStats) -> SparseBlock:
+        return self.apply_fitted(data, stats, self.fit(data, stats))
+
+    def explain(
+        self, stats: CategoricalColumnStats, meta: CategoricalColumnMeta
+    ) -> Explanation:
+        reasons = [f"Encoding categorical column with '{self.name}'"]
+        reasons.append(f"n_unique={stats.n_unique}")
+        if meta.is_target:
+            reasons.append("target columns are not encoded")
+
+        return Explanation(
+            name=self.name,
+            value="selected" if self.should_apply(stats, meta) else "rejected",
+            reasons=reasons,
+        )
+
+
+class OneHotStrategy(CategoricalEncodingStrategy):
+    """
+    One indicator column per category seen at fit time. Missing values and
+    categories first seen at transform time get an all-zero row.
+    """
+
+    name: ClassVar[str] = "one_hot"
+    family_role: ClassVar[FamilyRole] = FamilyRole.INDICATOR
+
+    def __init__(
+        self, *, embedding: CategoricalEmbedding, radius: float, max_categories: int
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        self.max_categories = max_categories
+
+    def should_apply(
+        self, stats: CategoricalColumnStats, meta: CategoricalColumnMeta
+    ) -> bool:
+        if stats.n_unique > self.max_categories:
+            return False
+
+        return super().should_apply(stats, meta)
+
+    def fit(self, data: pd.Series, stats: CategoricalColumnStats) -> Dict[str, Any]:
+        codes, categories = codes_and_categories(data)
+        seen = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+        vocabulary = categories[seen].sort_values()
+        return {
+            "vocabulary": vocabulary,
+            "columns": tuple(f"{data.name}_{value}" for value in vocabulary),
+        }
+
+    def apply_fitted(
+        self, data: pd.Series, stats: CategoricalColumnStats, params: FittedParams
+    ) -> SparseBlock:
+        vocabulary: pd.Index = params["vocabulary"]
+        codes, categories = codes_and_categories(data)
+        columns_of_rows = take(vocabulary.get_indexer(categories), codes, -1)
+        return _indicator_block(
+            columns_of_rows,
+            np.ones(np.count_nonzero(columns_of_rows >= 0), dtype=_VALUE_DTYPE),
+            params["columns"],
+            data.index,
+        )
+
+
+class HashingStrategy(CategoricalEncodingStrategy):
+    """
+    Hashes categories into `n_features` columns, so the width is fixed
+    whatever the cardinality and unseen categories still get a column.
+    With `alternate_sign`, a hash bit picks +1 or -1 so that collisions
+    cancel out on average instead of piling up. Categories are hashed as
+    their `str`, whatever type they arrive as.
+    """
+
+    name: ClassVar[str] = "hashing"
+    family_role: ClassVar[FamilyRole] = FamilyRole.HASHING
+
+    def __init__(
+        self,
+        *,
+        embedding: CategoricalEmbedding,
+        radius: float,
+        n_features: int,
+        alternate_sign: bool = True,
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+
+    def fit(self, data: pd.Series, stats: CategoricalColumnStats) -> Dict[str, Any]:
+        return {
+            "columns": tuple(f"{data.name}_hash_{i}" for i in range(self.n_features))
+        }
+
+    def apply_fitted(
+        self, data: pd.Series, stats: CategoricalColumnStats, params: FittedParams
+    ) -> SparseBlock:
+        codes, categories = codes_and_categories(data)
+        # Keyed by text so 1 and "1" share a bucket; stable across
+        # processes and runs, unlike hash()
+        keys = np.asarray(categories.astype(str), dtype=object)
+        hashes = pd.util.hash_array(keys)
+        buckets = (hashes % np.uint64(self.n_features)).astype(np.int64)
+        columns_of_rows = take(buckets, codes, -1)
+        present = columns_of_rows >= 0
+        if self.alternate_sign:
+            signs = np.where(hashes >> np.uint64(63), -1, 1).astype(_VALUE_DTYPE)
+            values = take(signs, codes, 0)[present]
+        else:
+            values = np.ones(np.count_nonzero(present), dtype=_VALUE_DTYPE)
+        return _indicator_block(
+            columns_of_rows,
+            values,
+            params["columns"],
+            data.index,
+        )
@@ -0,0 +1,102 @@
+from typing import Any, ClassVar, Dict
+
+import numpy as np
+import pandas as pd
+
+from pills_core._categorical import (
+    as_categorical,
+    codes_and_categories,
+    from_codes,
+    take,
+)
+from pills_core._enums import FamilyRole, TransformPhase
+from pills_core.explain import Explanation
+from pills_core.strategies.base import FittedParams
+from pills_core.strategies.categorical.base import (
+    CategoricalColumnMeta,
+    CategoricalEmbedding,
+    CategoricalStrategy,
+)
+from pills_core.types.stats import CategoricalColumnStats
+
+RARE = "__RARE__"
+
+
+class RareGroupingStrategy(CategoricalStrategy):
+    """
+    Merges categories seen in less than `min_frequency` of the training
+    rows into one `__RARE__` category, as do categories first seen at
+    transform time. A frequent `__RARE__` label already in the data is that
+    category. `min_frequency` is the stats' rare threshold (see
+    `build_rare_grouping_registry`), so `should_apply` and `fit` agree on
+    which categories are rare.
+
+    Fitting compiles a lookup from each training code to its output code,
+    so a batch with the training dictionary is remapped by one take over
+    its codes. Other batches map their dictionary through a hash lookup
+    first, once per distinct value rather than per row.
+    """
+
+    name: ClassVar[str] = "rare_grouping"
+    family_role: ClassVar[FamilyRole] = FamilyRole.GROUPING
+
+    def __init__(
+        self, *, embedding: CategoricalEmbedding, radius: float, min_frequency: float
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        self.min_frequency = min_frequency
+
+    @property
+    def phase(self) -> TransformPhase:
+        return TransformPhase.RARE_GROUPING
+
+    def should_apply(
+        self, stats: CategoricalColumnStats, meta: CategoricalColumnMeta
+    ) -> bool:
+        if meta.is_target:
+            return False
+
+        return stats.rare_ratio > 0 and stats.n_unique > 2
+
+    def fit(self, data: pd.Series, stats: CategoricalColumnStats) -> Dict[str, Any]:
+        codes, categories = codes_and_categories(as_categorical(data))
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        kept = counts >= self.min_frequency * max(int(counts.sum()), 1)
+
+        output = categories[kept]
+        if RARE not in output:
+            output = output.append(pd.Index([RARE]))
+
+        lookup = np.full(len(categories), output.get_loc(RARE), dtype=np.int32)
+        lookup[kept] = np.arange(kept.sum(), dtype=np.int32)
+        return {"source": categories, "lookup": lookup, "categories": output}
+
+    def apply(self, data: pd.Series, stats: CategoricalColumnStats) -> pd.Series:
+        return self.apply_fitted(data, stats, self.fit(data, stats))
+
+    def apply_fitted(
+        self, data: pd.Series, stats: CategoricalColumnStats, params: FittedParams
+    ) -> pd.Series:
+        codes, categories = codes_and_categories(as_categorical(data))
+        output: pd.Index = params["categories"]
+
+        if categories.equals(params["source"]):
+            lookup = params["lookup"]
+        else:
+            lookup = output.get_indexer(categories).astype(np.int32)
+            lookup[lookup == -1] = output.get_loc(RARE)  # rare at fit time or unseen
+
+        return from_codes(take(lookup, codes, -1), output, data)
+
+    def explain(
+        self, stats: CategoricalColumnStats, meta: CategoricalColumnMeta
+    ) -> Explanation:
+        reasons = [f"Grouping rare categories with '{self.name}'"]
+        reasons.append(f"min_frequency={self.min_frequency}")
+        reasons.append(f"rare_ratio={stats.rare_ratio:.3f}")
+
+        return Explanation(
+            name=self.name,
+            value="selected" if self.should_apply(stats, meta) else "rejected",
+            reasons=reasons,
+        )
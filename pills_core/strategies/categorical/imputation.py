@@ -1,9 +1,11 @@
-from typing import ClassVar
+from typing import Any, ClassVar, Dict
 
 import pandas as pd
 
+from pills_core._categorical import as_categorical, fill_codes
 from pills_core._enums import TaskType, TransformPhase
 from pills_core.explain import Explanation
+from pills_core.strategies.base import FittedParams
 from pills_core.strategies.categorical.base import (
     CategoricalColumnMeta,
     CategoricalStrategy,
@@ -109,7 +111,12 @@ class MostFrequentStrategy(CategoricalImputationStrategy):
         return super().should_apply(stats, meta)
 
     def apply(self, data: pd.Series, stats: CategoricalColumnStats) -> pd.Series:
-        return data.fillna(stats.mode)
+        return fill_codes(data, stats.mode)
+
+    def runtime_op(
+        self, stats: CategoricalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "fill", "value": stats.mode}
 
 
 class MissingStrategy(CategoricalImputationStrategy):
@@ -144,7 +151,12 @@ class MissingStrategy(CategoricalImputationStrategy):
         return super().should_apply(stats, meta)
 
     def apply(self, data: pd.Series, stats: CategoricalColumnStats) -> pd.Series:
-        return data.fillna("__MISSING__")
+        return fill_codes(data, "__MISSING__")
+
+    def runtime_op(
+        self, stats: CategoricalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "fill", "value": "__MISSING__"}
 
 
 class ForwardFillStrategy(CategoricalImputationStrategy):
@@ -174,7 +186,12 @@ class ForwardFillStrategy(CategoricalImputationStrategy):
         return super().should_apply(stats, meta)
 
     def apply(self, data: pd.Series, stats: CategoricalColumnStats) -> pd.Series:
-        return data.ffill()
+        return as_categorical(data).ffill()
+
+    def runtime_op(
+        self, stats: CategoricalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "ffill"}
 
 
 class BackwardFillStrategy(CategoricalImputationStrategy):
@@ -204,4 +221,9 @@ class BackwardFillStrategy(CategoricalImputationStrategy):
         return super().should_apply(stats, meta)
 
     def apply(self, data: pd.Series, stats: CategoricalColumnStats) -> pd.Series:
-        return data.bfill()
+        return as_categorical(data).bfill()
+
+    def runtime_op(
+        self, stats: CategoricalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "bfill"}
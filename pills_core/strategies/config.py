@@ -1,7 +1,9 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from pills_core._datetime import COMPONENTS
 from pills_core.strategies.categorical.base import CategoricalEmbedding
 from pills_core.strategies.numeric.base import NumericalEmbedding
+from pills_core.strategies.temporal.base import DatetimeEmbedding
 
 
 class StrategyConfigModel(BaseModel):
@@ -19,6 +21,8 @@ class StrategyWeightsConfig(StrategyConfigModel):
     imbalance_sensitivity: float = 1.0
     order_awareness: float = 1.0
     typo_tolerance: float = 1.0
+    regularity_fit: float = 1.0
+    time_of_day_fit: float = 1.0
 
     def as_dict(self) -> dict[str, float]:
         return {key: float(value) for key, value in self.model_dump().items()}
@@ -49,6 +53,14 @@ class CategoricalEmbeddingConfig(StrategyEmbeddingConfig):
         return CategoricalEmbedding(**self.model_dump())
 
 
+class DatetimeEmbeddingConfig(StrategyEmbeddingConfig):
+    regularity_fit: float = 1.0
+    time_of_day_fit: float = 1.0
+
+    def as_embedding(self) -> DatetimeEmbedding:
+        return DatetimeEmbedding(**self.model_dump())
+
+
 class StrategyInstanceConfig(StrategyConfigModel):
     enabled: bool = True
     radius: float = Field(default=1.0, ge=0.0)
@@ -60,6 +72,16 @@ class NumericalStrategyInstanceConfig(StrategyInstanceConfig):
     )
 
 
+class CategoricalStrategyInstanceConfig(StrategyInstanceConfig):
+    embedding: CategoricalEmbeddingConfig = Field(
+        default_factory=CategoricalEmbeddingConfig
+    )
+
+
+class DatetimeStrategyInstanceConfig(StrategyInstanceConfig):
+    embedding: DatetimeEmbeddingConfig = Field(default_factory=DatetimeEmbeddingConfig)
+
+
 class SensitiveNumericalImputationConfig(NumericalStrategyInstanceConfig):
     max_outlier_ratio: float = Field(
         default=0.15,
@@ -282,6 +304,23 @@ class RobustScalerConfig(NumericalStrategyInstanceConfig):
 class BoxCoxConfig(NumericalStrategyInstanceConfig):
     min_skewness: float = Field(default=1.5)
     shift_epsilon: float = Field(default=1e-6, gt=0.0)
+    sample_size: int = Field(default=100_000, gt=1)
+    radius: float = 1.0
+    embedding: NumericalEmbeddingConfig = Field(
+        default_factory=lambda: NumericalEmbeddingConfig(
+            skewness_sensitivity=1.0,
+            outliers_sensitivity=0.7,
+            missing_ratio_fit=0.5,
+            distribution_preservation=0.1,
+            target_safety=0.0,
+            cardinality_fit=0.3,
+        )
+    )
+
+
+class YeoJohnsonConfig(NumericalStrategyInstanceConfig):
+    min_skewness: float = Field(default=1.5)
+    sample_size: int = Field(default=100_000, gt=1)
     radius: float = 1.0
     embedding: NumericalEmbeddingConfig = Field(
         default_factory=lambda: NumericalEmbeddingConfig(
@@ -309,6 +348,74 @@ class SqrtTransformConfig(NumericalStrategyInstanceConfig):
     )
 
 
+class KNNImputationConfig(NumericalStrategyInstanceConfig):
+    enabled: bool = False  # opt-in: the column must then be transformed with its frame
+    radius: float = 1.9
+    embedding: NumericalEmbeddingConfig = Field(
+        default_factory=lambda: NumericalEmbeddingConfig(
+            skewness_sensitivity=0.5,
+            outliers_sensitivity=0.2,
+            missing_ratio_fit=1.0,
+            distribution_preservation=1.0,
+            target_safety=0.0,
+            cardinality_fit=0.2,
+        )
+    )
+    n_neighbors: int = Field(default=5, gt=0)
+    max_reference: int = Field(default=10_000, gt=0)
+    block_size: int = Field(default=512, gt=0)
+    n_jobs: int = Field(
+        default=-1, description="Threads (-1 = HardwareConfig.cpu_limit)"
+    )
+    seed: int = 0
+
+
+class PanelFillConfig(NumericalStrategyInstanceConfig):
+    enabled: bool = False  # opt-in: needs the frame, and usually `group_by`
+    radius: float = 1.9
+    group_by: str | None = Field(default=None, description="Entity id column")
+    order_by: str | None = Field(default=None, description="Timestamp column")
+
+
+class InterpolationImputationConfig(PanelFillConfig):
+    embedding: NumericalEmbeddingConfig = Field(
+        default_factory=lambda: NumericalEmbeddingConfig(
+            skewness_sensitivity=0.5,
+            outliers_sensitivity=0.3,
+            missing_ratio_fit=0.9,
+            distribution_preservation=1.0,
+            target_safety=0.0,
+            cardinality_fit=0.1,
+        )
+    )
+
+
+class ForwardFillImputationConfig(PanelFillConfig):
+    embedding: NumericalEmbeddingConfig = Field(
+        default_factory=lambda: NumericalEmbeddingConfig(
+            skewness_sensitivity=0.5,
+            outliers_sensitivity=0.3,
+            missing_ratio_fit=0.8,
+            distribution_preservation=0.8,
+            target_safety=0.0,
+            cardinality_fit=0.5,
+        )
+    )
+
+
+class BackwardFillImputationConfig(PanelFillConfig):
+    embedding: NumericalEmbeddingConfig = Field(
+        default_factory=lambda: NumericalEmbeddingConfig(
+            skewness_sensitivity=0.5,
+            outliers_sensitivity=0.3,
+            missing_ratio_fit=0.7,
+            distribution_preservation=0.8,
+            target_safety=0.0,
+            cardinality_fit=0.5,
+        )
+    )
+
+
 class NumericalImputationStrategiesConfig(StrategyConfigModel):
     median: MedianImputationConfig = Field(default_factory=MedianImputationConfig)
     mean: MeanImputationConfig = Field(default_factory=MeanImputationConfig)
@@ -320,6 +427,16 @@ class NumericalImputationStrategiesConfig(StrategyConfigModel):
     lower_boundary: LowerBoundaryImputationConfig = Field(
         default_factory=LowerBoundaryImputationConfig
     )
+    knn: KNNImputationConfig = Field(default_factory=KNNImputationConfig)
+    interpolate: InterpolationImputationConfig = Field(
+        default_factory=InterpolationImputationConfig
+    )
+    ffill: ForwardFillImputationConfig = Field(
+        default_factory=ForwardFillImputationConfig
+    )
+    bfill: BackwardFillImputationConfig = Field(
+        default_factory=BackwardFillImputationConfig
+    )
 
 
 class NumericalImputationRegistryConfig(StrategyConfigModel):
@@ -366,6 +483,7 @@ class NumericalScalingStrategiesConfig(StrategyConfigModel):
     log_transform: LogTransformConfig = Field(default_factory=LogTransformConfig)
     robust_scaler: RobustScalerConfig = Field(default_factory=RobustScalerConfig)
     box_cox: BoxCoxConfig = Field(default_factory=BoxCoxConfig)
+    yeo_johnson: YeoJohnsonConfig = Field(default_factory=YeoJohnsonConfig)
     sqrt_transform: SqrtTransformConfig = Field(default_factory=SqrtTransformConfig)
 
 
@@ -397,5 +515,124 @@ class NumericStrategiesConfig(StrategyConfigModel):
     )
 
 
+class DateFeaturesConfig(DatetimeStrategyInstanceConfig):
+    radius: float = 1.5
+    embedding: DatetimeEmbeddingConfig = Field(
+        default_factory=lambda: DatetimeEmbeddingConfig(
+            missing_ratio_fit=0.5,
+            distribution_preservation=1.0,
+            target_safety=0.0,
+            cardinality_fit=0.0,
+            regularity_fit=0.5,
+            time_of_day_fit=0.5,
+        )
+    )
+    components: tuple[str, ...] = COMPONENTS
+
+
+class DatetimeFeaturesStrategiesConfig(StrategyConfigModel):
+    date_features: DateFeaturesConfig = Field(default_factory=DateFeaturesConfig)
+
+
+class DatetimeFeaturesRegistryConfig(StrategyConfigModel):
+    weights: StrategyWeightsConfig = Field(default_factory=StrategyWeightsConfig)
+    strategies: DatetimeFeaturesStrategiesConfig = Field(
+        default_factory=DatetimeFeaturesStrategiesConfig
+    )
+
+
+class DatetimeStrategiesConfig(StrategyConfigModel):
+    features: DatetimeFeaturesRegistryConfig = Field(
+        default_factory=DatetimeFeaturesRegistryConfig
+    )
+
+
+class OneHotConfig(CategoricalStrategyInstanceConfig):
+    radius: float = 3.0
+    embedding: CategoricalEmbeddingConfig = Field(
+        default_factory=lambda: CategoricalEmbeddingConfig(
+            missing_ratio_fit=0.5,
+            distribution_preservation=1.0,
+            target_safety=0.0,
+            cardinality_fit=0.0,
+            rare_categories_handling=0.5,
+            imbalance_sensitivity=0.5,
+            order_awareness=0.0,
+            typo_tolerance=0.5,
+        )
+    )
+    max_categories: int = Field(default=10_000, gt=0)
+
+
+class HashingConfig(CategoricalStrategyInstanceConfig):
+    radius: float = 3.0
+    embedding: CategoricalEmbeddingConfig = Field(
+        default_factory=lambda: CategoricalEmbeddingConfig(
+            missing_ratio_fit=0.5,
+            distribution_preservation=1.0,
+            target_safety=0.0,
+            cardinality_fit=1.0,
+            rare_categories_handling=0.5,
+            imbalance_sensitivity=0.5,
+            order_awareness=0.0,
+            typo_tolerance=0.5,
+        )
+    )
+    n_features: int = Field(default=1 << 16, gt=0)
+    alternate_sign: bool = True
+
+
+class CategoricalEncodingStrategiesConfig(StrategyConfigModel):
+    one_hot: OneHotConfig = Field(default_factory=OneHotConfig)
+    hashing: HashingConfig = Field(default_factory=HashingConfig)
+
+
+class CategoricalEncodingRegistryConfig(StrategyConfigModel):
+    weights: StrategyWeightsConfig = Field(default_factory=StrategyWeightsConfig)
+    strategies: CategoricalEncodingStrategiesConfig = Field(
+        default_factory=CategoricalEncodingStrategiesConfig
+    )
+
+
+class RareGroupingConfig(CategoricalStrategyInstanceConfig):
+    radius: float = 3.0
+    embedding: CategoricalEmbeddingConfig = Field(
+        default_factory=lambda: CategoricalEmbeddingConfig(
+            missing_ratio_fit=0.5,
+            distribution_preservation=0.5,
+            target_safety=0.0,
+            cardinality_fit=1.0,
+            rare_categories_handling=1.0,
+            imbalance_sensitivity=0.5,
+            order_awareness=0.0,
+            typo_tolerance=0.5,
+        )
+    )
+
+
+class CategoricalRareStrategiesConfig(StrategyConfigModel):
+    rare_grouping: RareGroupingConfig = Field(default_factory=RareGroupingConfig)
+
+
+class CategoricalRareRegistryConfig(StrategyConfigModel):
+    weights: StrategyWeightsConfig = Field(default_factory=StrategyWeightsConfig)
+    strategies: CategoricalRareStrategiesConfig = Field(
+        default_factory=CategoricalRareStrategiesConfig
+    )
+
+
+class CategoricalStrategiesConfig(StrategyConfigModel):
+    rare: CategoricalRareRegistryConfig = Field(
+        default_factory=CategoricalRareRegistryConfig
+    )
+    encoding: CategoricalEncodingRegistryConfig = Field(
+        default_factory=CategoricalEncodingRegistryConfig
+    )
+
+
 class StrategiesConfig(StrategyConfigModel):
     numeric: NumericStrategiesConfig = Field(default_factory=NumericStrategiesConfig)
+    categorical: CategoricalStrategiesConfig = Field(
+        default_factory=CategoricalStrategiesConfig
+    )
+    datetime: DatetimeStrategiesConfig = Field(default_factory=DatetimeStrategiesConfig)
@@ -1,14 +1,19 @@
-from typing import Optional, Type
+from typing import Optional
 
 from pills_core._enums import ColumnRole, TransformPhase
-from pills_core.strategies.base import SingleStrategy
+from pills_core.config import HardwareConfig
+from pills_core.memory import MemoryGovernor
 from pills_core.strategies.config import (
+    KNNImputationConfig,
     NumericalImputationRegistryConfig,
     NumericalOutlierRegistryConfig,
     NumericalScalingRegistryConfig,
-    NumericalStrategyInstanceConfig,
 )
 from pills_core.strategies.numeric.imputation import (
+    BackwardFillImputation,
+    ForwardFillImputation,
+    InterpolationImputation,
+    KNNImputation,
     LowerBoundaryImputation,
     MeanImputation,
     MedianImputation,
@@ -28,57 +33,61 @@ from pills_core.strategies.numeric.scaling import (
     RobustScalerStrategy,
     SqrtTransformStrategy,
     StandardScalerStrategy,
+    YeoJohnsonStrategy,
 )
-from pills_core.strategies.registry import StrategyRegistry
-
-
-def _build_if_enabled(
-    strategy: Type[SingleStrategy],
-    cfg: NumericalStrategyInstanceConfig,
-) -> Optional[SingleStrategy]:
-    if not cfg.enabled:
-        return None
-
-    try:
-        return strategy(
-            embedding=cfg.embedding.as_embedding(),
-            **cfg.model_dump(by_alias=True, exclude={"enabled", "embedding"}),
-        )
-
-    except TypeError as e:
-        raise ValueError(f"{strategy.__name__} config mismatch: {e}")
+from pills_core.strategies.registry import StrategyRegistry, build_if_enabled
 
 
 def build_imputation_registry(
     config: NumericalImputationRegistryConfig,
+    hardware: Optional[HardwareConfig] = None,
+    governor: Optional[MemoryGovernor] = None,
 ) -> StrategyRegistry:
+    """
+    The numerical IMPUTATION registry. KNN threads left at -1 follow
+    `hardware.cpu_limit`, and are capped by `governor` (one for `hardware`
+    by default) to the blocks that fit the memory budget.
+    """
     s = config.strategies
 
     strategies = [
-        _build_if_enabled(
+        build_if_enabled(
             MedianImputation,
             s.median,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             MeanImputation,
             s.mean,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             ModeImputation,
             s.mode,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             ZeroImputation,
             s.constant_zero,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             UpperBoundaryImputation,
             s.upper_boundary,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             LowerBoundaryImputation,
             s.lower_boundary,
         ),
+        _build_knn(s.knn, hardware, governor),
+        build_if_enabled(
+            InterpolationImputation,
+            s.interpolate,
+        ),
+        build_if_enabled(
+            ForwardFillImputation,
+            s.ffill,
+        ),
+        build_if_enabled(
+            BackwardFillImputation,
+            s.bfill,
+        ),
     ]
 
     return StrategyRegistry(
@@ -88,21 +97,37 @@ def build_imputation_registry(
     ).bulk_register(strategies)
 
 
+def _build_knn(
+    cfg: KNNImputationConfig,
+    hardware: Optional[HardwareConfig],
+    governor: Optional[MemoryGovernor],
+) -> Optional[KNNImputation]:
+    if not cfg.enabled:
+        return None
+    hardware = hardware or HardwareConfig()
+    return build_if_enabled(
+        KNNImputation,
+        cfg,
+        n_jobs=cfg.n_jobs if cfg.n_jobs > 0 else hardware.cpu_limit,
+        governor=governor or MemoryGovernor(hardware),
+    )
+
+
 def build_outliers_registry(
     config: NumericalOutlierRegistryConfig,
 ) -> StrategyRegistry:
     s = config.strategies
 
     strategies = [
-        _build_if_enabled(
+        build_if_enabled(
             IQRStrategy,
             s.iqr,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             WinsorizeStrategy,
             s.winsorize,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             ZScoreStrategy,
             s.z_score,
         ),
@@ -121,27 +146,31 @@ def build_scaling_registry(
     s = config.strategies
 
     strategies = [
-        _build_if_enabled(
+        build_if_enabled(
             StandardScalerStrategy,
             s.standard_scaler,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             MinMaxScalerStrategy,
             s.min_max_scaler,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             LogTransformStrategy,
             s.log_transform,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             RobustScalerStrategy,
             s.robust_scaler,
         ),
-        _build_if_enabled(
+        build_if_enabled(
             BoxCoxStrategy,
             s.box_cox,
         ),
-        _build_if_enabled(
+        build_if_enabled(
+            YeoJohnsonStrategy,
+            s.yeo_johnson,
+        ),
+        build_if_enabled(
             SqrtTransformStrategy,
             s.sqrt_transform,
         ),
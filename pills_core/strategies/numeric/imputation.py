@@ -1,10 +1,17 @@
-from typing import ClassVar
+import os
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from pills_core._datetime import NAT, datetime_ns
 from pills_core._enums import FamilyRole, SemanticRole, TaskType, TransformPhase
+from pills_core._knn import knn_impute, sample_reference, worker_bytes
+from pills_core._panel import backward_fill, forward_fill, interpolate, sort_panel
 from pills_core.explain import Explanation
-from pills_core.strategies.base import ColumnMeta
+from pills_core.memory import MemoryGovernor
+from pills_core.strategies.base import ColumnMeta, FittedParams, frame_required
 from pills_core.strategies.numeric.base import (
     NumericalColumnMeta,
     NumericalEmbedding,
@@ -110,6 +117,11 @@ class MedianImputation(NumericalImputationStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return data.fillna(stats.median)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "fill", "value": float(stats.median)}
+
 
 class MeanImputation(NumericalImputationStrategy):
     name: ClassVar[str] = "mean"
@@ -130,6 +142,11 @@ class MeanImputation(NumericalImputationStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return data.fillna(stats.mean)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "fill", "value": float(stats.mean)}
+
 
 class ModeImputation(NumericalImputationStrategy):
     name: ClassVar[str] = "mode"
@@ -151,6 +168,11 @@ class ModeImputation(NumericalImputationStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return data.fillna(stats.mode)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "fill", "value": float(stats.mode)}
+
 
 class ZeroImputation(NumericalImputationStrategy):
     name: ClassVar[str] = "constant_zero"
@@ -173,6 +195,11 @@ class ZeroImputation(NumericalImputationStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return data.fillna(0)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "fill", "value": 0.0}
+
 
 class UpperBoundaryImputation(NumericalImputationStrategy):
     name: ClassVar[str] = "upper_boundary"
@@ -207,6 +234,14 @@ class UpperBoundaryImputation(NumericalImputationStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return data.fillna(stats.mean + self.std_multiplier * stats.std)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {
+            "op": "fill",
+            "value": float(stats.mean + self.std_multiplier * stats.std),
+        }
+
 
 class LowerBoundaryImputation(NumericalImputationStrategy):
     name: ClassVar[str] = "lower_boundary"
@@ -242,3 +277,267 @@ class LowerBoundaryImputation(NumericalImputationStrategy):
 
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return data.fillna(stats.mean - self.std_multiplier * stats.std)
+
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {
+            "op": "fill",
+            "value": float(stats.mean - self.std_multiplier * stats.std),
+        }
+
+
+class FrameImputationStrategy(NumericalImputationStrategy):
+    """Imputation reading other columns: only `fit_frame`/`apply_frame` run."""
+
+    needs_frame: ClassVar[bool] = True
+
+    def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
+        raise frame_required(self)
+
+
+class KNNImputation(FrameImputationStrategy):
+    """
+    Fills each missing value with the mean of its `n_neighbors` nearest
+    rows, compared on the frame's other numerical columns after
+    standardizing them.
+
+    Neighbours are drawn from at most `max_reference` complete training
+    rows, sampled once at fit time, and missing rows are processed in
+    blocks of `block_size` on `n_jobs` threads (-1 for all cores), so
+    memory stays bounded whatever the row count. With a governor, threads
+    are capped to the blocks that fit the memory budget. Query rows with
+    missing features are compared on the features they have; features
+    missing on every training row are left out.
+    """
+
+    name: ClassVar[str] = "knn"
+    family_role: ClassVar[FamilyRole] = FamilyRole.NEIGHBOR
+
+    fills_with_existing_value: ClassVar[bool] = False
+    sensitive_to_outliers: ClassVar[bool] = False
+    sensitive_to_skewness: ClassVar[bool] = False
+    preserves_distribution: ClassVar[bool] = True
+    safe_for_target: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        *,
+        embedding: NumericalEmbedding,
+        radius: float,
+        n_neighbors: int,
+        max_reference: int,
+        block_size: int,
+        n_jobs: int,
+        seed: int = 0,
+        governor: Optional[MemoryGovernor] = None,
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        self.n_neighbors = n_neighbors
+        self.max_reference = max_reference
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+        self.seed = seed
+        self.governor = governor
+
+    def fit_frame(
+        self, data: pd.Series, frame: pd.DataFrame, stats: NumericalColumnStats
+    ) -> Dict[str, Any]:
+        features = tuple(
+            column
+            for column in frame.columns
+            if column != data.name
+            and pd.api.types.is_numeric_dtype(frame[column].dtype)
+            and frame[column].notna().any()
+        )
+        matrix = self._features(frame, features, data.index)
+        target = data.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        complete = ~np.isnan(target) & ~np.isnan(matrix).any(axis=1)
+        rows = sample_reference(complete, self.max_reference, self.seed)
+        reference = matrix[rows]
+        center = reference.mean(axis=0) if len(rows) else np.zeros(len(features))
+        scale = reference.std(axis=0) if len(rows) else np.ones(len(features))
+        scale[scale == 0] = 1.0
+
+        return {
+            "features": features,
+            "center": center,
+            "scale": scale,
+            "reference": (reference - center) / scale,
+            "values": target[rows],
+        }
+
+    def apply_frame(
+        self,
+        data: pd.Series,
+        frame: pd.DataFrame,
+        stats: NumericalColumnStats,
+        params: FittedParams,
+    ) -> pd.Series:
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        missing = np.flatnonzero(np.isnan(values))
+        if len(missing) == 0:
+            return data
+        if len(params["values"]) == 0:  # no complete training row to learn from
+            return data.fillna(stats.median)
+
+        matrix = self._features(frame, params["features"], data.index, missing)
+        values[missing] = knn_impute(
+            (matrix - params["center"]) / params["scale"],
+            params["reference"],
+            params["values"],
+            k=self.n_neighbors,
+            block_size=self.block_size,
+            n_jobs=self._threads(len(params["values"])),
+        )
+        return pd.Series(values, index=data.index, name=data.name)
+
+    def _threads(self, n_reference: int) -> int:
+        n_jobs = self.n_jobs if self.n_jobs > 0 else os.cpu_count() or 1
+        if self.governor is None:
+            return n_jobs
+        return self.governor.cap_workers(
+            n_jobs, worker_bytes(self.block_size, n_reference)
+        )
+
+    @staticmethod
+    def _features(
+        frame: pd.DataFrame,
+        features: Tuple[str, ...],
+        index: pd.Index,
+        rows: Any = slice(None),
+    ) -> np.ndarray:
+        block = frame[list(features)]
+        if not block.index.equals(index):
+            block = block.reindex(index)  # align the frame's rows by label
+        return block.iloc[rows].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def explain(
+        self, stats: NumericalColumnStats, meta: NumericalColumnMeta
+    ) -> Explanation:
+        explanation = super().explain(stats, meta)
+        explanation.reasons.append(
+            f"n_neighbors={self.n_neighbors}, max_reference={self.max_reference}"
+        )
+        return explanation
+
+
+class PanelFillStrategy(FrameImputationStrategy, ABC):
+    """
+    Fills gaps from neighbouring rows of the same `group_by` entity,
+    ordered by `order_by` (a datetime or numerical column). Either may be
+    None: one group, or the frame's row order.
+
+    Rows are sorted by (group, time) once and filled segment-wise in that
+    order; gaps left by groups with no value at all take the median.
+    """
+
+    family_role: ClassVar[FamilyRole] = FamilyRole.SEQUENTIAL
+
+    fills_with_existing_value: ClassVar[bool] = True
+    preserves_distribution: ClassVar[bool] = True
+    safe_for_target: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        *,
+        embedding: NumericalEmbedding,
+        radius: float,
+        group_by: Optional[str] = None,
+        order_by: Optional[str] = None,
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        self.group_by = group_by
+        self.order_by = order_by
+
+    def fit_frame(
+        self, data: pd.Series, frame: pd.DataFrame, stats: NumericalColumnStats
+    ) -> Dict[str, Any]:
+        absent = [
+            column
+            for column in (self.group_by, self.order_by)
+            if column is not None and column not in frame.columns
+        ]
+        if absent:
+            raise ValueError(f"'{self.name}' needs columns {absent} in the frame.")
+        return {}
+
+    def apply_frame(
+        self,
+        data: pd.Series,
+        frame: pd.DataFrame,
+        stats: NumericalColumnStats,
+        params: FittedParams,
+    ) -> pd.Series:
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        if not np.isnan(values).any():
+            return data
+        if not frame.index.equals(data.index):
+            frame = frame.reindex(data.index)  # align the frame's rows by label
+
+        if self.group_by is None:
+            codes = np.zeros(len(values), dtype=np.int64)
+        else:
+            codes, _ = pd.factorize(frame[self.group_by], use_na_sentinel=False)
+        times = None if self.order_by is None else self._times(frame[self.order_by])
+
+        order, starts = sort_panel(codes, times)
+        ordered_times = None if times is None else times[order].astype(np.float64)
+        if ordered_times is not None and times.dtype.kind in "iu":
+            ordered_times[times[order] == NAT] = np.nan
+
+        filled = np.empty_like(values)
+        filled[order] = self.fill(values[order], ordered_times, starts)
+        filled[np.isnan(filled)] = stats.median
+        return pd.Series(filled, index=data.index, name=data.name)
+
+    @abstractmethod
+    def fill(
+        self, values: np.ndarray, times: Optional[np.ndarray], starts: np.ndarray
+    ) -> np.ndarray:
+        """`values` filled in (group, time) order; `starts` flags each group."""
+
+    @staticmethod
+    def _times(series: pd.Series) -> np.ndarray:
+        if pd.api.types.is_integer_dtype(series.dtype) and not series.hasnans:
+            return series.to_numpy(dtype=np.int64)
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            return series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return datetime_ns(series)
+
+    def explain(
+        self, stats: NumericalColumnStats, meta: NumericalColumnMeta
+    ) -> Explanation:
+        explanation = super().explain(stats, meta)
+        explanation.reasons.append(
+            f"group_by={self.group_by}, order_by={self.order_by}"
+        )
+        return explanation
+
+
+class InterpolationImputation(PanelFillStrategy):
+    name: ClassVar[str] = "interpolate"
+
+    def fill(
+        self, values: np.ndarray, times: Optional[np.ndarray], starts: np.ndarray
+    ) -> np.ndarray:
+        return interpolate(values, times, starts)
+
+
+class ForwardFillImputation(PanelFillStrategy):
+    name: ClassVar[str] = "ffill"
+
+    def fill(
+        self, values: np.ndarray, times: Optional[np.ndarray], starts: np.ndarray
+    ) -> np.ndarray:
+        return forward_fill(values, starts)
+
+
+class BackwardFillImputation(PanelFillStrategy):
+    name: ClassVar[str] = "bfill"
+
+    def fill(
+        self, values: np.ndarray, times: Optional[np.ndarray], starts: np.ndarray
+    ) -> np.ndarray:
+        return backward_fill(values, starts)
@@ -1,9 +1,11 @@
-from typing import ClassVar
+from typing import Any, ClassVar, Dict
 
+import numpy as np
 import pandas as pd
 
 from pills_core._enums import FamilyRole, SemanticRole, TransformPhase
 from pills_core.explain import Explanation
+from pills_core.strategies.base import FittedParams
 from pills_core.strategies.numeric.base import (
     NumericalColumnMeta,
     NumericalEmbedding,
@@ -123,6 +125,16 @@ class IQRStrategy(NumericalOutlierStrategy):
             upper=stats.q3 + self.clip_multiplier * iqr,
         )
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        iqr = stats.q3 - stats.q1
+        return {
+            "op": "clip",
+            "lower": float(stats.q1 - self.clip_multiplier * iqr),
+            "upper": float(stats.q3 + self.clip_multiplier * iqr),
+        }
+
 
 class ZScoreStrategy(NumericalOutlierStrategy):
     name: ClassVar[str] = "z-score"
@@ -158,6 +170,15 @@ class ZScoreStrategy(NumericalOutlierStrategy):
 
         return data.clip(lower=lower, upper=upper)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {
+            "op": "clip",
+            "lower": float(stats.mean - self.threshold * stats.std),
+            "upper": float(stats.mean + self.threshold * stats.std),
+        }
+
 
 class WinsorizeStrategy(NumericalOutlierStrategy):
     name: ClassVar[str] = "winsorize"
@@ -203,7 +224,23 @@ class WinsorizeStrategy(NumericalOutlierStrategy):
 
         return True
 
+    def fit(self, data: pd.Series, stats: NumericalColumnStats) -> Dict[str, float]:
+        """Percentile bounds of the training data, frozen for scoring."""
+        lower, upper = data.quantile([self.lower_quantile, self.upper_quantile])
+        return {"lower": float(lower), "upper": float(upper)}
+
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
-        lower = data.quantile(self.lower_quantile)
-        upper = data.quantile(self.upper_quantile)
-        return data.clip(lower, upper)
+        return self.apply_fitted(data, stats, self.fit(data, stats))
+
+    def apply_fitted(
+        self, data: pd.Series, stats: NumericalColumnStats, params: FittedParams
+    ) -> pd.Series:
+        clipped = np.clip(
+            data.to_numpy(dtype=np.float64), params["lower"], params["upper"]
+        )
+        return pd.Series(clipped, index=data.index, name=data.name)
+
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "clip", "lower": params["lower"], "upper": params["upper"]}
@@ -1,11 +1,12 @@
-from typing import ClassVar, cast
+from typing import Any, ClassVar, Dict
 
 import numpy as np
 import pandas as pd
-from scipy import stats as sstats
 
 from pills_core._enums import FamilyRole, SemanticRole, TaskType, TransformPhase
 from pills_core.explain import Explanation
+from pills_core.runtime import box_cox, yeo_johnson
+from pills_core.strategies.base import FittedParams, InverseKernel
 from pills_core.strategies.numeric.base import (
     NumericalColumnMeta,
     NumericalEmbedding,
@@ -14,6 +15,26 @@ from pills_core.strategies.numeric.base import (
 from pills_core.types.stats import NumericalColumnStats
 
 
+def _affine_inverse(center: float, scale: float) -> InverseKernel:
+    def kernel(values: np.ndarray) -> None:
+        values *= scale
+        values += center
+
+    return kernel
+
+
+def _identity_inverse(values: np.ndarray) -> None:
+    pass
+
+
+def _expm1_inverse(values: np.ndarray) -> None:
+    np.expm1(values, out=values)
+
+
+def _square_inverse(values: np.ndarray) -> None:
+    np.square(values, out=values)
+
+
 class NumericalScalingStrategy(NumericalStrategy):
     requires_non_negative: ClassVar[bool] = False  # LogTransform, SqrtTransform
     is_invertible: ClassVar[bool] = True  # whether inverse denormalization is possible
@@ -96,6 +117,16 @@ class StandardScalerStrategy(NumericalScalingStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return (data - stats.mean) / stats.std
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "affine", "center": float(stats.mean), "scale": float(stats.std)}
+
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        return _affine_inverse(float(stats.mean), float(stats.std))
+
 
 class MinMaxScalerStrategy(NumericalScalingStrategy):
     name: ClassVar[str] = "min_max_scaler"
@@ -122,6 +153,20 @@ class MinMaxScalerStrategy(NumericalScalingStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return (data - stats.min) / (stats.max - stats.min)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {
+            "op": "affine",
+            "center": float(stats.min),
+            "scale": float(stats.max - stats.min),
+        }
+
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        return _affine_inverse(float(stats.min), float(stats.max - stats.min))
+
 
 class LogTransformStrategy(NumericalScalingStrategy):
     name: ClassVar[str] = "log_transform"
@@ -169,6 +214,16 @@ class LogTransformStrategy(NumericalScalingStrategy):
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return pd.Series(np.log1p(data), index=data.index)
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "log1p"}
+
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        return _expm1_inverse
+
 
 class RobustScalerStrategy(NumericalScalingStrategy):
     name: ClassVar[str] = "robust_scaler"
@@ -185,6 +240,31 @@ class RobustScalerStrategy(NumericalScalingStrategy):
             return data
         return (data - stats.median) / iqr
 
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        iqr = stats.q3 - stats.q1
+        if iqr == 0:
+            return {"op": "identity"}
+        return {"op": "affine", "center": float(stats.median), "scale": float(iqr)}
+
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        iqr = stats.q3 - stats.q1
+        if iqr == 0:
+            return _identity_inverse
+        return _affine_inverse(float(stats.median), float(iqr))
+
+
+def _lambda_sample(values: np.ndarray, sample_size: int) -> np.ndarray:
+    """The finite values, subsampled to `sample_size` for lambda estimation."""
+    values = values[np.isfinite(values)]
+    if len(values) > sample_size:
+        rng = np.random.default_rng(42)
+        values = rng.choice(values, size=sample_size, replace=False)
+    return values
+
 
 class BoxCoxStrategy(NumericalScalingStrategy):
     name: ClassVar[str] = "box_cox"
@@ -195,7 +275,7 @@ class BoxCoxStrategy(NumericalScalingStrategy):
         False  # changes the shape of the distribution
     )
     sensitive_to_outliers: ClassVar[bool] = True
-    is_invertible: ClassVar[bool] = False  # currently not invertible
+    is_invertible: ClassVar[bool] = True
 
     def __init__(
         self,
@@ -204,11 +284,12 @@ class BoxCoxStrategy(NumericalScalingStrategy):
         radius: float,
         min_skewness: float,
         shift_epsilon: float,
+        sample_size: int = 100_000,
     ) -> None:
         super().__init__(embedding=embedding, radius=radius)
         self.min_skewness = min_skewness
         self.shift_epsilon = shift_epsilon
-        self.shift_: float = 0.0
+        self.sample_size = sample_size
 
     def should_apply(
         self, stats: NumericalColumnStats, meta: NumericalColumnMeta
@@ -230,20 +311,133 @@ class BoxCoxStrategy(NumericalScalingStrategy):
 
         return True
 
+    def fit(self, data: pd.Series, stats: NumericalColumnStats) -> Dict[str, float]:
+        """Shift making the column positive and the MLE lambda on a sample."""
+        values = data.to_numpy(dtype=np.float64)
+        min_val = float(np.nanmin(values)) if len(values) else 1.0
+        shift = abs(min_val) + self.shift_epsilon if min_val <= 0 else 0.0
+        sample = _lambda_sample(values, self.sample_size) + shift
+        if len(np.unique(sample)) < 2:  # no shape to estimate
+            return {"lambda": 1.0, "shift": shift}
+
+        from scipy import stats as sstats  # heavy, only needed by Box-Cox
+
+        lmbda = sstats.boxcox_normmax(sample, method="mle")
+        return {"lambda": float(lmbda), "shift": shift}
+
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
-        values: np.ndarray = data.to_numpy(dtype=np.float64, copy=True)
+        return self.apply_fitted(data, stats, self.fit(data, stats))
+
+    def apply_fitted(
+        self, data: pd.Series, stats: NumericalColumnStats, params: FittedParams
+    ) -> pd.Series:
+        transformed = box_cox(data.to_numpy(), params["lambda"], params["shift"])
+        return pd.Series(transformed, index=data.index, name=data.name)
+
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "box_cox", "lambda": params["lambda"], "shift": params["shift"]}
 
-        min_val: float = float(values.min())
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        lmbda, shift = params["lambda"], params["shift"]
 
-        if min_val <= 0:
-            self.shift_ = abs(min_val) + self.shift_epsilon
-            values = values + self.shift_
+        def kernel(values: np.ndarray) -> None:
+            if lmbda == 0:
+                np.exp(values, out=values)
+            else:
+                values *= lmbda
+                values += 1.0
+                with np.errstate(invalid="ignore"):  # outside the range: NaN
+                    np.power(values, 1.0 / lmbda, out=values)
+            values -= shift
 
-        result = sstats.boxcox(values)
+        return kernel
 
-        transformed, _ = cast(tuple[np.ndarray, float], result)
 
-        return pd.Series(transformed, index=data.index)
+class YeoJohnsonStrategy(NumericalScalingStrategy):
+    """Power transform for skewed columns that may hold negative values."""
+
+    name: ClassVar[str] = "yeo_johnson"
+    family_role: ClassVar[FamilyRole] = FamilyRole.SKEW_TRANSFORM
+
+    preserves_distribution: ClassVar[bool] = False
+    sensitive_to_outliers: ClassVar[bool] = True
+    is_invertible: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        *,
+        embedding: NumericalEmbedding,
+        radius: float,
+        min_skewness: float,
+        sample_size: int = 100_000,
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        self.min_skewness = min_skewness
+        self.sample_size = sample_size
+
+    def should_apply(
+        self, stats: NumericalColumnStats, meta: NumericalColumnMeta
+    ) -> bool:
+        if abs(stats.skewness) <= self.min_skewness:
+            return False
+
+        return super().should_apply(stats, meta)
+
+    def is_domain_valid(self, meta: NumericalColumnMeta) -> bool:
+        if meta.domain_profile.is_rate or meta.domain_profile.is_ratio:
+            return False
+
+        return True
+
+    def fit(self, data: pd.Series, stats: NumericalColumnStats) -> Dict[str, float]:
+        sample = _lambda_sample(data.to_numpy(dtype=np.float64), self.sample_size)
+        if len(np.unique(sample)) < 2:
+            return {"lambda": 1.0}  # identity
+
+        from scipy import stats as sstats  # heavy, only needed by Yeo-Johnson
+
+        return {"lambda": float(sstats.yeojohnson_normmax(sample))}
+
+    def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
+        return self.apply_fitted(data, stats, self.fit(data, stats))
+
+    def apply_fitted(
+        self, data: pd.Series, stats: NumericalColumnStats, params: FittedParams
+    ) -> pd.Series:
+        transformed = yeo_johnson(data.to_numpy(), params["lambda"])
+        return pd.Series(transformed, index=data.index, name=data.name)
+
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "yeo_johnson", "lambda": params["lambda"]}
+
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        lmbda = params["lambda"]
+
+        def kernel(values: np.ndarray) -> None:
+            positive = values >= 0
+            negative = values < 0
+            up, down = values[positive], values[negative]
+            with np.errstate(invalid="ignore"):
+                if lmbda == 0:
+                    values[positive] = np.expm1(up)
+                else:
+                    values[positive] = np.expm1(np.log1p(lmbda * up) / lmbda)
+                if lmbda == 2:
+                    values[negative] = -np.expm1(-down)
+                else:
+                    values[negative] = -np.expm1(
+                        np.log1p(-(2 - lmbda) * down) / (2 - lmbda)
+                    )
+
+        return kernel
 
 
 class SqrtTransformStrategy(NumericalScalingStrategy):
@@ -263,3 +457,13 @@ class SqrtTransformStrategy(NumericalScalingStrategy):
 
     def apply(self, data: pd.Series, stats: NumericalColumnStats) -> pd.Series:
         return pd.Series(np.sqrt(data), index=data.index)
+
+    def runtime_op(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> Dict[str, Any]:
+        return {"op": "sqrt"}
+
+    def inverse_kernel(
+        self, stats: NumericalColumnStats, params: FittedParams
+    ) -> InverseKernel:
+        return _square_inverse
@@ -1,9 +1,45 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from pills_core._enums import ColumnRole, TransformPhase
 from pills_core.strategies.base import ColumnMeta, SingleStrategy, StrategyEmbedding
+from pills_core.strategies.config import (
+    CategoricalStrategyInstanceConfig,
+    DatetimeStrategyInstanceConfig,
+    NumericalStrategyInstanceConfig,
+)
 from pills_core.types.stats import BaseColumnStats
 
+InstanceConfig = (
+    NumericalStrategyInstanceConfig
+    | CategoricalStrategyInstanceConfig
+    | DatetimeStrategyInstanceConfig
+)
+
+
+def build_if_enabled(
+    strategy: Type[SingleStrategy],
+    cfg: InstanceConfig,
+    **shared: Any,
+) -> Optional[SingleStrategy]:
+    """
+    `strategy` built from its instance config, or None when disabled.
+    `shared` are arguments that come from outside the strategy's own config,
+    and take precedence over its fields of the same name.
+    """
+    if not cfg.enabled:
+        return None
+
+    try:
+        return strategy(
+            embedding=cfg.embedding.as_embedding(),
+            **(
+                cfg.model_dump(by_alias=True, exclude={"enabled", "embedding"}) | shared
+            ),
+        )
+
+    except TypeError as e:
+        raise ValueError(f"{strategy.__name__} config mismatch: {e}")
+
 
 class StrategyRegistry:
     def __init__(
@@ -8,7 +8,10 @@ _PHASE = TransformPhase
 _DEFAULT_PHASE_ORDER: Dict[_PHASE, int] = {
     _PHASE.IMPUTATION: 0,
     _PHASE.OUTLIER: 1,
-    _PHASE.SCALING: 2,
+    _PHASE.RARE_GROUPING: 2,
+    _PHASE.SCALING: 3,
+    _PHASE.DATE_FEATURES: 4,
+    _PHASE.ENCODING: 5,
 }
 
 
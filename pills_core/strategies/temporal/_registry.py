@@ -0,0 +1,29 @@
+from typing import Optional
+
+from pills_core._enums import ColumnRole, TransformPhase
+from pills_core.config import DataProcessingConfig
+from pills_core.strategies.config import DatetimeFeaturesRegistryConfig
+from pills_core.strategies.registry import StrategyRegistry, build_if_enabled
+from pills_core.strategies.temporal.features import DateFeaturesStrategy
+
+
+def build_date_features_registry(
+    config: DatetimeFeaturesRegistryConfig,
+    data: Optional[DataProcessingConfig] = None,
+) -> StrategyRegistry:
+    """
+    The DATE_FEATURES registry; left empty when `data.date_features` is off,
+    so datetime columns pass through untouched.
+    """
+    registry = StrategyRegistry(
+        ColumnRole.TIME_SERIES,
+        TransformPhase.DATE_FEATURES,
+        config.weights.as_dict(),
+    )
+    if data is not None and not data.date_features:
+        return registry
+
+    s = config.strategies
+    return registry.bulk_register(
+        [build_if_enabled(DateFeaturesStrategy, s.date_features)]
+    )
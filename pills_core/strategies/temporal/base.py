@@ -0,0 +1,33 @@
+from abc import ABC
+from dataclasses import dataclass
+
+from pills_core._enums import ColumnRole
+from pills_core.strategies.base import ColumnMeta, SingleStrategy, StrategyEmbedding
+from pills_core.types.profiles import DatetimeProfile, StatisticalProfile
+from pills_core.types.stats import DatetimeColumnStats
+
+
+@dataclass
+class DatetimeColumnMeta(ColumnMeta):
+    profile: StatisticalProfile
+    datetime_profile: DatetimeProfile
+
+
+@dataclass
+class DatetimeEmbedding(StrategyEmbedding):
+    regularity_fit: float  # how well it suits evenly spaced timestamps
+    time_of_day_fit: float  # how well it uses sub-daily resolution
+
+
+class DatetimeStrategy(
+    SingleStrategy[DatetimeColumnStats, DatetimeColumnMeta, DatetimeEmbedding], ABC
+):
+    @property
+    def column_type(self) -> ColumnRole:
+        return ColumnRole.TIME_SERIES
+
+    def is_domain_valid(self, meta: DatetimeColumnMeta) -> bool:
+        return True
+
+    def is_task_valid(self, meta: DatetimeColumnMeta) -> bool:
+        return True
@@ -0,0 +1,86 @@
+from typing import ClassVar, Sequence
+
+import pandas as pd
+
+from pills_core._datetime import (
+    COMPONENTS,
+    as_datetime,
+    date_components,
+    datetime_ns,
+)
+from pills_core._enums import FamilyRole, TransformPhase
+from pills_core.explain import Explanation
+from pills_core.strategies.temporal.base import (
+    DatetimeColumnMeta,
+    DatetimeEmbedding,
+    DatetimeStrategy,
+)
+from pills_core.types.stats import DatetimeColumnStats
+
+
+class DateFeaturesStrategy(DatetimeStrategy):
+    """
+    Expands a datetime column into calendar components, one output column
+    each (`<column>_year`, `<column>_month`, ...). Timezone-aware values are
+    decomposed in their local wall-clock time, except `epoch`, which counts
+    seconds to the UTC instant so that it stays monotonic across DST changes.
+    """
+
+    name: ClassVar[str] = "date_features"
+    family_role: ClassVar[FamilyRole] = FamilyRole.DECOMPOSITION
+    expands: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        *,
+        embedding: DatetimeEmbedding,
+        radius: float,
+        components: Sequence[str] = COMPONENTS,
+    ) -> None:
+        super().__init__(embedding=embedding, radius=radius)
+        unknown = set(components) - set(COMPONENTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown date components {sorted(unknown)}; known: {COMPONENTS}"
+            )
+        self.components = tuple(components)
+
+    @property
+    def phase(self) -> TransformPhase:
+        return TransformPhase.DATE_FEATURES
+
+    def should_apply(
+        self, stats: DatetimeColumnStats, meta: DatetimeColumnMeta
+    ) -> bool:
+        return stats.count > 0
+
+    def components_for(self, stats: DatetimeColumnStats) -> tuple[str, ...]:
+        """The configured components, without `hour` for date-only columns."""
+        if stats.has_time:
+            return self.components
+        return tuple(name for name in self.components if name != "hour")
+
+    def apply(self, data: pd.Series, stats: DatetimeColumnStats) -> pd.DataFrame:
+        names = self.components_for(stats)
+        values = as_datetime(data)
+        components = date_components(datetime_ns(values, local=True), names)
+        if "epoch" in names and isinstance(values.dtype, pd.DatetimeTZDtype):
+            components |= date_components(datetime_ns(values), ("epoch",))
+        return pd.DataFrame(
+            {f"{data.name}_{name}": components[name] for name in names},
+            index=data.index,
+        )
+
+    def explain(
+        self, stats: DatetimeColumnStats, meta: DatetimeColumnMeta
+    ) -> Explanation:
+        reasons = [f"Decomposing dates with '{self.name}'"]
+        reasons.append(f"components={', '.join(self.components_for(stats))}")
+        if not stats.has_time:
+            reasons.append("date-only values, hour dropped")
+
+        return Explanation(
+            name=self.name,
+            value="selected" if self.should_apply(stats, meta) else "rejected",
+            reasons=reasons,
+        )
@@ -53,6 +53,14 @@ class StatisticalProfile:
     is_low_variance: bool
 
 
+@dataclass
+class DatetimeProfile:
+    is_regular: bool
+    is_monotonic: bool
+    has_time: bool
+    frequency_seconds: float  # median gap; 0.0 with fewer than two timestamps
+
+
 @dataclass(frozen=True)
 class ColumnTypeProfile:
     name: str
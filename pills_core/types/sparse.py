@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Tuple
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+
+@dataclass(frozen=True, slots=True)
+class SparseBlock:
+    """
+    The columns one categorical column encodes into, as a CSR matrix whose
+    rows line up with `index`.
+    """
+
+    matrix: sparse.csr_matrix
+    columns: Tuple[str, ...]
+    index: pd.Index
+
+    def __post_init__(self) -> None:
+        if self.matrix.shape != (len(self.index), len(self.columns)):
+            raise ValueError(
+                f"matrix shape {self.matrix.shape} does not match "
+                f"{len(self.index)} rows x {len(self.columns)} columns."
+            )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.matrix.shape
+
+    def to_pandas(self) -> pd.DataFrame:
+        """A DataFrame of sparse columns; never densifies the block."""
+        return pd.DataFrame.sparse.from_spmatrix(
+            self.matrix, index=self.index, columns=list(self.columns)
+        )
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import List, TypeVar, Union
 
+import pandas as pd
+
 Numeric = Union[float, int]
 StatsT = TypeVar("StatsT", bound="BaseColumnStats")
 
@@ -44,6 +46,19 @@ class CategoricalColumnStats(BaseColumnStats):
     rare_ratio: float
     entropy: float
     mode: str
+    typo_ratio: float  # share of values misspelling another; 0 until profiled
+
+
+@dataclass
+class DatetimeColumnStats(BaseColumnStats):
+    min: pd.Timestamp  # UTC for timezone-aware columns
+    max: pd.Timestamp
+    span_days: float
+    median_gap_seconds: float  # between consecutive distinct timestamps
+    max_gap_seconds: float
+    regularity: float  # share of those gaps equal to the median gap
+    monotonic_ratio: float
+    has_time: bool  # any value off midnight
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,3 +84,13 @@ class CategoricalThresholds:
     rare_ratio_threshold: float = 0.05
     dominant_ratio_threshold: float = 0.95
     sparse_missing_ratio: float = 0.3
+    typo_min_ratio: float = 0.001
+
+
+@dataclass(frozen=True, slots=True)
+class DatetimeThresholds:
+    regular_min_ratio: float = 0.9
+    monotonic_min_ratio: float = 0.95
+    index_unique_ratio: float = 0.95
+    gap_outlier_factor: float = 10.0  # max gap over median gap
+    sparse_missing_ratio: float = 0.3
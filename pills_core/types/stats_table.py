@@ -0,0 +1,189 @@
+"""
+Columnar storage for the stats of many columns.
+
+A StatsTable keeps one array per stats field instead of one dataclass per
+column. Field names read as whole arrays (`table.skewness > 2`), and rows
+are lightweight views that read like the stats dataclass, so strategies
+and analyzers take them unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields, replace
+from typing import Any, Dict, Generic, Iterator, List, Mapping, Optional, Sequence, Type
+
+import numpy as np
+import pandas as pd
+
+from pills_core.types.stats import StatsT
+
+
+def _column(values: Sequence[Any]) -> np.ndarray:
+    if all(isinstance(v, (bool, int, float, np.number, np.bool_)) for v in values):
+        return np.asarray(values)
+    array = np.empty(len(values), dtype=object)  # strings, lists: one per row
+    array[:] = values
+    return array
+
+
+class StatsRow:
+    """Read-only view of one StatsTable row with the stats dataclass fields."""
+
+    __slots__ = ("_table", "_index", "__weakref__")
+
+    def __init__(self, table: StatsTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):  # before __init__ ran, e.g. while copying
+            raise AttributeError(name)
+        try:
+            value = self._table.arrays[name][self._index]
+        except KeyError:
+            raise AttributeError(
+                f"{self._table.stats_type.__name__} has no field '{name}'"
+            ) from None
+        return value.item() if isinstance(value, np.generic) else value
+
+    @property
+    def column(self) -> str:
+        return self._table.names[self._index]
+
+    def to_stats(self) -> Any:
+        """Materialize the row as its stats dataclass."""
+        return self._table.stats_type(
+            **{f.name: getattr(self, f.name) for f in fields(self._table.stats_type)}
+        )
+
+    def __repr__(self) -> str:
+        return f"StatsRow({self._table.stats_type.__name__}, column={self.column!r})"
+
+
+def replace_stats(stats: StatsT, **changes: Any) -> StatsT:
+    """`dataclasses.replace` that also takes StatsRow views, as their dataclass."""
+    if isinstance(stats, StatsRow):
+        stats = stats.to_stats()
+    return replace(stats, **changes)
+
+
+class StatsTable(Generic[StatsT]):
+    __slots__ = ("stats_type", "names", "arrays", "_rows", "_positions")
+
+    def __init__(
+        self,
+        stats_type: Type[StatsT],
+        names: Sequence[str],
+        arrays: Mapping[str, np.ndarray],
+    ) -> None:
+        expected = [f.name for f in fields(stats_type)]
+        if sorted(arrays) != sorted(expected):
+            raise ValueError(
+                f"{stats_type.__name__} fields {sorted(expected)} "
+                f"do not match arrays {sorted(arrays)}."
+            )
+        for name, array in arrays.items():
+            if len(array) != len(names):
+                raise ValueError(
+                    f"field '{name}' has {len(array)} rows, expected {len(names)}."
+                )
+        self.stats_type = stats_type
+        self.names: List[str] = [str(name) for name in names]
+        self.arrays: Dict[str, np.ndarray] = {name: arrays[name] for name in expected}
+        # Views are created once per row so their identity is stable
+        self._rows: List[Optional[StatsRow]] = [None] * len(self.names)
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_stats(
+        cls, names: Sequence[str], stats: Sequence[StatsT]
+    ) -> "StatsTable[StatsT]":
+        if not stats:
+            raise ValueError("from_stats needs at least one stats object.")
+        stats_type = type(stats[0])
+        if isinstance(stats[0], StatsRow):
+            stats_type = stats[0]._table.stats_type
+        return cls(
+            stats_type,
+            names,
+            {
+                f.name: _column([getattr(s, f.name) for s in stats])
+                for f in fields(stats_type)
+            },
+        )
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """A stats field across all rows."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.arrays[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row(self, index: int) -> StatsRow:
+        view = self._rows[index]
+        if view is None:
+            view = self._rows[index] = StatsRow(self, index)
+        return view
+
+    def __getitem__(self, key: int | str) -> StatsRow:
+        if isinstance(key, str):
+            if self._positions is None:
+                self._positions = {name: i for i, name in enumerate(self.names)}
+            key = self._positions[key]
+        return self.row(key)
+
+    def __iter__(self) -> Iterator[StatsRow]:
+        return (self.row(i) for i in range(len(self)))
+
+    def take(self, positions: np.ndarray) -> "StatsTable[StatsT]":
+        """A new table of the rows at `positions`, in that order."""
+        return StatsTable(
+            self.stats_type,
+            [self.names[i] for i in positions],
+            {name: array[positions] for name, array in self.arrays.items()},
+        )
+
+    def filter(self, mask: np.ndarray) -> "StatsTable[StatsT]":
+        """Rows where the boolean `mask` is true, e.g. `table.skewness > 2`."""
+        return self.take(np.flatnonzero(mask))
+
+    def sort(self, by: str, descending: bool = False) -> "StatsTable[StatsT]":
+        """Rows ordered by field `by`, NaN last; ties keep their order."""
+        values = self.arrays[by]
+        if values.dtype.kind == "b":
+            values = values.astype(np.int8)
+        order = np.argsort(-values if descending else values, kind="stable")
+        return self.take(order)
+
+    def to_pandas(self) -> pd.DataFrame:
+        return pd.DataFrame(self.arrays, index=pd.Index(self.names, name="column"))
+
+    @classmethod
+    def from_pandas(
+        cls, stats_type: Type[StatsT], frame: pd.DataFrame
+    ) -> "StatsTable[StatsT]":
+        arrays: Dict[str, np.ndarray] = {}
+        for f in fields(stats_type):
+            column = frame[f.name]
+            if pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(
+                column
+            ):
+                arrays[f.name] = column.to_numpy()
+            else:  # parquet hands list fields back as arrays
+                arrays[f.name] = _column(
+                    [list(v) if isinstance(v, np.ndarray) else v for v in column]
+                )
+        return cls(stats_type, frame.index.tolist(), arrays)
+
+    def to_parquet(self, path: str) -> None:
+        """Needs pyarrow (the `parquet` extra)."""
+        self.to_pandas().to_parquet(path)
+
+    @classmethod
+    def read_parquet(cls, stats_type: Type[StatsT], path: str) -> "StatsTable[StatsT]":
+        return cls.from_pandas(stats_type, pd.read_parquet(path))
@@ -0,0 +1,75 @@
+from typing import Any, Callable, Dict
+
+import pytest
+
+from pills_core._computer_registry import build_computer_registry
+from pills_core._enums import TransformPhase
+from pills_core._infer_types import TypeInferencer
+from pills_core.analyzers import (
+    AnalyzerBuilder,
+    AnalyzerConfig,
+    AnalyzerRegistry,
+    DomainConfig,
+)
+from pills_core.config import ComputeConfig
+from pills_core.pipeline.builder import PipelineBuilder
+from pills_core.pipeline.pipeline import Pipeline
+from pills_core.pipeline.profiler import ColumnProfiler
+from pills_core.strategies.registry import StrategyRegistry
+from pills_core.types.stats import CategoricalThresholds, NumericalThresholds
+
+Registries = Dict[TransformPhase, StrategyRegistry]
+
+
+@pytest.fixture
+def analyzer_registry() -> AnalyzerRegistry:
+    return AnalyzerBuilder(
+        AnalyzerConfig(
+            numerical=NumericalThresholds(),
+            categorical=CategoricalThresholds(),
+            domain=DomainConfig(),
+        )
+    ).build_registry()
+
+
+@pytest.fixture
+def pipeline_parts(
+    analyzer_registry: AnalyzerRegistry,
+) -> Callable[..., Dict[str, Any]]:
+    """
+    The profiling components a Pipeline and a StrategySearch share, with
+    columns under `cardinality_abs` distinct values read as categorical.
+    """
+
+    def parts(cardinality_abs: int = 50) -> Dict[str, Any]:
+        return {
+            "profiler": ColumnProfiler(),
+            "type_inferencer": TypeInferencer(
+                cardinality_abs=cardinality_abs,
+                cardinality_ratio=0.05,
+                coercion_thresholds=0.9,
+                max_sample_size=1_000,
+            ),
+            "computer_registry": build_computer_registry(ComputeConfig()),
+            "analyzer_registry": analyzer_registry,
+        }
+
+    return parts
+
+
+@pytest.fixture
+def make_pipeline(
+    pipeline_parts: Callable[..., Dict[str, Any]],
+) -> Callable[..., Pipeline]:
+    """A Pipeline over `registries`; other keywords go to Pipeline."""
+
+    def make(
+        registries: Registries, cardinality_abs: int = 50, **kwargs: Any
+    ) -> Pipeline:
+        return Pipeline(
+            builder=PipelineBuilder(registries),
+            **pipeline_parts(cardinality_abs),
+            **kwargs,
+        )
+
+    return make
@@ -0,0 +1,48 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from benchmarks import generators
+from benchmarks.harness import BenchmarkCase, compare, load, measure, save
+
+
+def make_result(name: str = "stats/sum", rows: int = 10_000):
+    case = BenchmarkCase(
+        name=name,
+        subsystem="stats",
+        setup=lambda: np.ones(rows),
+        run=lambda values: values.sum(),
+        rows=rows,
+    )
+    return measure(case, repeats=3)
+
+
+class TestBenchmarkHarness:
+    @pytest.mark.positive
+    def test_results_round_trip_through_json(self, tmp_path):
+        result = make_result()
+        path = str(tmp_path / "baseline.json")
+
+        save([result], path)
+
+        assert load(path) == {result.name: result}
+        assert result.rows_per_s > 0
+
+    @pytest.mark.positive
+    def test_compare_flags_only_changes_beyond_threshold(self):
+        baseline = make_result()
+        slower = replace(baseline, median_s=baseline.median_s * 1.5)
+
+        regressions = compare({"a": baseline}, {"a": slower}, threshold=0.2)
+
+        assert [r.metric for r in regressions] == ["median_s"]
+        assert compare({"a": baseline}, {"a": slower}, threshold=0.6) == []
+
+    @pytest.mark.edge_case
+    def test_generators_are_deterministic(self):
+        assert generators.skewed(100).equals(generators.skewed(100))
+        assert generators.high_missing(1_000).isna().mean() == pytest.approx(
+            0.7, abs=0.05
+        )
+        assert generators.wide(10_000).shape == (100, 200)
@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._categorical import as_categorical, fill_codes, materialize
+from pills_core._enums import TransformPhase
+from pills_core.config import ComputeConfig
+from pills_core.pipeline.builder import PipelineBuilder
+from pills_core.stats_computer import CategoricalStatsComputer
+from pills_core.strategies.categorical._registry import build_rare_grouping_registry
+from pills_core.strategies.categorical.base import CategoricalEmbedding
+from pills_core.strategies.categorical.encoding import OneHotStrategy
+from pills_core.strategies.categorical.grouping import RARE, RareGroupingStrategy
+from pills_core.strategies.categorical.imputation import (
+    BackwardFillStrategy,
+    ForwardFillStrategy,
+    MissingStrategy,
+    MostFrequentStrategy,
+)
+from pills_core.strategies.config import CategoricalStrategiesConfig
+
+EMBEDDING = CategoricalEmbedding(0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5)
+
+
+@pytest.fixture
+def cities() -> pd.Series:
+    rng = np.random.default_rng(2)
+    values = rng.choice(np.array(["paris", "oslo", "rome"], dtype=object), 1_000)
+    values[rng.random(1_000) < 0.2] = None
+    return pd.Series(values, name="city", index=np.arange(1_000) * 3)
+
+
+class TestDictionaryEncoding:
+    @pytest.mark.positive
+    def test_round_trips_through_small_codes(self, cities):
+        encoded = as_categorical(cities)
+
+        assert encoded.cat.codes.dtype == np.int8
+        assert encoded.index.equals(cities.index)
+        assert materialize(encoded).tolist() == cities.tolist()
+        assert as_categorical(encoded) is encoded
+
+    @pytest.mark.edge_case
+    def test_fill_with_new_or_existing_category(self, cities):
+        existing = fill_codes(cities, "oslo")
+        new = fill_codes(cities, "__MISSING__")
+
+        assert list(existing.cat.categories) == list(
+            as_categorical(cities).cat.categories
+        )
+        assert materialize(existing).tolist() == cities.fillna("oslo").tolist()
+        assert materialize(new).tolist() == cities.fillna("__MISSING__").tolist()
+
+
+class TestImputationOnCodes:
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        ("cls", "expected"),
+        [
+            (MissingStrategy, lambda s, stats: s.fillna("__MISSING__")),
+            (MostFrequentStrategy, lambda s, stats: s.fillna(stats.mode)),
+            (ForwardFillStrategy, lambda s, stats: s.ffill()),
+            (BackwardFillStrategy, lambda s, stats: s.bfill()),
+        ],
+    )
+    def test_matches_string_fill(self, cities, cls, expected):
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(cities)
+
+        result = cls(embedding=EMBEDDING, radius=1.0).apply(cities, stats)
+
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+        assert materialize(result).tolist() == expected(cities, stats).tolist()
+
+    @pytest.mark.positive
+    def test_codes_flow_from_imputation_into_encoding(self, cities):
+        computer = CategoricalStatsComputer(rare_thresholds=0.01)
+        sequence = PipelineBuilder({})._fit_steps(
+            cities,
+            [
+                (
+                    TransformPhase.IMPUTATION,
+                    MissingStrategy(embedding=EMBEDDING, radius=1),
+                ),
+                (
+                    TransformPhase.ENCODING,
+                    OneHotStrategy(embedding=EMBEDDING, radius=1, max_categories=10),
+                ),
+            ],
+            computer,
+            computer.compute(cities),
+        )
+
+        block = sequence.apply(cities)
+
+        assert sequence.steps[1].stats.n_unique == 4
+        assert block.columns == (
+            "city___MISSING__",
+            "city_oslo",
+            "city_paris",
+            "city_rome",
+        )
+        assert block.matrix.sum() == len(cities)
+
+    @pytest.mark.edge_case
+    def test_stats_ignore_unused_categories(self, cities):
+        encoded = as_categorical(cities.dropna())
+        encoded = encoded[encoded != "rome"]
+
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(encoded)
+
+        assert len(encoded.cat.categories) == 3
+        assert stats.n_unique == 2
+        assert stats.rare_categories == []
+
+
+def long_tail(n: int = 20_000) -> pd.Series:
+    rng = np.random.default_rng(9)
+    codes = rng.zipf(1.6, n) % 500
+    series = pd.Series([f"v{code}" for code in codes], name="merchant", dtype=object)
+    series[::50] = None
+    return series
+
+
+class TestRareGrouping:
+    @pytest.mark.positive
+    def test_groups_categories_below_min_frequency(self):
+        train = long_tail()
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+        strategy = RareGroupingStrategy(
+            embedding=EMBEDDING, radius=1.0, min_frequency=0.01
+        )
+
+        result = materialize(strategy.apply(train, stats))
+
+        share = train.value_counts(normalize=True)
+        rare = set(share.index[share < 0.01])
+        expected = train.where(~train.isin(rare), RARE)
+        assert rare and len(rare) == len(stats.rare_categories)
+        assert result.fillna("<na>").tolist() == expected.fillna("<na>").tolist()
+
+    @pytest.mark.edge_case
+    def test_new_batches_remap_through_the_training_lookup(self):
+        train = long_tail()
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+        strategy = RareGroupingStrategy(
+            embedding=EMBEDDING, radius=1.0, min_frequency=0.01
+        )
+        params = strategy.fit(train, stats)
+        batch = pd.Series(["v1", "never_seen", None, train.iloc[1]], name="merchant")
+
+        result = strategy.apply_fitted(batch, stats, params)
+
+        full = strategy.apply_fitted(train, stats, params)
+        assert list(result.cat.categories) == list(full.cat.categories)
+        assert materialize(result).fillna("<na>").tolist()[:3] == ["v1", RARE, "<na>"]
+        assert result.iloc[3] == full.iloc[1]
+
+    @pytest.mark.edge_case
+    def test_existing_rare_label_is_reused(self):
+        train = pd.Series([RARE] * 50 + ["a"] * 49 + ["b"], name="merchant")
+        stats = CategoricalStatsComputer(rare_thresholds=0.05).compute(train)
+        strategy = RareGroupingStrategy(
+            embedding=EMBEDDING, radius=1.0, min_frequency=0.05
+        )
+        params = strategy.fit(train, stats)
+
+        result = strategy.apply_fitted(pd.Series(["b", "new", RARE]), stats, params)
+
+        assert params["categories"].is_unique
+        assert materialize(result).tolist() == [RARE, RARE, RARE]
+
+    @pytest.mark.positive
+    def test_registry_groups_at_the_stats_rare_threshold(self):
+        registry = build_rare_grouping_registry(
+            CategoricalStrategiesConfig().rare, ComputeConfig(rare_threshold=0.2)
+        )
+
+        (strategy,) = registry.strategies
+        assert strategy.min_frequency == 0.2
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._datetime import COMPONENTS, date_components, datetime_ns
+from pills_core._enums import SemanticRole, TransformPhase
+from pills_core.config import DataProcessingConfig
+from pills_core.stats_computer import DatetimeStatsComputer
+from pills_core.strategies.config import DatetimeStrategiesConfig
+from pills_core.strategies.temporal._registry import build_date_features_registry
+
+
+def date_registries(data: DataProcessingConfig | None = None) -> dict:
+    features = DatetimeStrategiesConfig().features
+    return {TransformPhase.DATE_FEATURES: build_date_features_registry(features, data)}
+
+
+@pytest.fixture
+def hourly() -> pd.Series:
+    return pd.Series(
+        pd.date_range("2023-12-31 22:00", periods=500, freq="h"), name="ts"
+    )
+
+
+class TestDateComponents:
+    @pytest.mark.positive
+    def test_matches_dt_accessors(self):
+        rng = np.random.default_rng(1)
+        ns = rng.integers(-(4 * 10**18), 8 * 10**18, 20_000)  # 1843 to 2223
+        series = pd.Series(pd.to_datetime(ns))
+        series[::9] = pd.NaT
+
+        components = date_components(datetime_ns(series), COMPONENTS)
+
+        expected = {
+            "year": series.dt.year,
+            "month": series.dt.month,
+            "day": series.dt.day,
+            "day_of_week": series.dt.dayofweek,
+            "hour": series.dt.hour,
+            "epoch": series.astype("int64") // 10**9,
+        }
+        for name, values in expected.items():
+            values = values.where(series.notna())
+            pd.testing.assert_series_equal(
+                pd.Series(components[name]).astype("Float64"),
+                values.astype("Float64"),
+                check_names=False,
+            )
+
+    @pytest.mark.edge_case
+    def test_aware_values_use_local_wall_clock(self):
+        series = pd.Series(
+            pd.date_range("2024-03-30", periods=4, freq="12h", tz="Europe/Berlin")
+        )
+
+        (hours,) = date_components(datetime_ns(series, local=True), ["hour"]).values()
+
+        assert hours.tolist() == series.dt.hour.tolist() == [0, 12, 0, 13]
+
+    @pytest.mark.negative
+    def test_rejects_unknown_component(self):
+        with pytest.raises(ValueError, match="quarter"):
+            date_components(np.zeros(1, dtype=np.int64), ["quarter"])
+
+
+class TestDatetimeStatsComputer:
+    @pytest.mark.positive
+    def test_regular_series(self, hourly):
+        stats = DatetimeStatsComputer().compute(hourly)
+
+        assert stats.median_gap_seconds == stats.max_gap_seconds == 3_600
+        assert stats.regularity == stats.monotonic_ratio == 1.0
+        assert stats.has_time
+        assert stats.span_days == pytest.approx(499 / 24)
+        assert stats.min == pd.Timestamp("2023-12-31 22:00")
+
+    @pytest.mark.positive
+    def test_parses_strings_and_counts_gaps_in_index_order(self):
+        series = pd.Series(
+            ["2024-01-03", "2024-01-01", None, "not a date", "2024-01-02"],
+            index=[2, 0, 3, 4, 1],
+        )
+
+        stats = DatetimeStatsComputer().compute(series)
+
+        assert stats.count == 3
+        assert stats.missing_ratio == pytest.approx(0.4)
+        assert stats.monotonic_ratio == 1.0
+        assert stats.median_gap_seconds == 86_400
+        assert not stats.has_time
+
+    @pytest.mark.edge_case
+    def test_all_missing(self):
+        stats = DatetimeStatsComputer().compute(pd.Series([pd.NaT, pd.NaT]))
+
+        assert stats.count == 0
+        assert stats.missing_ratio == 1.0
+        assert stats.min is pd.NaT
+
+
+class TestDateFeaturesPipeline:
+    @pytest.mark.positive
+    def test_regular_column_is_a_time_index_and_expands(self, hourly, make_pipeline):
+        pipeline = make_pipeline(date_registries())
+
+        artifact = pipeline.fit(hourly, is_target=False)
+        features = pipeline.transform(hourly, artifact)
+
+        assert artifact.context.meta.semantic_role is SemanticRole.TIME_INDEX
+        assert list(features.columns) == [f"ts_{name}" for name in COMPONENTS]
+        assert features["ts_year"].iloc[:2].tolist() == [2023, 2023]
+        assert features["ts_year"].iloc[2] == 2024
+        assert features["ts_hour"].iloc[:3].tolist() == [22, 23, 0]
+
+    @pytest.mark.positive
+    def test_date_only_column_drops_hour(self, make_pipeline):
+        rng = np.random.default_rng(3)
+        days = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+            rng.integers(0, 2_000, 300), unit="D"
+        )
+        series = pd.Series(days, name="signup")
+        pipeline = make_pipeline(date_registries())
+
+        artifact = pipeline.fit(series, is_target=False)
+        features = pipeline.transform(series, artifact)
+
+        assert artifact.context.meta.semantic_role is SemanticRole.EVENT_TIME
+        assert "signup_hour" not in features.columns
+        assert (features["signup_month"] == series.dt.month).all()
+
+    @pytest.mark.edge_case
+    def test_aware_epoch_is_utc_and_hour_local(self):
+        series = pd.Series(
+            pd.date_range("2024-10-27", periods=6, freq="h", tz="Europe/Berlin"),
+            name="ts",
+        )
+        stats = DatetimeStatsComputer().compute(series)
+        (strategy,) = date_registries()[TransformPhase.DATE_FEATURES].strategies
+
+        features = strategy.apply(series, stats)
+
+        utc_seconds = series.dt.tz_convert(None).dt.as_unit("s").astype("int64")
+        assert features["ts_epoch"].tolist() == utc_seconds.tolist()
+        assert features["ts_hour"].tolist() == [0, 1, 2, 2, 3, 4]
+
+    @pytest.mark.edge_case
+    def test_disabled_by_data_processing_config(self, hourly, make_pipeline):
+        pipeline = make_pipeline(
+            date_registries(DataProcessingConfig(date_features=False))
+        )
+
+        artifact = pipeline.fit(hourly, is_target=False)
+
+        assert len(artifact.sequence) == 0
+        assert pipeline.transform(hourly, artifact).equals(hourly)
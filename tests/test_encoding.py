@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._enums import TransformPhase
+from pills_core.stats_computer import CategoricalStatsComputer
+from pills_core.strategies.categorical._registry import build_encoding_registry
+from pills_core.strategies.config import CategoricalStrategiesConfig
+from pills_core.types.sparse import SparseBlock
+
+
+def encoders():
+    registry = build_encoding_registry(CategoricalStrategiesConfig().encoding)
+    return {strategy.name: strategy for strategy in registry.strategies}
+
+
+def encoding_registries() -> dict:
+    return {
+        TransformPhase.ENCODING: build_encoding_registry(
+            CategoricalStrategiesConfig().encoding
+        )
+    }
+
+
+def categories(n_unique: int, n: int = 3_000, name: str = "city") -> pd.Series:
+    rng = np.random.default_rng(n_unique)
+    values = np.array([f"c{i}" for i in range(n_unique)], dtype=object)
+    series = pd.Series(rng.choice(values, n), name=name)
+    series[::17] = None
+    return series
+
+
+class TestOneHot:
+    @pytest.mark.positive
+    def test_matches_dense_dummies(self):
+        one_hot = encoders()["one_hot"]
+        train = categories(6)
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+
+        block = one_hot.apply(train, stats)
+
+        expected = pd.get_dummies(train, prefix="city", dtype=np.float32)
+        assert isinstance(block, SparseBlock)
+        assert block.columns == tuple(expected.columns)
+        np.testing.assert_array_equal(block.matrix.toarray(), expected.to_numpy())
+
+    @pytest.mark.edge_case
+    def test_vocabulary_is_fixed_at_fit_time(self):
+        one_hot = encoders()["one_hot"]
+        train = pd.Series(["b", "a", "b"], name="grade")
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+        params = one_hot.fit(train, stats)
+
+        block = one_hot.apply_fitted(
+            pd.Series(["a", "z", None, "b"], name="grade", index=[5, 6, 7, 8]),
+            stats,
+            params,
+        )
+
+        assert block.columns == ("grade_a", "grade_b")
+        assert block.index.tolist() == [5, 6, 7, 8]
+        np.testing.assert_array_equal(
+            block.matrix.toarray(), [[1, 0], [0, 0], [0, 0], [0, 1]]
+        )
+
+
+class TestHashing:
+    @pytest.mark.positive
+    def test_fixed_width_one_signed_entry_per_row(self):
+        hashing = encoders()["hashing"]
+        train = categories(5_000, n=20_000)
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+
+        block = hashing.apply(train, stats)
+
+        present = train.notna().to_numpy()
+        assert block.shape == (len(train), hashing.n_features)
+        np.testing.assert_array_equal(np.diff(block.matrix.indptr), present)
+        assert set(np.unique(block.matrix.data)) == {-1.0, 1.0}
+
+    @pytest.mark.edge_case
+    def test_unseen_categories_hash_like_seen_ones(self):
+        hashing = encoders()["hashing"]
+        train = pd.Series(["a", "b"], name="code")
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+        params = hashing.fit(train, stats)
+
+        first = hashing.apply_fitted(pd.Series(["x", "a"], name="code"), stats, params)
+        second = hashing.apply_fitted(pd.Series(["a", "x"], name="code"), stats, params)
+
+        assert first.matrix.nnz == 2
+        assert (first.matrix[[1, 0]] != second.matrix).nnz == 0
+
+    @pytest.mark.edge_case
+    def test_numbers_hash_like_their_text(self):
+        hashing = encoders()["hashing"]
+        train = pd.Series(["1", "2", "a"], name="code", dtype=object)
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(train)
+        params = hashing.fit(train, stats)
+
+        text = hashing.apply_fitted(train, stats, params)
+        mixed = hashing.apply_fitted(
+            pd.Series([1, 2, "a"], name="code", dtype=object), stats, params
+        )
+
+        assert (text.matrix != mixed.matrix).nnz == 0
+
+
+class TestEncodingPipeline:
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        ("n_unique", "expected"), [(8, "one_hot"), (400, "hashing")]
+    )
+    def test_cardinality_picks_the_encoder(self, n_unique, expected, make_pipeline):
+        series = categories(n_unique)
+        pipeline = make_pipeline(encoding_registries(), cardinality_abs=1_000)
+
+        artifact = pipeline.fit(series, is_target=False)
+        block = pipeline.transform(series.iloc[:10], artifact)
+
+        (step,) = artifact.sequence.steps
+        assert step.name == expected
+        assert isinstance(block, SparseBlock)
+        assert block.shape[0] == 10
+        assert block.to_pandas().columns.tolist() == list(block.columns)
+
+    @pytest.mark.edge_case
+    def test_category_dtype_is_encoded(self, make_pipeline):
+        series = categories(6).astype("category")
+        pipeline = make_pipeline(encoding_registries(), cardinality_abs=1_000)
+
+        artifact = pipeline.fit(series, is_target=False)
+
+        (step,) = artifact.sequence.steps
+        assert step.name == "one_hot"
+        assert pipeline.transform(series, artifact).shape == (len(series), 6)
+
+    @pytest.mark.negative
+    def test_target_is_not_encoded(self, make_pipeline):
+        series = categories(8)
+        pipeline = make_pipeline(encoding_registries(), cardinality_abs=1_000)
+
+        artifact = pipeline.fit(series, is_target=True)
+
+        assert len(artifact.sequence) == 0
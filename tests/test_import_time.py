@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules a scoring process needs to load fitted sequences and apply them.
+SERVING_PATH = (
+    "pills_core.pipeline.sequence",
+    "pills_core.strategies.numeric.imputation",
+    "pills_core.strategies.numeric.outliers",
+    "pills_core.strategies.numeric.scaling",
+    "pills_core.strategies.categorical.imputation",
+    "pills_core.strategies.categorical.encoding",
+)
+HEAVY_DEPENDENCIES = ("scipy", "sklearn", "optuna", "pydantic_settings")
+# pills_core.runtime needs NumPy alone.
+RUNTIME_EXCLUDED = (*HEAVY_DEPENDENCIES, "pandas", "pydantic")
+# Self time of pills_core's own modules; third-party imports are excluded.
+OWN_IMPORT_BUDGET_US = 150_000
+
+
+def import_profile(*modules: str) -> dict[str, int]:
+    """Self time in microseconds of every module imported, from -X importtime."""
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        profile[name.strip()] = int(self_us)
+    return profile
+
+
+class TestImportTime:
+    @pytest.mark.positive
+    def test_serving_path_skips_heavy_dependencies(self):
+        profile = import_profile(*SERVING_PATH)
+
+        loaded = {name.split(".")[0] for name in profile}
+        assert loaded.isdisjoint(HEAVY_DEPENDENCIES)
+
+    @pytest.mark.positive
+    def test_serving_path_own_modules_within_budget(self):
+        profile = import_profile(*SERVING_PATH)
+
+        own = sum(us for name, us in profile.items() if name.startswith("pills_core"))
+        assert own < OWN_IMPORT_BUDGET_US
+
+    @pytest.mark.positive
+    def test_runtime_imports_numpy_only(self):
+        profile = import_profile("pills_core.runtime")
+
+        loaded = {name.split(".")[0] for name in profile}
+        assert loaded.isdisjoint(RUNTIME_EXCLUDED)
+        assert {name for name in profile if name.startswith("pills_core.")} == {
+            "pills_core.runtime"
+        }
+
+    @pytest.mark.edge_case
+    def test_config_module_does_not_read_settings_on_import(self):
+        env = {**os.environ, "TASK_TYPE": "not-a-task"}
+        code = (
+            "import pills_core.config as c\n"
+            "try:\n"
+            "    c.get_config()\n"
+            "except Exception:\n"
+            "    print('deferred')\n"
+        )
+        result = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        assert result.stdout.strip() == "deferred"
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from pills_core.instrumentation import (
+    NO_INSTRUMENTATION,
+    ChromeTraceCollector,
+    Instrumentation,
+    SpanCollector,
+)
+
+
+class TestInstrumentation:
+    @pytest.mark.positive
+    def test_nested_stages_link_parent_spans(self):
+        spans = SpanCollector(trace_id="ab" * 16)
+        instrumentation = Instrumentation([spans])
+
+        with instrumentation.stage("fit", "x", 10):
+            with instrumentation.stage("compute", "x", 10):
+                pass
+
+        inner, outer = spans.spans()
+        assert inner["parentSpanId"] == outer["spanId"]
+        assert outer["parentSpanId"] == ""
+        assert inner["traceId"] == "ab" * 16
+        assert outer["endTimeUnixNano"] >= inner["endTimeUnixNano"]
+
+    @pytest.mark.positive
+    def test_chrome_trace_dump_is_loadable(self, tmp_path):
+        trace = ChromeTraceCollector()
+        instrumentation = Instrumentation([trace])
+        with instrumentation.stage("apply", "x", 3, "log_transform"):
+            pass
+
+        path = tmp_path / "trace.json"
+        trace.dump(str(path))
+
+        (event,) = json.loads(path.read_text())["traceEvents"]
+        assert event["name"] == "apply:log_transform"
+        assert event["ph"] == "X"
+        assert event["args"]["rows"] == 3
+
+    @pytest.mark.negative
+    def test_failed_stage_is_reported_and_reraised(self):
+        spans = SpanCollector()
+        instrumentation = Instrumentation([spans])
+
+        with pytest.raises(KeyError):
+            with instrumentation.stage("resolve", "x", 1):
+                raise KeyError("missing")
+
+        assert spans.spans()[0]["status"]["message"] == "KeyError"
+
+    @pytest.mark.edge_case
+    def test_disabled_instrumentation_shares_one_noop_context(self):
+        first = NO_INSTRUMENTATION.stage("compute", "x", 1)
+        assert first is NO_INSTRUMENTATION.stage("apply", "y", 2)
+        assert not NO_INSTRUMENTATION.enabled
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core import memory
+from pills_core._enums import TransformPhase
+from pills_core._knn import knn_impute
+from pills_core.config import HardwareConfig, PillConfig
+from pills_core.memory import MemoryGovernor
+from pills_core.pipeline.step import Step
+from pills_core.stats_computer import NumericalStatsComputer
+from pills_core.strategies.config import NumericStrategiesConfig
+from pills_core.strategies.numeric import _registry as numeric_registry
+from pills_core.strategies.numeric._registry import build_imputation_registry
+from pills_core.strategies.numeric.base import NumericalEmbedding
+from pills_core.strategies.numeric.imputation import KNNImputation
+
+EMBEDDING = NumericalEmbedding(0.5, 0.5, 0.5, 0.5, 0.5, 0.5)
+MB = 2**20
+
+
+def make_frame(n: int = 3_000) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    frame = pd.DataFrame(rng.normal(size=(n, 3)), columns=["a", "b", "c"])
+    frame["y"] = 2 * frame.a + frame.b - frame.c + rng.normal(scale=0.1, size=n)
+    frame.loc[rng.random(n) < 0.2, "y"] = np.nan
+    frame.loc[rng.random(n) < 0.05, "a"] = np.nan
+    return frame
+
+
+def make_strategy(**overrides) -> KNNImputation:
+    params = {"n_neighbors": 5, "max_reference": 1_000, "block_size": 128}
+    return KNNImputation(
+        embedding=EMBEDDING, radius=1.0, **(params | {"n_jobs": 1} | overrides)
+    )
+
+
+def brute_force(queries, reference, values, k):
+    filled = []
+    for query in queries:
+        observed = ~np.isnan(query)
+        if not observed.any():
+            filled.append(np.median(values))
+            continue
+        distance = ((query[observed] - reference[:, observed]) ** 2).sum(axis=1)
+        filled.append(values[np.argsort(distance, kind="stable")[:k]].mean())
+    return np.array(filled)
+
+
+class TestBlockedKernel:
+    @pytest.mark.positive
+    @pytest.mark.parametrize("n_jobs", [1, 3])
+    def test_matches_brute_force_nan_euclidean(self, n_jobs):
+        rng = np.random.default_rng(0)
+        reference = rng.normal(size=(500, 4))
+        values = reference @ rng.normal(size=4)
+        queries = rng.normal(size=(700, 4))
+        queries[rng.random(queries.shape) < 0.2] = np.nan
+        queries[0] = np.nan
+
+        filled = knn_impute(
+            queries, reference, values, k=5, block_size=64, n_jobs=n_jobs
+        )
+
+        assert filled[0] == np.median(values)
+        np.testing.assert_allclose(filled, brute_force(queries, reference, values, 5))
+
+
+class TestKNNImputation:
+    @pytest.mark.positive
+    def test_fills_from_correlated_columns(self):
+        frame = make_frame()
+        stats = NumericalStatsComputer().compute(frame.y)
+        strategy = make_strategy()
+
+        params = strategy.fit_frame(frame.y, frame, stats)
+        filled = strategy.apply_frame(frame.y, frame, stats, params)
+
+        truth = 2 * frame.a + frame.b - frame.c
+        missing = frame.y.isna() & frame.a.notna()
+        knn_error = (filled[missing] - truth[missing]).abs().mean()
+        median_error = (stats.median - truth[missing]).abs().mean()
+        assert params["features"] == ("a", "b", "c")
+        assert len(params["values"]) == 1_000
+        assert filled.notna().all()
+        assert filled[frame.y.notna()].equals(frame.y[frame.y.notna()])
+        assert knn_error < median_error / 3
+
+    @pytest.mark.edge_case
+    def test_all_missing_features_are_left_out(self):
+        frame = make_frame()
+        frame["empty"] = np.nan
+        stats = NumericalStatsComputer().compute(frame.y)
+        strategy = make_strategy()
+
+        params = strategy.fit_frame(frame.y, frame, stats)
+        filled = strategy.apply_frame(frame.y, frame, stats, params)
+
+        assert params["features"] == ("a", "b", "c")
+        assert len(params["values"]) == 1_000
+        assert filled.equals(strategy.apply_frame(frame.y, make_frame(), stats, params))
+
+    @pytest.mark.edge_case
+    def test_new_rows_are_aligned_by_label(self):
+        frame = make_frame()
+        stats = NumericalStatsComputer().compute(frame.y)
+        strategy = make_strategy()
+        params = strategy.fit_frame(frame.y, frame, stats)
+
+        batch = frame.iloc[::-1]
+        filled = strategy.apply_frame(frame.y, batch, stats, params)
+
+        expected = strategy.apply_frame(frame.y, frame, stats, params)
+        assert filled.equals(expected)
+
+    @pytest.mark.negative
+    def test_step_without_frame_is_rejected(self):
+        frame = make_frame()
+        stats = NumericalStatsComputer().compute(frame.y)
+        strategy = make_strategy()
+        step = Step(
+            phase=TransformPhase.IMPUTATION,
+            strategy=strategy,
+            stats=stats,
+            params=strategy.fit_frame(frame.y, frame, stats),
+        )
+
+        with pytest.raises(ValueError, match="needs a frame"):
+            step.apply(frame.y)
+
+
+def knn_registries() -> dict:
+    strategies = NumericStrategiesConfig(
+        imputation={"strategies": {"knn": {"enabled": True, "n_jobs": 1}}}
+    )
+    return {TransformPhase.IMPUTATION: build_imputation_registry(strategies.imputation)}
+
+
+class TestFrameLevelPipeline:
+    @pytest.mark.positive
+    def test_knn_is_only_a_candidate_with_the_frame(self, make_pipeline):
+        frame = make_frame()
+        pipeline = make_pipeline(knn_registries())
+
+        with_frame = pipeline.fit_frame(frame)["y"]
+        alone = pipeline.fit(frame.y, is_target=False)
+
+        assert [step.name for step in with_frame.sequence] == ["knn"]
+        assert "knn" not in [step.name for step in alone.sequence]
+        assert pipeline.transform(frame.y, with_frame, frame).notna().all()
+
+    @pytest.mark.edge_case
+    def test_target_is_not_a_feature(self, make_pipeline):
+        frame = make_frame()
+
+        artifact = make_pipeline(knn_registries()).fit_frame(frame, target="c")["y"]
+
+        assert artifact.sequence.steps[0].params["features"] == ("a", "b")
+
+    @pytest.mark.edge_case
+    def test_threads_follow_the_hardware_cpu_limit(self):
+        def knn(**overrides) -> KNNImputation:
+            strategies = NumericStrategiesConfig(
+                imputation={"strategies": {"knn": {"enabled": True, **overrides}}}
+            )
+            registry = build_imputation_registry(
+                strategies.imputation, HardwareConfig(cpu_limit=3)
+            )
+            return next(s for s in registry.strategies if s.name == "knn")
+
+        assert knn().n_jobs == 3
+        assert knn(n_jobs=1).n_jobs == 1
+
+    @pytest.mark.edge_case
+    def test_governor_is_only_built_for_knn(self, monkeypatch):
+        def no_governor(*args, **kwargs):
+            raise AssertionError("a governor was built without KNN")
+
+        monkeypatch.setattr(numeric_registry, "MemoryGovernor", no_governor)
+
+        build_imputation_registry(NumericStrategiesConfig().imputation)
+
+    @pytest.mark.edge_case
+    def test_reloaded_config_still_follows_the_cpu_limit(self):
+        config = PillConfig(hardware=HardwareConfig(cpu_limit=3))
+
+        reloaded = PillConfig.model_validate(config.model_dump())
+
+        assert reloaded.strategies.numeric.imputation.strategies.knn.n_jobs == -1
+
+    @pytest.mark.edge_case
+    def test_threads_are_capped_by_the_memory_budget(self, monkeypatch):
+        monkeypatch.setattr(memory, "current_rss", lambda: 90 * MB)
+        governor = MemoryGovernor(HardwareConfig(max_memory_mb=100), headroom=1.0)
+        strategy = make_strategy(n_jobs=8, block_size=128, governor=governor)
+
+        # 10 MB left, 2 x 8 B x 128 rows x 1_000 references ~ 1.95 MB per thread
+        assert strategy._threads(n_reference=1_000) == 5
+        assert make_strategy(n_jobs=8)._threads(n_reference=1_000) == 8
@@ -0,0 +1,142 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core import memory
+from pills_core.config import HardwareConfig
+from pills_core.ingestion.csv import CSVDataSource, CSVOptions
+from pills_core.memory import MemoryBudgetWarning, MemoryGovernor, estimate_bytes
+from pills_core.monitoring import DriftMonitor
+from pills_core.stats_computer import NumericalStatsComputer
+
+MB = 2**20
+
+
+@pytest.fixture
+def governor(monkeypatch) -> MemoryGovernor:
+    """100 MB budget with 90 MB already resident: 10 MB left."""
+    monkeypatch.setattr(memory, "current_rss", lambda: 90 * MB)
+    return MemoryGovernor(HardwareConfig(max_memory_mb=100), headroom=1.0)
+
+
+class TestEstimates:
+    @pytest.mark.positive
+    def test_estimates_from_dtype_and_rows(self):
+        assert estimate_bytes(np.dtype(np.float64), 1_000) == 8_000
+        assert estimate_bytes(pd.Int64Dtype(), 1_000) == 9_000
+        assert estimate_bytes(np.dtype(object), 10) == 640
+
+
+class TestMemoryGovernor:
+    @pytest.mark.positive
+    def test_plan_computer_samples_only_when_column_does_not_fit(self, governor):
+        computer = NumericalStatsComputer()
+        small = pd.Series(np.zeros(1_000))
+        large = pd.Series(np.zeros(1_000_000))  # 8 MB, x4 temporaries
+
+        assert governor.plan_computer(computer, small) is computer
+        planned = governor.plan_computer(computer, large)
+        assert planned is not computer
+        assert planned.sample_size == 10 * MB // 32
+        assert planned.chunk_size is None  # a sample that fits is not chunked
+        assert computer.sample_size is None
+
+    @pytest.mark.positive
+    def test_cap_workers_by_per_worker_footprint(self, governor):
+        assert governor.cap_workers(8, 3 * MB) == 3
+        assert governor.cap_workers(8, 100 * MB) == 1
+
+    @pytest.mark.positive
+    def test_spill_moves_large_columns_to_memmap(self, governor):
+        series = pd.Series(np.arange(2_000_000, dtype=np.float64), name="x")
+
+        spilled = governor.spill(series)
+
+        base = spilled.to_numpy()
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+        pd.testing.assert_series_equal(spilled, series)
+
+    @pytest.mark.positive
+    def test_stage_reports_nested_peaks(self):
+        governor = MemoryGovernor(HardwareConfig(), track_peaks=True)
+
+        with governor.stage("outer"):
+            with governor.stage("inner"):
+                block = np.ones(2 * MB // 8)
+                del block
+
+        peaks = governor.peaks()
+        assert peaks["inner"] >= 2 * MB
+        assert peaks["outer"] >= peaks["inner"]
+
+    @pytest.mark.edge_case
+    def test_untracked_stage_records_nothing(self):
+        governor = MemoryGovernor(HardwareConfig())
+        with governor.stage("fit"):
+            pass
+        assert governor.records == []
+
+
+class TestBudgetedConsumers:
+    @pytest.mark.positive
+    def test_drift_reference_is_sampled_to_fit(self, governor):
+        data = pd.DataFrame({"x": np.random.default_rng(0).normal(size=2_000_000)})
+
+        monitor = DriftMonitor(governor=governor)
+        monitor.capture_reference(data)
+
+        assert len(monitor.reference_profile["x"]) == 10 * MB // 8
+
+    @pytest.mark.edge_case
+    def test_drift_reference_keeps_a_reliable_sample(self, governor):
+        data = pd.DataFrame({"x": np.random.default_rng(0).normal(size=50_000)})
+        governor.hardware = HardwareConfig(max_memory_mb=90)  # nothing left
+
+        monitor = DriftMonitor(governor=governor)
+        monitor.capture_reference(data)
+
+        assert len(monitor.reference_profile["x"]) == 10_000
+
+    @pytest.mark.positive
+    def test_csv_over_budget_loads_in_chunks(self, governor, tmp_path):
+        path = tmp_path / "data.csv"
+        label = "v" * 180  # long rows: the parse does not fit, the frame does
+        rows = [f"{i},{i * 0.5},{i},{label}{i % 7}" for i in range(15_000)]
+        rows[-1] = "1,0.5,,late"  # a missing integer after the first chunk
+        path.write_text("\ufeffA,b,n,c\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        expected = CSVDataSource(CSVOptions(path=str(path))).load()
+
+        governor.hardware = HardwareConfig(max_memory_mb=92)  # 2 MB left
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            loaded = CSVDataSource(CSVOptions(path=str(path)), governor).load()
+
+        assert any(w.category is MemoryBudgetWarning for w in caught)
+        assert loaded["a"].dtype == np.int64 and loaded["n"].dtype == np.float64
+        pd.testing.assert_frame_equal(loaded, expected)
+
+    @pytest.mark.negative
+    def test_csv_larger_than_the_budget_fails(self, governor, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("a\n" + "\n".join(map(str, range(50_000))) + "\n")
+
+        governor.hardware = HardwareConfig(max_memory_mb=90)  # nothing left
+        with pytest.warns(MemoryBudgetWarning), pytest.raises(MemoryError):
+            CSVDataSource(CSVOptions(path=str(path)), governor).load()
+
+    @pytest.mark.negative
+    def test_csv_column_changing_type_fails_clearly(self, governor, tmp_path):
+        path = tmp_path / "data.csv"
+        rows = [f"{i},{'v' * 180}" for i in range(15_000)] + ["late,v"]
+        path.write_text("a,c\n" + "\n".join(rows) + "\n")
+
+        governor.hardware = HardwareConfig(max_memory_mb=92)
+        with (
+            pytest.warns(MemoryBudgetWarning),
+            pytest.raises(ValueError, match="changes type"),
+        ):
+            CSVDataSource(CSVOptions(path=str(path)), governor).load()
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._datetime import NAT
+from pills_core._panel import backward_fill, forward_fill, interpolate, sort_panel
+from pills_core.stats_computer import NumericalStatsComputer
+from pills_core.strategies.numeric.base import NumericalEmbedding
+from pills_core.strategies.numeric.imputation import (
+    ForwardFillImputation,
+    InterpolationImputation,
+    PanelFillStrategy,
+)
+
+EMBEDDING = NumericalEmbedding(0.5, 0.5, 0.5, 0.5, 0.5, 0.5)
+
+
+def make_panel(n: int = 5_000) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    panel = pd.DataFrame(
+        {
+            "entity": rng.integers(0, 200, n),
+            "ts": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.permutation(n), unit="D"),
+            "value": rng.normal(size=n),
+        }
+    )
+    panel.loc[rng.random(n) < 0.3, "value"] = np.nan
+    panel.loc[panel.entity == 0, "value"] = np.nan  # a group with no value at all
+    return panel
+
+
+def in_panel_order(panel: pd.DataFrame) -> pd.DataFrame:
+    return panel.sort_values(["entity", "ts"], kind="stable")
+
+
+class TestSegmentFills:
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        ("fill", "expected"),
+        [
+            (forward_fill, lambda grouped: grouped.ffill()),
+            (backward_fill, lambda grouped: grouped.bfill()),
+        ],
+    )
+    def test_matches_groupby_fills(self, fill, expected):
+        panel = in_panel_order(make_panel())
+        starts = np.r_[True, np.diff(panel.entity.to_numpy()) != 0]
+
+        filled = fill(panel.value.to_numpy(), starts)
+
+        reference = expected(panel.groupby("entity").value)
+        np.testing.assert_array_equal(filled, reference.to_numpy())
+
+    @pytest.mark.positive
+    def test_interpolates_in_time_within_groups(self):
+        panel = in_panel_order(make_panel())
+        starts = np.r_[True, np.diff(panel.entity.to_numpy()) != 0]
+        times = panel.ts.to_numpy().view(np.int64).astype(np.float64)
+
+        filled = interpolate(panel.value.to_numpy(), times, starts)
+
+        reference = (
+            panel.set_index("ts")
+            .groupby("entity")
+            .value.transform(
+                lambda s: s.interpolate(method="index", limit_direction="both")
+            )
+        )
+        np.testing.assert_allclose(filled, reference.to_numpy())
+
+    @pytest.mark.edge_case
+    def test_sort_by_group_and_time(self):
+        rng = np.random.default_rng(1)
+        codes = rng.integers(0, 1_000, 10_000)
+        days = rng.integers(0, 10_000, 10_000) * 86_400 * 10**9  # ns, daily
+
+        order, starts = sort_panel(codes, days)
+
+        np.testing.assert_array_equal(order, np.lexsort((days, codes)))
+        assert starts.sum() == len(np.unique(codes))
+        sorted_order, _ = sort_panel(codes[order], days[order])
+        np.testing.assert_array_equal(sorted_order, np.arange(len(codes)))
+
+    @pytest.mark.edge_case
+    def test_nat_sorts_last_in_its_group(self):
+        codes = np.array([0, 0, 0, 1, 1])
+        times = np.array([3, NAT, 1, NAT, 2], dtype=np.int64)
+
+        order, starts = sort_panel(codes, times)
+
+        assert order.tolist() == [2, 0, 1, 4, 3]
+        assert starts.tolist() == [True, False, False, True, False]
+
+
+class TestPanelFillStrategies:
+    @pytest.mark.positive
+    def test_fills_stay_within_entities_on_shuffled_rows(self):
+        panel = make_panel()
+        stats = NumericalStatsComputer().compute(panel.value)
+        strategy = ForwardFillImputation(
+            embedding=EMBEDDING, radius=1.0, group_by="entity", order_by="ts"
+        )
+
+        params = strategy.fit_frame(panel.value, panel, stats)
+        filled = strategy.apply_frame(panel.value, panel, stats, params)
+
+        ordered = in_panel_order(panel)
+        expected = ordered.groupby("entity").value.ffill().fillna(stats.median)
+        pd.testing.assert_series_equal(filled, expected.reindex(panel.index))
+
+    @pytest.mark.edge_case
+    def test_without_group_interpolates_in_row_order(self):
+        series = pd.Series([np.nan, 1.0, np.nan, np.nan, 4.0, np.nan], name="x")
+        stats = NumericalStatsComputer().compute(series)
+        strategy = InterpolationImputation(embedding=EMBEDDING, radius=1.0)
+        frame = series.to_frame()
+
+        filled = strategy.apply_frame(
+            series, frame, stats, strategy.fit_frame(series, frame, stats)
+        )
+
+        assert filled.tolist() == [1.0, 1.0, 2.0, 3.0, 4.0, 4.0]
+
+    @pytest.mark.edge_case
+    def test_missing_times_sort_last(self):
+        frame = pd.DataFrame(
+            {
+                "value": [1.0, np.nan, 5.0, 10.0, np.nan, 30.0],
+                "ts": pd.to_datetime(
+                    [
+                        "2024-01-01",
+                        "2024-01-02",
+                        None,
+                        "2024-01-04",
+                        "2024-01-05",
+                        "2024-01-06",
+                    ]
+                ),
+            }
+        )
+        stats = NumericalStatsComputer().compute(frame.value)
+        strategy = ForwardFillImputation(embedding=EMBEDDING, radius=1.0, order_by="ts")
+
+        params = strategy.fit_frame(frame.value, frame, stats)
+        filled = strategy.apply_frame(frame.value, frame, stats, params)
+
+        assert filled.tolist() == [1.0, 1.0, 5.0, 10.0, 10.0, 30.0]
+
+    @pytest.mark.negative
+    def test_missing_group_column_is_rejected(self):
+        panel = make_panel()
+        stats = NumericalStatsComputer().compute(panel.value)
+        strategy = InterpolationImputation(
+            embedding=EMBEDDING, radius=1.0, group_by="store", order_by="ts"
+        )
+
+        with pytest.raises(ValueError, match="store"):
+            strategy.fit_frame(panel.value, panel, stats)
+
+    @pytest.mark.negative
+    def test_fill_must_be_implemented(self):
+        class NoFill(PanelFillStrategy):
+            name = "no_fill"
+
+        with pytest.raises(TypeError, match="fill"):
+            NoFill(embedding=EMBEDDING, radius=1.0)
+
+    @pytest.mark.negative
+    def test_apply_without_frame_is_rejected(self):
+        series = pd.Series([1.0, np.nan], name="x")
+        stats = NumericalStatsComputer().compute(series)
+        strategy = InterpolationImputation(embedding=EMBEDDING, radius=1.0)
+
+        with pytest.raises(ValueError, match="'interpolate' reads other columns"):
+            strategy.apply(series, stats)
@@ -0,0 +1,235 @@
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core import memory
+from pills_core._enums import TransformPhase
+from pills_core.config import HardwareConfig, TrainingConfig
+from pills_core.instrumentation import Instrumentation, SummaryCollector
+from pills_core.memory import MemoryGovernor
+from pills_core.pipeline.profiler import ColumnProfiler
+from pills_core.splitting.cv import CVSplitter
+from pills_core.splitting.time_series import TimeSeriesSplitter
+from pills_core.stats_computer import (
+    DatetimeStatsComputer,
+    FactorizedColumn,
+    NumericalStatsComputer,
+)
+from pills_core.strategies.config import NumericStrategiesConfig
+from pills_core.strategies.numeric._registry import (
+    build_imputation_registry,
+    build_outliers_registry,
+    build_scaling_registry,
+)
+from pills_core.types.stats import NumericalColumnStats
+
+
+def numeric_registries() -> dict:
+    strategies = NumericStrategiesConfig()
+    return {
+        TransformPhase.IMPUTATION: build_imputation_registry(strategies.imputation),
+        TransformPhase.OUTLIER: build_outliers_registry(strategies.outlier),
+        TransformPhase.SCALING: build_scaling_registry(strategies.scaling),
+    }
+
+
+def make_frame(n: int = 2_000) -> tuple[pd.DataFrame, pd.Series]:
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "skewed": np.where(rng.random(n) < 0.1, np.nan, rng.lognormal(size=n)),
+            "normal": rng.normal(10.0, 2.0, size=n),
+            "counts": rng.poisson(2.0, size=n).astype(np.float64),
+        }
+    )
+    return df, pd.Series(rng.integers(0, 2, size=n))
+
+
+def assert_stats_close(left, right) -> None:
+    for key, value in asdict(left).items():
+        assert float(value) == pytest.approx(
+            float(asdict(right)[key]), rel=1e-9, nan_ok=True
+        ), key
+
+
+class TestStatsFromCounts:
+    @pytest.mark.positive
+    def test_numeric_counts_match_direct_compute(self):
+        df, _ = make_frame()
+        computer = NumericalStatsComputer()
+        for column in df.columns:
+            series = df[column]
+            counts = FactorizedColumn(series).count()
+            assert_stats_close(
+                computer.compute_from_counts(series, counts),
+                computer.compute(series),
+            )
+
+    @pytest.mark.edge_case
+    def test_sampling_computers_sample_from_counts_too(self):
+        df, _ = make_frame()
+        computer = NumericalStatsComputer(sample_size=500)
+        counts = FactorizedColumn(df["normal"]).count()
+
+        stats = computer.compute_from_counts(df["normal"], counts)
+
+        assert stats.count == 500
+        assert_stats_close(stats, computer.compute(df["normal"]))
+
+    @pytest.mark.positive
+    def test_computers_without_counts_fall_back_to_compute(self):
+        series = pd.Series(pd.date_range("2024-01-01", periods=50, freq="D"))
+        computer = DatetimeStatsComputer()
+        counts = FactorizedColumn(series).count()
+
+        assert computer.compute_from_counts(series, counts) == computer.compute(series)
+
+    @pytest.mark.positive
+    def test_block_counts_merge_by_subtraction(self):
+        df, _ = make_frame()
+        factorized = FactorizedColumn(df["skewed"])
+        block = np.arange(0, 500)
+
+        train = factorized.count() - factorized.count(block)
+
+        assert train.n_missing == int(df["skewed"].iloc[500:].isna().sum())
+        assert train.counts.sum() == int(df["skewed"].iloc[500:].notna().sum())
+
+
+class TestComputeFrame:
+    @pytest.mark.positive
+    def test_block_stats_match_per_column_compute(self):
+        df, _ = make_frame()
+        df["ints"] = np.arange(len(df)) % 7
+        df = df.sample(frac=1.0, random_state=3)  # monotonic_ratio sorts by index
+        computer = NumericalStatsComputer()
+
+        table = computer.compute_table(df)
+
+        for column, row in zip(df.columns, table, strict=True):
+            assert_stats_close(row.to_stats(), computer.compute(df[column]))
+
+    @pytest.mark.edge_case
+    def test_all_missing_and_constant_columns(self):
+        df = pd.DataFrame({"empty": [np.nan] * 5, "constant": [2.0] * 5})
+        computer = NumericalStatsComputer()
+
+        empty, constant = computer.compute_frame(df)
+
+        assert isinstance(empty, NumericalColumnStats)
+        assert empty.count == 0 and empty.missing_ratio == 1.0
+        assert_stats_close(constant, computer.compute(df["constant"]))
+
+
+class TestFitFrame:
+    @pytest.mark.positive
+    def test_matches_per_column_fit(self, make_pipeline):
+        df, _ = make_frame(500)
+        pipeline = make_pipeline(numeric_registries())
+
+        fitted = pipeline.fit_frame(df, target="counts")
+
+        assert list(fitted) == list(df.columns)
+        for column in df.columns:
+            expected = pipeline.fit(df[column], is_target=column == "counts")
+            assert repr(fitted[column].sequence) == repr(expected.sequence)
+            assert fitted[column].context.meta == expected.context.meta
+
+    @pytest.mark.edge_case
+    def test_string_blocks_are_sized_by_their_strings(self, make_pipeline, monkeypatch):
+        words = np.array(["x" * 200, "y" * 200, "z" * 200], dtype=object)
+        df = pd.DataFrame(
+            {"a": np.resize(words, 20_000), "b": np.resize(words, 20_000)}
+        )
+        monkeypatch.setattr(memory, "current_rss", lambda: 0)
+        governor = MemoryGovernor(HardwareConfig(max_memory_mb=10), headroom=1.0)
+        profile_frame = ColumnProfiler.profile_frame
+        blocks = []
+
+        def spy(self, frame, *args, **kwargs):
+            blocks.append(list(frame.columns))
+            return profile_frame(self, frame, *args, **kwargs)
+
+        monkeypatch.setattr(ColumnProfiler, "profile_frame", spy)
+
+        # ~1 MB as float64 cells, but over 10 MB of strings
+        fitted = make_pipeline({}, governor=governor).fit_frame(df)
+
+        assert blocks == []
+        assert list(fitted) == ["a", "b"]
+
+
+class TestInverseTransform:
+    @pytest.mark.positive
+    def test_pipeline_inverts_arrays_through_the_chain(self, make_pipeline):
+        pipeline = make_pipeline(numeric_registries())
+        data = pd.Series(np.random.default_rng(2).uniform(10, 20, 5_000), name="y")
+        artifact = pipeline.fit(data, is_target=True)
+        predictions = pipeline.transform(data, artifact).to_numpy()
+
+        restored = pipeline.inverse_transform(predictions, artifact)
+
+        assert len(artifact.sequence) > 0
+        assert isinstance(restored, np.ndarray)
+        np.testing.assert_allclose(restored, data, rtol=1e-9)
+
+
+class TestFitFolds:
+    @pytest.mark.positive
+    def test_matches_independent_fit_per_fold(self, make_pipeline):
+        df, y = make_frame()
+        pipeline = make_pipeline(numeric_registries())
+        spec = CVSplitter(TrainingConfig(folds=3), stratify=False).build_spec(df, y)
+
+        fitted = pipeline.fit_folds(df, spec)
+
+        assert len(fitted) == 3
+        for fold, artifacts in zip(spec.folds, fitted, strict=True):
+            for column in df.columns:
+                expected = pipeline.fit(df[column].iloc[fold.train], is_target=False)
+                artifact = artifacts[column]
+                assert repr(artifact.sequence) == repr(expected.sequence)
+                assert_stats_close(artifact.context.stats, expected.context.stats)
+
+    @pytest.mark.positive
+    def test_non_complement_folds_fall_back_to_direct_compute(self, make_pipeline):
+        df, y = make_frame(500)
+        pipeline = make_pipeline(numeric_registries())
+        spec = TimeSeriesSplitter(n_splits=2, purge=10).build_spec(df, y)
+
+        fitted = pipeline.fit_folds(df, spec)
+
+        fold = spec.folds[0]
+        expected = pipeline.fit(df["normal"].iloc[fold.train], is_target=False)
+        assert_stats_close(fitted[0]["normal"].context.stats, expected.context.stats)
+
+    @pytest.mark.negative
+    def test_length_mismatch_raises(self, make_pipeline):
+        df, y = make_frame(100)
+        spec = CVSplitter(TrainingConfig(folds=2), stratify=False).build_spec(df, y)
+        with pytest.raises(ValueError, match="spec was built for 100"):
+            make_pipeline(numeric_registries()).fit_folds(df.iloc[:50], spec)
+
+
+class TestPipelineInstrumentation:
+    @pytest.mark.positive
+    def test_pipeline_fit_reports_every_stage(self, make_pipeline):
+        df, _ = make_frame(500)
+        summary = SummaryCollector()
+        pipeline = make_pipeline(
+            numeric_registries(), instrumentation=Instrumentation([summary])
+        )
+
+        artifact = pipeline.fit(df["skewed"], is_target=False)
+        pipeline.transform(df["skewed"], artifact)
+
+        table = summary.table()
+        assert {"infer", "compute", "build_meta", "resolve", "apply"} <= set(
+            table["stage"]
+        )
+        infer = table.set_index("stage").loc["infer"]
+        assert infer["calls"] == 1
+        assert infer["rows"] == 500
+        assert (table["wall_ns"] >= table["wall_ns"].shift(-1).fillna(0)).all()
@@ -0,0 +1,161 @@
+import gc
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core.analyzers import (
+    AnalyzerBuilder,
+    AnalyzerConfig,
+    DomainConfig,
+    NumericalRuleContext,
+    build_numerical_semantic_policy,
+)
+from pills_core.rules import (
+    DomainPolicy,
+    DomainRule,
+    DomainTags,
+    MatchPolicy,
+    MatchRule,
+)
+from pills_core.stats_computer import NumericalStatsComputer
+from pills_core.types.stats import CategoricalThresholds, NumericalThresholds
+
+
+def make_table():
+    rng = np.random.default_rng(11)
+    n = 1_000
+    frame = pd.DataFrame(
+        {
+            "binary": rng.integers(0, 2, n),
+            "id": np.arange(n),
+            "count": rng.poisson(0.8, n),
+            "sparse": np.where(rng.random(n) < 0.98, 0, 1),
+            "ordinal": rng.integers(1, 6, n),
+            "continuous": rng.normal(size=n),
+        }
+    )
+    return NumericalStatsComputer().compute_table(frame)
+
+
+def make_analyzer():
+    registry = AnalyzerBuilder(
+        AnalyzerConfig(
+            numerical=NumericalThresholds(),
+            categorical=CategoricalThresholds(),
+            domain=DomainConfig(),
+        )
+    ).build_registry()
+    return registry._analyzers["numeric"]
+
+
+class TestResolveMany:
+    @pytest.mark.positive
+    def test_matches_resolve_per_context(self):
+        table = make_table()
+        policy = build_numerical_semantic_policy(NumericalThresholds())
+        contexts = [NumericalRuleContext(stats=row.to_stats()) for row in table]
+
+        decisions = policy.resolve_many(contexts, table)
+
+        assert decisions == [policy.resolve(context) for context in contexts]
+        assert len({decision.value for decision in decisions}) > 3
+
+    @pytest.mark.positive
+    def test_rules_without_columnar_form_fall_back_to_predicate(self):
+        policy = MatchPolicy(
+            rules=(
+                MatchRule("big", "big", lambda x: x > 10, lambda x: (f"{x}",)),
+                MatchRule(
+                    "odd",
+                    "odd",
+                    lambda x: x % 2 == 1,
+                    lambda _: (),
+                    columnar=lambda c: c.values % 2 == 1,
+                ),
+            ),
+            fallback_value="other",
+            fallback_reasons=(),
+        )
+        contexts = [3, 12, 4]
+
+        decisions = policy.resolve_many(
+            contexts, SimpleNamespace(values=np.array(contexts))
+        )
+
+        assert [d.value for d in decisions] == ["odd", "big", "other"]
+        assert decisions[1].reasons == ("12",)
+
+
+class TestDecisionMemo:
+    @pytest.mark.positive
+    def test_primed_decisions_are_reused(self):
+        analyzer = make_analyzer()
+        table = make_table()
+
+        analyzer.prime_decisions(table)
+
+        first = analyzer.resolve_semantic_role(table["id"])
+        assert analyzer.resolve_semantic_role(table["id"]) is first
+        assert first.value.name == "ID_LIKE"
+        assert len(analyzer._semantic_decisions) == len(table)
+
+    @pytest.mark.edge_case
+    def test_entry_dropped_with_its_stats(self):
+        analyzer = make_analyzer()
+        stats = make_table()[0].to_stats()
+        analyzer.resolve_semantic_role(stats)
+
+        del stats
+        gc.collect()
+
+        assert len(analyzer._semantic_decisions) == 0
+
+
+def naive_resolve(policy: DomainPolicy, column_name: str) -> DomainTags:
+    tags = DomainTags()
+    for rule in policy.rules:
+        if rule.matches(column_name):
+            tags = tags.merge(rule.tags)
+    return tags
+
+
+class TestDomainPolicy:
+    @pytest.mark.positive
+    def test_matches_naive_substring_scan(self):
+        rng = np.random.default_rng(5)
+        alphabet = list("abcrt_")
+        rules = tuple(
+            DomainRule(
+                name=f"rule{i}",
+                keywords=tuple(
+                    "".join(rng.choice(alphabet, rng.integers(1, 5)))
+                    for _ in range(rng.integers(1, 6))
+                ),
+                tags=DomainTags.from_tag_name(tag),
+            )
+            for i, tag in enumerate(
+                ["is_ratio", "is_monetary", "is_rate", "is_score", "is_count"] * 4
+            )
+        )
+        policy = DomainPolicy(rules=rules)
+        names = ["".join(rng.choice(alphabet, rng.integers(0, 12))) for _ in range(500)]
+
+        for name in names:
+            assert policy.resolve(name.upper()) == naive_resolve(policy, name.upper())
+
+    @pytest.mark.edge_case
+    def test_overlapping_keywords_all_tag(self):
+        policy = DomainPolicy(
+            rules=(
+                DomainRule("money", ("discount",), DomainTags(is_monetary=True)),
+                DomainRule("count", ("count",), DomainTags(is_count=True)),
+            )
+        )
+
+        assert policy.resolve("Discount_Total") == DomainTags(
+            is_monetary=True, is_count=True
+        )
+        assert policy.resolve("Discount_Total") is policy.resolve("Discount_Total")
+        assert policy.resolve("price") == DomainTags()
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._categorical import materialize
+from pills_core._enums import TransformPhase
+from pills_core.pipeline.export import export_sequence, save_artifacts
+from pills_core.pipeline.pipeline import FittedColumnArtifact
+from pills_core.pipeline.sequence import TransformSequence
+from pills_core.pipeline.step import Step
+from pills_core.runtime import RuntimeModel, RuntimeSequence
+from pills_core.stats_computer import CategoricalStatsComputer, NumericalStatsComputer
+from pills_core.strategies.base import SingleStrategy
+from pills_core.strategies.categorical.base import CategoricalEmbedding
+from pills_core.strategies.categorical.imputation import (
+    BackwardFillStrategy,
+    ForwardFillStrategy,
+    MissingStrategy,
+)
+from pills_core.strategies.config import NumericStrategiesConfig
+from pills_core.strategies.numeric._registry import (
+    build_imputation_registry,
+    build_outliers_registry,
+    build_scaling_registry,
+)
+
+
+def numeric_strategies():
+    config = NumericStrategiesConfig()
+    registries = {
+        TransformPhase.IMPUTATION: build_imputation_registry(config.imputation),
+        TransformPhase.OUTLIER: build_outliers_registry(config.outlier),
+        TransformPhase.SCALING: build_scaling_registry(config.scaling),
+    }
+    return [
+        (phase, strategy)
+        for phase, registry in registries.items()
+        for strategy in registry.strategies
+    ]
+
+
+def categorical_strategy(cls):
+    embedding = CategoricalEmbedding(0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5)
+    return cls(embedding=embedding, radius=1.0)
+
+
+@pytest.fixture
+def numeric() -> pd.Series:
+    rng = np.random.default_rng(3)
+    values = rng.lognormal(size=500)
+    values[::7] = np.nan
+    return pd.Series(values, name="amount")
+
+
+@pytest.fixture
+def categorical() -> pd.Series:
+    return pd.Series([None, "a", None, "b", "b", None], name="city", dtype=object)
+
+
+class TestRuntimeParity:
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        ("phase", "strategy"),
+        numeric_strategies(),
+        ids=lambda value: getattr(value, "name", ""),
+    )
+    def test_numeric_strategy_matches_pandas_apply(self, numeric, phase, strategy):
+        stats = NumericalStatsComputer().compute(numeric)
+        params = strategy.fit(numeric, stats)
+        sequence = TransformSequence((Step(phase, strategy, stats, params),))
+
+        runtime = RuntimeSequence.from_dict(export_sequence(sequence))
+
+        np.testing.assert_allclose(
+            runtime.apply(numeric.to_numpy()), sequence.apply(numeric).to_numpy()
+        )
+
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        "cls", [MissingStrategy, ForwardFillStrategy, BackwardFillStrategy]
+    )
+    def test_categorical_strategy_matches_pandas_apply(self, categorical, cls):
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(categorical)
+        step = Step(TransformPhase.IMPUTATION, categorical_strategy(cls), stats)
+        sequence = TransformSequence((step,))
+
+        result = RuntimeSequence.from_dict(export_sequence(sequence)).apply(categorical)
+
+        assert isinstance(result, pd.Series)
+        assert result.index.equals(categorical.index)
+        expected = materialize(sequence.apply(categorical))
+        assert result.fillna("<na>").tolist() == expected.fillna("<na>").tolist()
+
+
+class TestRuntimeModel:
+    @pytest.mark.positive
+    def test_saved_artifacts_transform_frames_and_mappings(self, tmp_path, numeric):
+        stats = NumericalStatsComputer().compute(numeric)
+        phase, strategy = numeric_strategies()[0]
+        sequence = TransformSequence((Step(phase, strategy, stats),))
+        artifact = FittedColumnArtifact(context=None, sequence=sequence, traces=())
+        path = str(tmp_path / "model.json")
+
+        save_artifacts({"amount": artifact}, path)
+        model = RuntimeModel.load(path)
+        frame = pd.DataFrame({"amount": numeric, "other": 1})
+
+        transformed = model.transform(frame)
+        mapping = model.transform({"amount": numeric.to_numpy()})
+
+        assert list(transformed.columns) == ["amount", "other"]
+        np.testing.assert_allclose(transformed["amount"], sequence.apply(numeric))
+        np.testing.assert_allclose(mapping["amount"], transformed["amount"])
+
+    @pytest.mark.positive
+    def test_winsorize_exports_training_bounds(self, numeric):
+        stats = NumericalStatsComputer().compute(numeric)
+        registry = build_outliers_registry(NumericStrategiesConfig().outlier)
+        (winsorize,) = [s for s in registry.strategies if s.name == "winsorize"]
+        step = Step(
+            TransformPhase.OUTLIER, winsorize, stats, winsorize.fit(numeric, stats)
+        )
+
+        runtime = RuntimeSequence.from_dict(export_sequence(TransformSequence((step,))))
+
+        lower, upper = numeric.quantile([0.05, 0.95])
+        batch = pd.Series([-1e9, 1e9])
+        np.testing.assert_allclose(step.apply(batch), [lower, upper])
+        np.testing.assert_allclose(runtime.apply(batch), [lower, upper])
+
+    @pytest.mark.negative
+    def test_strategy_without_runtime_op_refuses_export(self, categorical):
+        stats = CategoricalStatsComputer(rare_thresholds=0.01).compute(categorical)
+
+        class UnexportedMissing(MissingStrategy):
+            runtime_op = SingleStrategy.runtime_op
+
+        strategy = categorical_strategy(UnexportedMissing)
+        step = Step(TransformPhase.IMPUTATION, strategy, stats)
+
+        with pytest.raises(NotImplementedError, match="missing"):
+            export_sequence(TransformSequence((step,)))
+
+    @pytest.mark.negative
+    def test_rejects_unknown_format_version(self):
+        with pytest.raises(ValueError, match="format_version"):
+            RuntimeModel.from_dict({"format_version": 99, "columns": {}})
+
+    @pytest.mark.edge_case
+    def test_single_row_and_leading_gap(self):
+        runtime = RuntimeSequence.from_dict([{"op": "ffill"}])
+
+        assert np.isnan(runtime.apply(np.array([np.nan]))).all()
+        np.testing.assert_array_equal(
+            runtime.apply(np.array([np.nan, 1.0, np.nan])), [np.nan, 1.0, 1.0]
+        )
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats as sstats
+
+from pills_core._enums import TransformPhase
+from pills_core.pipeline.builder import PipelineBuilder
+from pills_core.pipeline.sequence import TransformSequence
+from pills_core.pipeline.step import Step
+from pills_core.stats_computer import NumericalStatsComputer
+from pills_core.strategies.config import (
+    BoxCoxConfig,
+    NumericStrategiesConfig,
+    YeoJohnsonConfig,
+)
+from pills_core.strategies.numeric._registry import (
+    build_outliers_registry,
+    build_scaling_registry,
+)
+from pills_core.strategies.numeric.scaling import BoxCoxStrategy, YeoJohnsonStrategy
+
+
+def make_box_cox(**overrides) -> BoxCoxStrategy:
+    config = BoxCoxConfig(**overrides)
+    return BoxCoxStrategy(
+        embedding=config.embedding.as_embedding(),
+        **config.model_dump(exclude={"enabled", "embedding"}),
+    )
+
+
+def make_yeo_johnson(**overrides) -> YeoJohnsonStrategy:
+    config = YeoJohnsonConfig(**overrides)
+    return YeoJohnsonStrategy(
+        embedding=config.embedding.as_embedding(),
+        **config.model_dump(exclude={"enabled", "embedding"}),
+    )
+
+
+@pytest.fixture
+def skewed() -> pd.Series:
+    rng = np.random.default_rng(4)
+    values = rng.lognormal(size=5_000) - 0.5  # some values <= 0 need the shift
+    values[::50] = np.nan
+    return pd.Series(values, name="amount")
+
+
+class TestBoxCox:
+    @pytest.mark.positive
+    def test_fitted_transform_matches_scipy(self, skewed):
+        strategy = make_box_cox()
+        stats = NumericalStatsComputer().compute(skewed)
+
+        params = strategy.fit(skewed, stats)
+        result = strategy.apply_fitted(skewed, stats, params)
+
+        shifted = skewed.dropna().to_numpy() + params["shift"]
+        assert params["shift"] > 0
+        assert params["lambda"] == pytest.approx(
+            sstats.boxcox_normmax(shifted, method="mle")
+        )
+        np.testing.assert_allclose(
+            result.dropna(), sstats.boxcox(shifted, params["lambda"])
+        )
+        assert result.isna().equals(skewed.isna())
+
+    @pytest.mark.positive
+    def test_scoring_reuses_training_parameters(self, skewed):
+        builder = PipelineBuilder({})
+        strategy = make_box_cox()
+        stats = NumericalStatsComputer().compute(skewed)
+
+        sequence = builder._fit_steps(
+            skewed,
+            [(TransformPhase.SCALING, strategy)],
+            NumericalStatsComputer(),
+            stats,
+        )
+        batch = skewed.iloc[:3]
+
+        (step,) = sequence.steps
+        assert set(step.params) == {"lambda", "shift"}
+        np.testing.assert_allclose(
+            sequence.apply(batch), sequence.apply(skewed).iloc[:3]
+        )
+
+    @pytest.mark.edge_case
+    def test_lambda_estimated_on_bounded_sample(self):
+        rng = np.random.default_rng(8)
+        series = pd.Series(rng.lognormal(size=200_000))
+        stats = NumericalStatsComputer().compute(series)
+
+        sampled = make_box_cox(sample_size=20_000).fit(series, stats)
+        full = make_box_cox(sample_size=200_000).fit(series, stats)
+
+        assert sampled["lambda"] == pytest.approx(full["lambda"], abs=0.02)
+
+
+class TestYeoJohnson:
+    @pytest.mark.positive
+    def test_handles_negative_values_like_scipy(self, skewed):
+        strategy = make_yeo_johnson()
+        data = skewed - 3.0
+        stats = NumericalStatsComputer().compute(data)
+
+        params = strategy.fit(data, stats)
+        result = strategy.apply_fitted(data, stats, params)
+
+        assert (data < 0).any()
+        np.testing.assert_allclose(
+            result.dropna(), sstats.yeojohnson(data.dropna(), params["lambda"])
+        )
+
+    @pytest.mark.edge_case
+    def test_constant_column_is_left_unchanged(self):
+        strategy = make_yeo_johnson()
+        data = pd.Series([2.0, 2.0, np.nan])
+        stats = NumericalStatsComputer().compute(data)
+
+        result = strategy.apply(data, stats)
+
+        np.testing.assert_allclose(result, [2.0, 2.0, np.nan])
+
+
+def scaling_strategies():
+    return build_scaling_registry(NumericStrategiesConfig().scaling).strategies
+
+
+class TestInverseApply:
+    @pytest.mark.positive
+    @pytest.mark.parametrize(
+        "strategy", scaling_strategies(), ids=lambda strategy: strategy.name
+    )
+    def test_round_trips_each_scaling_strategy(self, strategy):
+        rng = np.random.default_rng(6)
+        data = pd.Series(rng.lognormal(size=2_000), name="price")
+        stats = NumericalStatsComputer().compute(data)
+        step = Step(TransformPhase.SCALING, strategy, stats, strategy.fit(data, stats))
+        sequence = TransformSequence((step,))
+
+        restored = sequence.inverse_apply(sequence.apply(data))
+
+        assert isinstance(restored, pd.Series)
+        assert restored.name == "price"
+        np.testing.assert_allclose(restored, data, rtol=1e-9)
+
+    @pytest.mark.negative
+    def test_refuses_chains_with_clipping(self, skewed):
+        registry = build_outliers_registry(NumericStrategiesConfig().outlier)
+        (iqr,) = [s for s in registry.strategies if s.name == "iqr"]
+        stats = NumericalStatsComputer().compute(skewed)
+        sequence = TransformSequence(
+            (
+                Step(TransformPhase.OUTLIER, iqr, stats),
+                Step(TransformPhase.SCALING, scaling_strategies()[0], stats),
+            )
+        )
+
+        with pytest.raises(ValueError, match=r"\['iqr'\] not invertible"):
+            sequence.inverse_apply(np.zeros(3))
@@ -0,0 +1,253 @@
+import numpy as np
+import optuna
+import pandas as pd
+import pytest
+
+from pills_core._enums import TransformPhase
+from pills_core.config import HardwareConfig, TrainingConfig
+from pills_core.search import StrategySearch
+from pills_core.shared_frame import SharedFrame
+from pills_core.splitting.cv import CVSplitter
+from pills_core.strategies.categorical._registry import build_encoding_registry
+from pills_core.strategies.config import (
+    CategoricalStrategiesConfig,
+    NumericStrategiesConfig,
+)
+from pills_core.strategies.numeric._registry import (
+    build_imputation_registry,
+    build_outliers_registry,
+    build_scaling_registry,
+)
+
+
+@pytest.fixture
+def make_search(pipeline_parts):
+    def make(
+        config: TrainingConfig,
+        hardware: HardwareConfig | None = None,
+        encoding: bool = False,
+    ) -> StrategySearch:
+        strategies = NumericStrategiesConfig()
+        registries = {
+            TransformPhase.IMPUTATION: build_imputation_registry(strategies.imputation),
+            TransformPhase.OUTLIER: build_outliers_registry(strategies.outlier),
+            TransformPhase.SCALING: build_scaling_registry(strategies.scaling),
+        }
+        if encoding:
+            registries[TransformPhase.ENCODING] = build_encoding_registry(
+                CategoricalStrategiesConfig().encoding
+            )
+        return StrategySearch(
+            phase_registries=registries,
+            config=config,
+            hardware=hardware,
+            **pipeline_parts(),
+        )
+
+    return make
+
+
+def make_data(n: int = 600) -> tuple[pd.DataFrame, pd.Series]:
+    rng = np.random.default_rng(3)
+    skewed = rng.lognormal(size=n)
+    df = pd.DataFrame(
+        {
+            "skewed": np.where(rng.random(n) < 0.1, np.nan, skewed),
+            "normal": rng.normal(size=n),
+        }
+    )
+    return df, pd.Series(np.log1p(skewed))
+
+
+def correlation_scorer(y: pd.Series):
+    def score(train: pd.DataFrame, val: pd.DataFrame, fold) -> float:
+        target = y.iloc[fold.val].set_axis(val.index)
+        return float(abs(val["skewed"].corr(target)))
+
+    return score
+
+
+class TestStrategySearch:
+    @pytest.mark.positive
+    def test_search_space_only_contains_valid_strategies(self, make_search):
+        df, _ = make_data()
+        candidates = make_search(TrainingConfig()).build_candidates(df)
+
+        space = candidates["skewed"].space
+        assert TransformPhase.IMPUTATION in space
+        assert "log_transform" in space[TransformPhase.SCALING]
+        assert TransformPhase.IMPUTATION not in candidates["normal"].space
+
+    @pytest.mark.positive
+    def test_run_returns_best_params_and_reuses_prefixes(self, make_search):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        df, y = make_data()
+        search = make_search(TrainingConfig(folds=3, timeout=60))
+        spec = CVSplitter(TrainingConfig(folds=3), stratify=False).build_spec(df, y)
+
+        result = search.run(df, spec, correlation_scorer(y), n_trials=12)
+
+        assert set(result.best_params) == {"skewed", "normal"}
+        assert result.best_score > 0.5
+        assert search.cache.hits > 0
+        assert len(search.cache) == search.cache.misses
+
+    @pytest.mark.negative
+    def test_length_mismatch_raises(self, make_search):
+        df, y = make_data(100)
+        spec = CVSplitter(TrainingConfig(folds=2), stratify=False).build_spec(df, y)
+        with pytest.raises(ValueError, match="spec was built"):
+            make_search(TrainingConfig()).run(df.iloc[:10], spec, lambda *_: 0.0)
+
+    @pytest.mark.positive
+    def test_threaded_trials_share_the_step_cache(self, make_search):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        df, y = make_data()
+        search = make_search(TrainingConfig(folds=3, timeout=60))
+        spec = CVSplitter(TrainingConfig(folds=3), stratify=False).build_spec(df, y)
+
+        result = search.run(df, spec, correlation_scorer(y), n_trials=12, n_jobs=4)
+
+        assert len(result.study.trials) == 12
+        assert len(search.cache) <= search.cache.misses
+
+    @pytest.mark.edge_case
+    def test_each_run_fits_its_own_steps(self, make_search):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        df, y = make_data()
+        search = make_search(TrainingConfig(folds=3, timeout=60))
+        spec = CVSplitter(TrainingConfig(folds=3), stratify=False).build_spec(df, y)
+        search.run(df, spec, correlation_scorer(y), n_trials=4)
+
+        search.run(df * 1000, spec, correlation_scorer(y), n_trials=4)
+
+        first_steps = [
+            step
+            for (column, _, prefix), step in search.cache._steps.items()
+            if column == "normal" and len(prefix) == 1
+        ]
+        assert first_steps
+        assert all(step.stats.std > 100 for step in first_steps)
+
+    @pytest.mark.edge_case
+    def test_non_string_column_labels(self, make_search):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        df, y = make_data()
+        df.columns = [0, 1]
+        search = make_search(TrainingConfig(folds=2, timeout=60))
+        spec = CVSplitter(TrainingConfig(folds=2), stratify=False).build_spec(df, y)
+
+        def score(train, val, fold) -> float:
+            target = y.iloc[fold.val].set_axis(val.index)
+            return float(abs(val[0].corr(target)))
+
+        result = search.run(df, spec, score, n_trials=3)
+
+        assert set(result.best_params) == {0, 1}
+
+    @pytest.mark.edge_case
+    def test_expanding_strategies_are_not_searched(self, make_search):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        df, y = make_data()
+        df["city"] = np.resize(
+            np.array(["oslo", "rome", "lima"], dtype=object), len(df)
+        )
+        search = make_search(TrainingConfig(folds=2, timeout=60), encoding=True)
+        spec = CVSplitter(TrainingConfig(folds=2), stratify=False).build_spec(df, y)
+        seen = []
+
+        def score(train, val, fold) -> float:
+            seen.append(val)
+            return correlation_scorer(y)(train, val, fold)
+
+        candidates = search.build_candidates(df)
+        search.run(df, spec, score, n_trials=2)
+
+        assert TransformPhase.ENCODING not in candidates["city"].space
+        assert all(
+            val["city"].tolist() == df["city"].iloc[val.index].tolist() for val in seen
+        )
+
+    @pytest.mark.positive
+    def test_worker_processes_share_a_journal_study(self, tmp_path, make_search):
+        df, y = make_data()
+        search = make_search(
+            TrainingConfig(folds=3, timeout=60), HardwareConfig(cpu_limit=2)
+        )
+        spec = CVSplitter(TrainingConfig(folds=3), stratify=False).build_spec(df, y)
+
+        result = search.run(
+            df,
+            spec,
+            correlation_scorer(y),
+            n_trials=8,
+            storage=str(tmp_path / "study.log"),
+        )
+
+        assert len(result.study.trials) == 8
+        assert result.best_score > 0.5
+        assert set(result.best_params) == {"skewed", "normal"}
+
+    @pytest.mark.edge_case
+    def test_worker_processes_see_labels_and_index(self, tmp_path, make_search):
+        df, y = make_data()
+        df.columns = [0, 1]
+        df.index = y.index = pd.Index(np.arange(len(df))[::-1] * 3 + 100)
+        search = make_search(
+            TrainingConfig(folds=2, timeout=60), HardwareConfig(cpu_limit=2)
+        )
+        spec = CVSplitter(TrainingConfig(folds=2), stratify=False).build_spec(df, y)
+
+        def score(train, val, fold) -> float:
+            if not val.index.equals(df.index[fold.val]):
+                raise AssertionError("worker frame lost its index")
+            return float(abs(val[0].corr(y.iloc[fold.val].set_axis(val.index))))
+
+        result = search.run(
+            df, spec, score, n_trials=4, storage=str(tmp_path / "study.log")
+        )
+
+        assert len(result.study.trials) == 4
+        assert set(result.best_params) == {0, 1}
+
+
+class TestSharedFrame:
+    @pytest.mark.positive
+    def test_attached_frame_round_trips_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "x": np.arange(4, dtype=np.float64),
+                "label": ["a", None, "b", "a"],
+                "count": pd.array([1, None, 3, 4], dtype="Int64"),
+            }
+        )
+        with SharedFrame(df) as shared:
+            attached = shared.handle.attach()
+            pd.testing.assert_frame_equal(attached.frame, df)
+            attached.close()
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize(
+        "index",
+        [
+            pd.Index([10, 20, 30], name="id"),
+            pd.DatetimeIndex(["2024-01-03", "2024-01-01", "2024-01-02"], tz="UTC"),
+            pd.MultiIndex.from_tuples([("a", 1), ("a", 2), ("b", 1)]),
+        ],
+    )
+    def test_attached_frame_keeps_labels_and_index(self, index):
+        df = pd.DataFrame({0: [1.0, 2.0, 3.0], "1": ["x", "y", "x"]}, index=index)
+        with SharedFrame(df) as shared:
+            attached = shared.handle.attach()
+            pd.testing.assert_frame_equal(attached.frame, df)
+            attached.close()
+
+    @pytest.mark.edge_case
+    def test_numeric_columns_are_views_of_shared_blocks(self):
+        df = pd.DataFrame({"x": np.zeros(3)})
+        with SharedFrame(df) as shared:
+            attached = shared.handle.attach()
+            block = shared._blocks[0]
+            np.ndarray((3,), dtype=np.float64, buffer=block.buf)[0] = 7.0
+            assert attached.frame["x"].iloc[0] == 7.0
+            attached.close()
@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._enums import ValidationStrategy
+from pills_core.config import TrainingConfig
+from pills_core.splitting.cv import CVSplitter
+from pills_core.splitting.group import GroupCVSplitter
+from pills_core.splitting.holdout import HoldoutSplitter
+from pills_core.splitting.spec import RangeFoldIndices, SplitRequest
+from pills_core.splitting.time_series import TimeSeriesSplitter
+
+
+def make_frame(n: int = 100) -> tuple[pd.DataFrame, pd.Series]:
+    df = pd.DataFrame({"x": np.arange(n, dtype=np.float64)})
+    y = pd.Series(np.arange(n) % 2, name="y")
+    return df, y
+
+
+class TestTimeSeriesSplitter:
+    @pytest.mark.positive
+    def test_expanding_folds_never_train_on_future(self):
+        df, y = make_frame(100)
+        spec = TimeSeriesSplitter(n_splits=4).build_spec(df, y)
+
+        assert spec.strategy is ValidationStrategy.TIME_SERIES
+        assert spec.n_folds == 4
+        for fold in spec.folds:
+            assert isinstance(fold, RangeFoldIndices)
+            assert fold.train_start == 0
+            assert fold.train.max() < fold.val.min()
+        assert spec.diagnostics.val_coverage_ratio == pytest.approx(0.8)
+        assert not spec.diagnostics.has_validation_overlap
+
+    @pytest.mark.positive
+    def test_sliding_window_keeps_train_size_fixed(self):
+        df, y = make_frame(100)
+        spec = TimeSeriesSplitter(n_splits=4, window="sliding").build_spec(df, y)
+
+        assert {fold.train_size for fold in spec.folds} == {20}
+
+    @pytest.mark.positive
+    def test_purge_and_embargo_open_gap(self):
+        df, y = make_frame(100)
+        spec = TimeSeriesSplitter(n_splits=4, purge=3, embargo=2).build_spec(df, y)
+
+        for fold in spec.folds:
+            assert fold.val_start - fold.train_stop == 5
+            assert fold.val_size == 18
+
+    @pytest.mark.positive
+    def test_time_column_orders_rows(self):
+        df, y = make_frame(50)
+        rng = np.random.default_rng(0)
+        df["ts"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+            rng.permutation(50), unit="D"
+        )
+        spec = TimeSeriesSplitter(n_splits=3, time_column="ts").build_spec(df, y)
+
+        for fold in spec.folds:
+            assert df["ts"].iloc[fold.train].max() < df["ts"].iloc[fold.val].min()
+
+    @pytest.mark.edge_case
+    def test_tied_timestamps_stay_on_one_side(self):
+        df, y = make_frame(100)
+        df["ts"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+            np.arange(100) // 7, unit="D"
+        )
+        spec = TimeSeriesSplitter(n_splits=4, time_column="ts").build_spec(df, y)
+
+        for fold in spec.folds:
+            assert df["ts"].iloc[fold.train].max() < df["ts"].iloc[fold.val].min()
+        assert [fold.val_start for fold in spec.folds] == [21, 42, 63, 84]
+        assert spec.folds[-1].val_stop == 100
+
+    @pytest.mark.negative
+    def test_ties_emptying_a_window_raise(self):
+        df, y = make_frame(20)
+        df["ts"] = np.repeat([0, 1], 10)
+        with pytest.raises(ValueError, match="Cannot build"):
+            TimeSeriesSplitter(n_splits=3, time_column="ts").build_spec(df, y)
+
+    @pytest.mark.negative
+    def test_too_many_splits_raises(self):
+        df, y = make_frame(10)
+        with pytest.raises(ValueError, match="Cannot build"):
+            TimeSeriesSplitter(n_splits=5, purge=5).build_spec(df, y)
+
+    @pytest.mark.negative
+    def test_missing_timestamps_raise(self):
+        df, y = make_frame(20)
+        df["ts"] = pd.date_range("2024-01-01", periods=20, freq="D")
+        df.loc[3, "ts"] = pd.NaT
+        with pytest.raises(ValueError, match="missing values"):
+            TimeSeriesSplitter(n_splits=2, time_column="ts").build_spec(df, y)
+
+
+class TestGroupCVSplitter:
+    @pytest.mark.positive
+    def test_groups_never_span_train_and_val(self):
+        df, y = make_frame(200)
+        df["customer"] = np.arange(200) // 4
+        spec = GroupCVSplitter(TrainingConfig(folds=5), "customer").build_spec(df, y)
+
+        assert spec.strategy is ValidationStrategy.GROUP_CV
+        assert spec.diagnostics.is_exhaustive_validation
+        for fold in spec.folds:
+            train_groups = set(df["customer"].iloc[fold.train])
+            val_groups = set(df["customer"].iloc[fold.val])
+            assert train_groups.isdisjoint(val_groups)
+
+    @pytest.mark.positive
+    def test_folds_are_balanced_with_skewed_group_sizes(self):
+        rng = np.random.default_rng(1)
+        sizes = rng.zipf(2.0, size=5_000).clip(max=50)
+        df = pd.DataFrame({"customer": np.repeat(np.arange(sizes.size), sizes)})
+        y = pd.Series(rng.integers(0, 2, size=len(df)))
+        splitter = GroupCVSplitter(TrainingConfig(folds=5), "customer", stratify=False)
+        spec = splitter.build_spec(df, y)
+
+        val_sizes = np.array(spec.diagnostics.val_sizes)
+        assert val_sizes.max() - val_sizes.min() <= 50
+
+    @pytest.mark.positive
+    def test_stratify_keeps_class_ratio(self):
+        df, _ = make_frame(1_000)
+        df["customer"] = np.arange(1_000) // 2
+        y = pd.Series((df["customer"] % 5 == 0).astype(int))
+        spec = GroupCVSplitter(TrainingConfig(folds=4), "customer").build_spec(df, y)
+
+        for fold in spec.folds:
+            assert y.iloc[fold.val].mean() == pytest.approx(0.2, abs=0.02)
+
+    @pytest.mark.positive
+    def test_stratify_balances_each_class_not_total_rows(self):
+        sizes = [100, 100, 100, 60] + [5] * 8
+        df = pd.DataFrame({"customer": np.repeat(np.arange(len(sizes)), sizes)})
+        y = pd.Series((df["customer"] >= 4).astype(int))
+        spec = GroupCVSplitter(TrainingConfig(folds=4), "customer").build_spec(df, y)
+
+        assert [int(y.iloc[fold.val].sum()) for fold in spec.folds] == [10] * 4
+
+    @pytest.mark.positive
+    def test_stratify_balances_classes_of_mixed_groups(self):
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame({"customer": rng.integers(0, 4_000, 40_000)})
+        y = pd.Series(rng.integers(0, 8, len(df)))
+        spec = GroupCVSplitter(TrainingConfig(folds=4), "customer").build_spec(df, y)
+
+        per_fold = np.array(
+            [np.bincount(y.iloc[fold.val], minlength=8) for fold in spec.folds]
+        )
+        spread = per_fold.max(axis=0) - per_fold.min(axis=0)
+        assert (spread <= 0.1 * per_fold.mean(axis=0)).all()
+
+    @pytest.mark.edge_case
+    def test_continuous_target_is_stratified_on_bins(self):
+        rng = np.random.default_rng(2)
+        df = pd.DataFrame({"customer": np.arange(20_000) // 4})
+        y = pd.Series(rng.lognormal(size=len(df)))
+        spec = GroupCVSplitter(TrainingConfig(folds=5), "customer").build_spec(df, y)
+
+        medians = [y.iloc[fold.val].median() for fold in spec.folds]
+        assert max(medians) - min(medians) < 0.05
+
+    @pytest.mark.negative
+    def test_too_many_label_classes_raise(self):
+        df = pd.DataFrame({"customer": np.arange(1_000) // 2})
+        y = pd.Series([f"label-{i}" for i in range(1_000)])
+        with pytest.raises(ValueError, match="Cannot stratify on 1000"):
+            GroupCVSplitter(TrainingConfig(folds=5), "customer").build_spec(df, y)
+
+    @pytest.mark.negative
+    def test_fewer_groups_than_folds_raises(self):
+        df, y = make_frame(10)
+        df["customer"] = np.arange(10) % 3
+        with pytest.raises(ValueError, match="Cannot split 3 groups"):
+            GroupCVSplitter(TrainingConfig(folds=5), "customer").build_spec(df, y)
+
+
+class TestSplitRequest:
+    @pytest.mark.positive
+    def test_builds_spec_without_frame(self):
+        y = np.tile([0, 1], 50)
+        spec = CVSplitter(TrainingConfig(folds=5)).build(
+            SplitRequest(n_samples=100, target=y)
+        )
+
+        assert spec.n_folds == 5
+        assert spec.diagnostics.is_exhaustive_validation
+
+    @pytest.mark.positive
+    def test_length_only_request_for_unstratified_splitters(self):
+        spec = HoldoutSplitter(stratify=False).build(SplitRequest(n_samples=50))
+        assert spec.folds[0].val_size == 10
+
+    @pytest.mark.negative
+    def test_column_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="exactly n_samples=10"):
+            SplitRequest(n_samples=10, groups=np.arange(9))
+
+    @pytest.mark.negative
+    def test_stratified_split_without_target_raises(self):
+        with pytest.raises(ValueError, match="requires a target"):
+            CVSplitter(TrainingConfig()).build(SplitRequest(n_samples=100))
+
+    @pytest.mark.negative
+    def test_frame_adapter_checks_index(self):
+        df, y = make_frame(10)
+        with pytest.raises(ValueError, match="same index"):
+            SplitRequest.from_frame(df, y.set_axis(np.arange(10, 20)))
@@ -0,0 +1,74 @@
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core.stats_computer import CategoricalStatsComputer, NumericalStatsComputer
+from pills_core.types.stats import CategoricalColumnStats, NumericalColumnStats
+from pills_core.types.stats_table import StatsTable
+
+
+@pytest.fixture
+def table() -> StatsTable[NumericalColumnStats]:
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame(
+        {
+            "normal": rng.normal(size=300),
+            "skewed": rng.lognormal(sigma=1.5, size=300),
+            "ints": rng.integers(0, 4, 300),
+        }
+    )
+    return NumericalStatsComputer().compute_table(frame)
+
+
+class TestStatsTable:
+    @pytest.mark.positive
+    def test_rows_read_like_the_dataclass(self, table):
+        row = table["skewed"]
+        stats = row.to_stats()
+
+        assert isinstance(stats, NumericalColumnStats)
+        for f in fields(NumericalColumnStats):
+            assert getattr(row, f.name) == getattr(stats, f.name)
+        assert table["skewed"] is row
+        assert isinstance(row.n_unique, int)
+
+    @pytest.mark.positive
+    def test_filter_and_sort(self, table):
+        skewed = table.filter(table.skewness > 2)
+        by_skew = table.sort("skewness", descending=True)
+
+        assert skewed.names == ["skewed"]
+        assert by_skew.names[0] == "skewed"
+        assert list(by_skew.skewness) == sorted(table.skewness, reverse=True)
+
+    @pytest.mark.positive
+    def test_pandas_round_trip_keeps_list_fields(self):
+        series = pd.Series(["a"] * 50 + ["b"] * 49 + ["c"], name="city")
+        table = CategoricalStatsComputer(rare_thresholds=0.05).compute_table(
+            series.to_frame()
+        )
+
+        restored = StatsTable.from_pandas(CategoricalColumnStats, table.to_pandas())
+
+        assert restored["city"].to_stats() == table["city"].to_stats()
+        assert restored["city"].rare_categories == ["c"]
+
+    @pytest.mark.positive
+    def test_parquet_round_trip(self, table, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = str(tmp_path / "stats.parquet")
+
+        table.to_parquet(path)
+        restored = StatsTable.read_parquet(NumericalColumnStats, path)
+
+        assert restored["ints"].to_stats() == table["ints"].to_stats()
+
+    @pytest.mark.negative
+    def test_rejects_arrays_not_matching_fields(self, table):
+        arrays = dict(table.arrays)
+        del arrays["skewness"]
+
+        with pytest.raises(ValueError, match="do not match"):
+            StatsTable(NumericalColumnStats, table.names, arrays)
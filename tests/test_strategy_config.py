@@ -22,6 +22,7 @@ from pills_core.strategies.config import (
     StrategyWeightsConfig,
     UpperBoundaryImputationConfig,
     WinsorizeStrategyConfig,
+    YeoJohnsonConfig,
     ZeroImputationConfig,
     ZScoreStrategyConfig,
 )
@@ -107,6 +108,7 @@ def test_build_scaling_registry_accepts_nested_config_from_pill_config():
                             min_skewness=3.5,
                             shift_epsilon=1e-4,
                         ),
+                        yeo_johnson=YeoJohnsonConfig(enabled=False),
                         sqrt_transform=SqrtTransformConfig(enabled=False),
                     )
                 )
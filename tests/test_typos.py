@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pills_core._typos import _within_distance, find_typos
+from pills_core.config import TrainingConfig
+from pills_core.pipeline.profiler import ColumnProfiler
+from pills_core.rules import DomainTags
+from pills_core.splitting.cv import CVSplitter
+from pills_core.stats_computer import CategoricalStatsComputer, FactorizedColumn
+
+
+def cities(n: int = 10_000) -> pd.Series:
+    rng = np.random.default_rng(4)
+    values = rng.choice(
+        np.array(["Amsterdam", "Barcelona", "Copenhagen", "Dusseldorf"], dtype=object),
+        n,
+    )
+    values[:40] = "Amsetrdam"  # transposed letters
+    values[40:70] = "barcelona"  # case only
+    values[70:90] = "Copenhagn"  # dropped letter
+    return pd.Series(values, name="city")
+
+
+@pytest.fixture
+def categorical_analyzer(analyzer_registry):
+    return analyzer_registry._analyzers["categorical"]
+
+
+class TestFindTypos:
+    @pytest.mark.positive
+    def test_maps_rare_variants_to_their_frequent_spelling(self):
+        counts = cities().value_counts()
+
+        typos = find_typos(counts.index.tolist(), counts.to_numpy())
+
+        assert typos == {
+            "Amsetrdam": "Amsterdam",
+            "barcelona": "Barcelona",
+            "Copenhagn": "Copenhagen",
+        }
+
+    @pytest.mark.negative
+    def test_codes_differing_in_digits_are_not_typos(self):
+        typos = find_typos(["A1000", "A1001", "B-200X"], [900, 3, 1])
+
+        assert typos == {}
+
+    @pytest.mark.negative
+    def test_similarly_frequent_labels_are_distinct_categories(self):
+        labels = ["Amsterdam", "Amsetrdam"]
+
+        assert find_typos(labels, [100, 40]) == {}
+        assert find_typos(labels, [100, 10]) == {"Amsetrdam": "Amsterdam"}
+
+    @pytest.mark.edge_case
+    @pytest.mark.parametrize(
+        ("a", "b", "bound", "expected"),
+        [
+            ("kitten", "sitting", 2, False),
+            ("kitten", "sitting", 3, True),
+            ("abcdef", "abdcef", 1, True),
+            ("abcdef", "badcfe", 2, False),
+            ("short", "shortest", 2, False),
+            ("", "ab", 2, True),
+        ],
+    )
+    def test_within_distance_counts_swaps_as_one_edit(self, a, b, bound, expected):
+        assert _within_distance(a, b, bound) is expected
+
+
+class TestTypoStats:
+    @pytest.mark.positive
+    def test_stats_and_profile_report_typos(self, categorical_analyzer):
+        computer = CategoricalStatsComputer(rare_thresholds=0.01)
+        stats = computer.profile_stats(cities(), computer.compute(cities()))
+        profile = categorical_analyzer.build_categorical_profile(stats, DomainTags())
+
+        assert stats.typo_ratio == pytest.approx(90 / 10_000)
+        assert profile.has_typos
+
+    @pytest.mark.edge_case
+    def test_detection_can_be_switched_off(self):
+        computer = CategoricalStatsComputer(rare_thresholds=0.01, detect_typos=False)
+        stats = computer.compute(cities())
+
+        assert computer.profile_stats(cities(), stats).typo_ratio == 0.0
+
+    @pytest.mark.edge_case
+    def test_only_profiling_detects_typos(self, categorical_analyzer):
+        computer = CategoricalStatsComputer(rare_thresholds=0.01)
+        series = cities()
+        counts = FactorizedColumn(series).count()
+
+        assert computer.compute(series).typo_ratio == 0.0
+        assert computer.compute_from_counts(series, counts).typo_ratio == 0.0
+        assert (
+            ColumnProfiler()
+            .profile(series, False, categorical_analyzer, computer)
+            .meta.profile.has_typos
+        )
+
+    @pytest.mark.edge_case
+    def test_profiling_a_frame_detects_typos(self, make_pipeline):
+        frame = pd.DataFrame({"origin": cities(), "destination": cities()[::-1].values})
+
+        fitted = make_pipeline({}).fit_frame(frame)
+
+        for artifact in fitted.values():
+            assert artifact.context.stats.typo_ratio == pytest.approx(90 / 10_000)
+            assert artifact.context.meta.profile.has_typos
+
+    @pytest.mark.edge_case
+    def test_folds_detect_typos_like_a_full_fit(self, make_pipeline):
+        frame = cities().to_frame()
+        spec = CVSplitter(TrainingConfig(folds=2), stratify=False).build_spec(
+            frame, pd.Series(np.zeros(len(frame)))
+        )
+        pipeline = make_pipeline({})
+
+        full = pipeline.fit(frame.city, is_target=False).context
+        folds = [fold["city"].context for fold in pipeline.fit_folds(frame, spec)]
+
+        assert full.meta.profile.has_typos
+        for context in folds:
+            assert context.meta.profile.has_typos
+            assert context.stats.typo_ratio == pytest.approx(
+                full.stats.typo_ratio, rel=0.3
+            )